@@ -0,0 +1,230 @@
+"""
+Train the local severity model (TF-IDF + logistic regression)
+Reads ai_model/data/bug_reports.csv and writes ai_model/models/severity_model.bin
+
+Pure Python on purpose: the artifact is served by backend/services/local_model.py
+and shares its tokenizer, so training needs no extra dependencies.
+
+Usage:
+    python ai_model/train.py [--data PATH] [--output PATH] [--epochs N]
+"""
+
+import os
+import sys
+import csv
+import json
+import math
+import random
+import argparse
+from datetime import datetime, timezone
+
+# Reuse the exact featurization the API serves with
+ai_model_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.join(os.path.dirname(ai_model_dir), "backend")
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from services.local_model import extract_terms, tfidf_vector, softmax, save_model
+
+CLASSES = ["Critical", "High", "Medium", "Low"]
+NGRAM_RANGE = (1, 2)
+MIN_DF = 2
+
+
+# Reports whose skeletons share at least this fraction of words are one template
+TEMPLATE_SIMILARITY = 0.5
+
+
+def load_dataset(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = [row for row in csv.DictReader(f) if row["severity"] in CLASSES]
+    labels = [CLASSES.index(row["severity"]) for row in rows]
+    groups = template_groups(rows, labels)
+    return [
+        (f"{row['title']} {row['description']}", label, group)
+        for row, label, group in zip(rows, labels, groups)
+    ]
+
+
+def skeleton(row):
+    """
+    Description words not in the title: the component a report is about is
+    named in both, so what is left is the wording of its template
+    """
+    title_words = set(extract_terms(row["title"], (1, 1)))
+    return {word for word in extract_terms(row["description"], (1, 1)) if word not in title_words}
+
+
+def template_groups(rows, labels):
+    """
+    Group ID per row: rows of the same severity whose skeletons have a Jaccard
+    similarity of at least TEMPLATE_SIMILARITY are joined (transitively), so
+    reports generated from one template, or near-duplicates, share a group
+    """
+    parent = list(range(len(rows)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    skeletons = [skeleton(row) for row in rows]
+    for i in range(len(rows)):
+        for j in range(i + 1, len(rows)):
+            if labels[i] != labels[j]:
+                continue
+            union = skeletons[i] | skeletons[j]
+            if union and len(skeletons[i] & skeletons[j]) / len(union) >= TEMPLATE_SIMILARITY:
+                parent[find(j)] = find(i)
+    return [find(i) for i in range(len(rows))]
+
+
+def group_split(samples, test_ratio=0.2, seed=42):
+    """
+    Stratified split by template group: every group goes wholly to train or
+    test, so the holdout measures templates the model has never seen rather
+    than reworded copies of training reports
+    """
+    rng = random.Random(seed)
+    train, test = [], []
+    for label in range(len(CLASSES)):
+        groups = {}
+        for sample in samples:
+            if sample[1] == label:
+                groups.setdefault(sample[2], []).append(sample)
+        groups = list(groups.values())
+        rng.shuffle(groups)
+        target = len([sample for group in groups for sample in group]) * test_ratio
+        held_out = 0
+        for group in groups:
+            if held_out < target:
+                test.extend(group)
+                held_out += len(group)
+            else:
+                train.extend(group)
+    rng.shuffle(train)
+    return train, test
+
+
+def fit_vectorizer(texts):
+    """Vocabulary (min_df filtered) and smoothed IDF, as in scikit-learn's TfidfVectorizer"""
+    document_frequency = {}
+    for text in texts:
+        for term in set(extract_terms(text, NGRAM_RANGE)):
+            document_frequency[term] = document_frequency.get(term, 0) + 1
+
+    vocabulary = sorted(term for term, df in document_frequency.items() if df >= MIN_DF)
+    n = len(texts)
+    idf = [math.log((1 + n) / (1 + document_frequency[term])) + 1.0 for term in vocabulary]
+    return vocabulary, idf
+
+
+def train_logistic_regression(vectors, labels, n_features, epochs, learning_rate=2.0, l2=1e-4):
+    """Full-batch gradient descent on the multinomial logistic loss with L2 regularization"""
+    n_classes = len(CLASSES)
+    coef = [[0.0] * n_classes for _ in range(n_features)]
+    intercept = [0.0] * n_classes
+    n = len(vectors)
+
+    for epoch in range(epochs):
+        grad_coef = {}
+        grad_intercept = [0.0] * n_classes
+        loss = 0.0
+
+        for vector, label in zip(vectors, labels):
+            logits = list(intercept)
+            for index, weight in vector.items():
+                for k in range(n_classes):
+                    logits[k] += coef[index][k] * weight
+            probabilities = softmax(logits)
+            loss -= math.log(max(probabilities[label], 1e-12))
+
+            for k in range(n_classes):
+                error = probabilities[k] - (1.0 if k == label else 0.0)
+                grad_intercept[k] += error
+                for index, weight in vector.items():
+                    grad_coef.setdefault(index, [0.0] * n_classes)[k] += error * weight
+
+        for k in range(n_classes):
+            intercept[k] -= learning_rate * grad_intercept[k] / n
+        for index in range(n_features):
+            gradient = grad_coef.get(index)
+            row = coef[index]
+            for k in range(n_classes):
+                step = (gradient[k] / n if gradient else 0.0) + l2 * row[k]
+                row[k] -= learning_rate * step
+
+        if epoch % 50 == 0 or epoch == epochs - 1:
+            print(f"   epoch {epoch:>4}  loss {loss / n:.4f}")
+
+    return coef, intercept
+
+
+def predict(vector, coef, intercept):
+    logits = list(intercept)
+    for index, weight in vector.items():
+        for k in range(len(logits)):
+            logits[k] += coef[index][k] * weight
+    return max(range(len(logits)), key=logits.__getitem__)
+
+
+def evaluate(predictions, labels):
+    """Accuracy plus per-class precision, recall and F1"""
+    report = {"accuracy": round(sum(p == y for p, y in zip(predictions, labels)) / len(labels), 4)}
+    for k, name in enumerate(CLASSES):
+        tp = sum(p == k and y == k for p, y in zip(predictions, labels))
+        fp = sum(p == k and y != k for p, y in zip(predictions, labels))
+        fn = sum(p != k and y == k for p, y in zip(predictions, labels))
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+        report[name] = {"precision": round(precision, 4), "recall": round(recall, 4), "f1": round(f1, 4)}
+    return report
+
+
+def fit(samples, epochs):
+    texts = [text for text, _, _ in samples]
+    labels = [label for _, label, _ in samples]
+    vocabulary, idf = fit_vectorizer(texts)
+    index = {term: i for i, term in enumerate(vocabulary)}
+    vectors = [tfidf_vector(extract_terms(text, NGRAM_RANGE), index, idf) for text in texts]
+    coef, intercept = train_logistic_regression(vectors, labels, len(vocabulary), epochs)
+    return vocabulary, index, idf, coef, intercept
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the HackForce local severity model")
+    parser.add_argument("--data", default=os.path.join(ai_model_dir, "data", "bug_reports.csv"))
+    parser.add_argument("--output", default=os.path.join(ai_model_dir, "models", "severity_model.bin"))
+    parser.add_argument("--epochs", type=int, default=300)
+    args = parser.parse_args()
+
+    samples = load_dataset(args.data)
+    train, test = group_split(samples)
+    templates = len({group for _, _, group in samples})
+    print(f"📊 {len(samples)} labeled bugs in {templates} template groups ({len(train)} train / {len(test)} test)")
+
+    print("🧪 Training on train split for evaluation")
+    _, index, idf, coef, intercept = fit(train, args.epochs)
+    predictions = [predict(tfidf_vector(extract_terms(text, NGRAM_RANGE), index, idf), coef, intercept) for text, _, _ in test]
+    metrics = evaluate(predictions, [label for _, label, _ in test])
+    metrics["split"] = "template-group"
+    print(json.dumps(metrics, indent=2))
+
+    print("🏋️  Retraining on the full dataset")
+    vocabulary, _, idf, coef, intercept = fit(samples, args.epochs)
+
+    version = datetime.now(timezone.utc).strftime("tfidf-lr-%Y%m%d")
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    save_model(args.output, CLASSES, vocabulary, idf, coef, intercept, meta={
+        "version": version,
+        "ngram_range": list(NGRAM_RANGE),
+        "metrics": metrics,
+        "training_samples": len(samples)
+    })
+    print(f"✅ Saved {version} ({len(vocabulary)} features) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
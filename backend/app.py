@@ -4,21 +4,36 @@ FastAPI backend for bug classification and developer assignment
 Now with PostgreSQL database integration (Supabase)
 """
 
-from fastapi import FastAPI, HTTPException, Query, Depends
+from fastapi import FastAPI, HTTPException, Query, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from sqlalchemy.orm import Session
+from pydantic import BaseModel, Field, ValidationError
+from typing import AsyncIterator, Optional, List, Tuple
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 import os
+import json
+import asyncio
+from datetime import datetime
 from dotenv import load_dotenv
 
 # Import database components
-from database import get_db, test_connection, engine, Base
-from models import Bug, Developer, PredictionLog
+from database import get_async_db, test_connection, engine, async_engine, Base, SessionLocal, AsyncSessionLocal
+from models import Bug, Developer, PredictionLog, PENDING_SEVERITY
 import crud
+import async_crud
 
 # Import Groq AI service
-from services.groq_service import get_groq_service
+from services.groq_service import get_async_groq_service
+from services.roster_cache import get_roster_cache
+from services.stats_cache import get_stats_cache
+from services.pool_metrics import all_pool_stats
+from services.triage_queue import get_triage_queue
+from services.llm_scheduler import PRIORITY_BACKGROUND
+from services.pagination import NEXT_CURSOR_HEADER, InvalidCursor, decode_cursor, encode_cursor
+from services.bug_search_index import (
+    BUG_SEARCH_BACKEND, BUG_SEARCH_SNAPSHOT_INTERVAL, BUG_SEARCH_SNAPSHOT_PATH, BUG_SEARCH_SYNC_INTERVAL,
+    get_bug_search_index
+)
 
 # Import API Key routes (optional - disabled for now)
 # TODO: Enable after creating api_keys table in Supabase
@@ -50,8 +65,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+# Bulk import limits: rows per request, and rows per multi-row INSERT transaction
+BULK_IMPORT_MAX_ROWS = int(os.getenv("BULK_IMPORT_MAX_ROWS", "50000"))
+BULK_IMPORT_BATCH_SIZE = int(os.getenv("BULK_IMPORT_BATCH_SIZE", "1000"))
+
+# Seconds between recounts of Developer.workload from the bugs table (0 disables)
+WORKLOAD_RECONCILE_INTERVAL = float(os.getenv("WORKLOAD_RECONCILE_INTERVAL", "600"))
+
 # ============================================================================
 # Startup Event - Create tables and test connection
 # ============================================================================
@@ -76,6 +99,43 @@ async def startup_event():
         print("✅ Database tables ready")
     except Exception as e:
         print(f"❌ Error creating tables: {e}")
+    
+    # Start background triage workers for the asynchronous ingestion mode
+    queue = get_triage_queue()
+    await queue.start(process_pending_bug, sweep=sweep_pending_bugs)
+    
+    # Load the in-process search index in the background; search falls back to a scan until it is ready
+    global search_index_task
+    if BUG_SEARCH_BACKEND == "memory":
+        search_index_task = asyncio.create_task(maintain_bug_search_index())
+    
+    # Correct Developer.workload drift (writes made outside the API) periodically
+    global workload_reconcile_task
+    if WORKLOAD_RECONCILE_INTERVAL > 0:
+        workload_reconcile_task = asyncio.create_task(reconcile_developer_workloads_periodically())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Run on application shutdown
+    Stops background triage workers (unfinished bugs stay pending and are swept on restart)
+    and workload reconciliation, snapshots the in-process search index and
+    closes the async engine's connections
+    """
+    await get_triage_queue().stop()
+    
+    if workload_reconcile_task is not None:
+        workload_reconcile_task.cancel()
+        await asyncio.gather(workload_reconcile_task, return_exceptions=True)
+    
+    if search_index_task is not None:
+        search_index_task.cancel()
+        await asyncio.gather(search_index_task, return_exceptions=True)
+        index = get_bug_search_index()
+        if BUG_SEARCH_SNAPSHOT_PATH and index.is_built and index.changes_since_snapshot:
+            await asyncio.get_running_loop().run_in_executor(None, index.snapshot, BUG_SEARCH_SNAPSHOT_PATH)
+    
+    await async_engine.dispose()
 
 # ============================================================================
 # Pydantic Models for Request/Response
@@ -95,6 +155,20 @@ class BugUpdate(BaseModel):
     assigned_developer: Optional[str] = None
     severity: Optional[str] = Field(None, pattern="^(Low|Medium|High|Critical)$")
 
+class BugAcceptedResponse(BaseModel):
+    """Model for a bug accepted for background triage"""
+    id: int
+    severity: str
+    status: str
+    triage_status: str
+    poll_url: str
+
+class BugTriageStatus(BaseModel):
+    """Model for background triage status"""
+    bug_id: int
+    triage_status: str
+    bug: dict
+
 class BugResponse(BaseModel):
     """Model for bug response"""
     id: int
@@ -124,6 +198,50 @@ class PredictionResponse(BaseModel):
     suggested_developer: Optional[str]
     reasoning: Optional[str]
 
+class BatchPredictionRequest(BaseModel):
+    """Model for batch prediction request"""
+    items: List[PredictionRequest] = Field(..., min_length=1, max_length=5000)
+    token_budget: Optional[int] = Field(None, ge=500, le=30000, description="Estimated prompt tokens per LLM request")
+
+class BatchPredictionItem(BaseModel):
+    """Model for a single batch prediction result"""
+    index: int
+    severity: str
+    confidence: float
+    reasoning: Optional[str]
+
+class BatchPredictionResponse(BaseModel):
+    """Model for batch prediction response"""
+    total: int
+    results: List[BatchPredictionItem]
+
+class BulkBugItem(BaseModel):
+    """Model for one bug in a bulk import (e.g. migrated from Jira or GitHub)"""
+    title: str = Field(..., min_length=5, max_length=255)
+    description: str = Field(..., min_length=10)
+    source: str = Field(default="Import", max_length=100)
+    severity: Optional[str] = Field(None, pattern="^(Low|Medium|High|Critical)$")
+    status: str = Field(default="Open", pattern="^(Open|In Progress|Resolved|Closed)$")
+    assigned_developer: Optional[str] = Field(None, max_length=100)
+    jira_issue_key: Optional[str] = Field(None, max_length=50)
+    notion_page_id: Optional[str] = Field(None, max_length=100)
+
+class BulkImportError(BaseModel):
+    """Model for a rejected bulk import row"""
+    index: int
+    error: str
+
+class BulkImportResponse(BaseModel):
+    """Model for bulk import response"""
+    received: int
+    inserted: int
+    failed: int
+    classification: str
+    queued_for_triage: int
+    truncated: bool
+    bug_ids: List[int]
+    errors: List[BulkImportError]
+
 class DeveloperCreate(BaseModel):
     """Model for creating a developer"""
     name: str = Field(..., min_length=2, max_length=100)
@@ -159,18 +277,23 @@ async def root():
         "docs": "/docs",
         "endpoints": {
             "bugs": "/api/bugs",
+            "bugs_bulk": "/api/bugs/bulk",
+            "bugs_async": "/api/bugs/async",
             "developers": "/api/developers",
+            "developers_workload": "/api/developers/workload",
             "predict": "/api/predict",
-            "stats": "/api/stats"
+            "predict_batch": "/api/predict/batch",
+            "stats": "/api/stats",
+            "metrics": "/api/metrics"
         }
     }
 
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_async_db)):
     """Health check endpoint"""
     try:
         # Test database connection
-        db.execute("SELECT 1")
+        await db.execute(text("SELECT 1"))
         db_status = "connected"
     except Exception as e:
         db_status = f"error: {str(e)}"
@@ -181,93 +304,425 @@ async def health_check(db: Session = Depends(get_db)):
         "version": "2.0.0"
     }
 
+# ============================================================================
+# Triage Helpers (shared by the synchronous and background paths)
+# ============================================================================
+
+def triage_fields(classification: dict) -> dict:
+    """
+    Bug columns set from a triage result; the assignee's ID comes from the
+    roster entry triage chose, so crud.py doesn't look the name up again
+    """
+    return {
+        "severity": classification["severity"],
+        "predicted_severity": classification["severity"],
+        "confidence_score": classification["confidence"],
+        "assigned_developer": classification["developer_name"],
+        "assigned_developer_id": classification.get("developer_id")
+    }
+
+def prediction_log_fields(classification: dict) -> dict:
+    """Prediction log columns for a triage result"""
+    return {
+        "model_version": classification.get("model_version", "groq-mixtral-8x7b"),
+        "predicted_severity": classification["severity"],
+        "confidence": classification["confidence"],
+        "features_used": f"AI: {classification.get('reasoning', 'N/A')}"
+    }
+
+async def process_pending_bug(bug_id: int):
+    """
+    Background triage worker: classify and assign a pending bug, then update
+    it and write its prediction log in one transaction
+    """
+    async with AsyncSessionLocal() as db:
+        bug = await async_crud.get_bug(db, bug_id)
+        if not bug or bug.severity != PENDING_SEVERITY:
+            return
+        
+        dev_list = await async_crud.get_active_roster(db)
+        await async_crud.refresh_skill_index(db)
+        # Return the connection to the pool while the LLM call is in flight
+        await db.commit()
+        classification = await get_async_groq_service().triage(
+            title=bug.title,
+            description=bug.description,
+            developers=dev_list,
+            priority=PRIORITY_BACKGROUND
+        )
+        await async_crud.complete_pending_bug(db, bug_id, triage_fields(classification), prediction_log_fields(classification))
+
+def sweep_pending_bugs():
+    """IDs of bugs left pending (queue overflow, restarts) for the triage queue to pick up"""
+    db = SessionLocal()
+    try:
+        # Skip bugs accepted moments ago; another worker process is likely triaging them
+        return crud.get_pending_bug_ids(db, older_than_seconds=get_triage_queue().sweep_interval)
+    finally:
+        db.close()
+
+# ============================================================================
+# Search Index Helpers (BUG_SEARCH_BACKEND=memory)
+# ============================================================================
+
+# Background task loading and maintaining the in-process search index
+search_index_task = None
+
+def load_bug_search_index():
+    """Restore or build the search index (blocking; run in an executor)"""
+    db = SessionLocal()
+    try:
+        index = crud.load_bug_search_index(db, BUG_SEARCH_SNAPSHOT_PATH or None)
+        print(f"✅ Bug search index ready ({index.stats()['documents']} bugs)")
+    finally:
+        db.close()
+
+def sync_bug_search_index(full: bool):
+    """Catch the search index up with other workers' writes, and snapshot it if full (blocking)"""
+    db = SessionLocal()
+    try:
+        crud.sync_bug_search_index(db, full=full)
+    finally:
+        db.close()
+    index = get_bug_search_index()
+    if full and BUG_SEARCH_SNAPSHOT_PATH and index.changes_since_snapshot:
+        index.snapshot(BUG_SEARCH_SNAPSHOT_PATH)
+
+async def maintain_bug_search_index():
+    """
+    Load the search index, then every BUG_SEARCH_SYNC_INTERVAL seconds apply
+    writes from other workers; every BUG_SEARCH_SNAPSHOT_INTERVAL seconds also
+    drop bugs deleted elsewhere and write a snapshot
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(None, load_bug_search_index)
+    except Exception as e:
+        print(f"❌ Bug search index load failed: {e}")
+        return
+    
+    last_full_sync = loop.time()
+    while True:
+        await asyncio.sleep(BUG_SEARCH_SYNC_INTERVAL)
+        full = loop.time() - last_full_sync >= BUG_SEARCH_SNAPSHOT_INTERVAL
+        try:
+            await loop.run_in_executor(None, sync_bug_search_index, full)
+            if full:
+                last_full_sync = loop.time()
+        except Exception as e:
+            print(f"⚠️  Bug search index sync failed: {e}")
+
+# ============================================================================
+# Workload Reconciliation Helpers
+# ============================================================================
+
+# Background task recounting Developer.workload every WORKLOAD_RECONCILE_INTERVAL seconds
+workload_reconcile_task = None
+
+def reconcile_developer_workloads():
+    """Recount developer workloads from the bugs table (blocking; run in an executor)"""
+    db = SessionLocal()
+    try:
+        corrected = crud.reconcile_developer_workloads(db)
+    finally:
+        db.close()
+    if corrected:
+        print(f"⚠️  Corrected workload drift for {corrected} developer(s)")
+
+async def reconcile_developer_workloads_periodically():
+    """
+    Reconcile workloads at start-up and then every WORKLOAD_RECONCILE_INTERVAL
+    seconds. Bug writes through crud.py keep them exact; this catches edits
+    made directly in the database.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            await loop.run_in_executor(None, reconcile_developer_workloads)
+        except Exception as e:
+            print(f"⚠️  Workload reconciliation failed: {e}")
+        await asyncio.sleep(WORKLOAD_RECONCILE_INTERVAL)
+
+# ============================================================================
+# Bulk Import Helpers
+# ============================================================================
+
+async def read_bulk_rows(request: Request) -> AsyncIterator[Tuple[int, Optional[object], Optional[str]]]:
+    """
+    Yield (index, parsed row, parse error) from a JSON array body, or from an
+    NDJSON body (Content-Type application/x-ndjson) as it streams in
+    """
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" in content_type or "jsonl" in content_type:
+        index, buffer = 0, b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield (index, *parse_json_line(line))
+                    index += 1
+        if buffer.strip():
+            yield (index, *parse_json_line(buffer))
+        return
+    
+    try:
+        rows = json.loads(await request.body())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e}")
+    if not isinstance(rows, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array of bugs (or NDJSON)")
+    for index, row in enumerate(rows):
+        yield index, row, None
+
+def parse_json_line(line: bytes) -> Tuple[Optional[object], Optional[str]]:
+    try:
+        return json.loads(line), None
+    except ValueError as e:
+        return None, f"invalid JSON: {e}"
+
+def validate_bulk_row(row: object) -> Tuple[Optional[dict], Optional[str]]:
+    """Bug columns for a bulk import row, or a validation error message"""
+    if not isinstance(row, dict):
+        return None, "expected a JSON object"
+    try:
+        item = BulkBugItem(**row)
+    except ValidationError as e:
+        error = e.errors()[0]
+        return None, f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+    # Every row carries the same columns so rows batch into multi-row INSERTs
+    return {**item.dict(), "predicted_severity": None, "confidence_score": None}, None
+
+async def import_bulk_chunk(db: AsyncSession, chunk: List[Tuple[int, dict]], classify: str, result: dict):
+    """Classify (if requested) and insert one chunk of validated rows, updating result"""
+    rows = [row for _, row in chunk]
+    unclassified = [position for position, row in enumerate(rows) if not row["severity"]]
+    predictions = None
+    
+    if classify == "batch" and unclassified:
+        classifications = await get_async_groq_service().classify_batch(
+            [{"title": rows[position]["title"], "description": rows[position]["description"]} for position in unclassified]
+        )
+        predictions = [None] * len(rows)
+        for position, classification in zip(unclassified, classifications):
+            rows[position].update(
+                severity=classification["severity"],
+                predicted_severity=classification["severity"],
+                confidence_score=classification["confidence"]
+            )
+            predictions[position] = prediction_log_fields(classification)
+    elif classify == "defer":
+        for position in unclassified:
+            rows[position]["severity"] = PENDING_SEVERITY
+    
+    ids, errors = await async_crud.bulk_create_bugs(db, rows, predictions)
+    
+    queue = get_triage_queue()
+    for (index, row), bug_id, error in zip(chunk, ids, errors):
+        if error:
+            result["failed"] += 1
+            result["errors"].append({"index": index, "error": error})
+            continue
+        result["inserted"] += 1
+        result["bug_ids"].append(bug_id)
+        # A full queue only delays triage: the sweeper picks up pending bugs later
+        if row["severity"] == PENDING_SEVERITY and queue.submit(bug_id):
+            result["queued_for_triage"] += 1
+
 # ============================================================================
 # Bug Endpoints
 # ============================================================================
 
 @app.post("/api/bugs", response_model=BugResponse, status_code=201)
-async def create_bug(bug: BugCreate, db: Session = Depends(get_db)):
+async def create_bug(bug: BugCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Create a new bug with AI severity prediction using Groq
     """
-    # Get Groq service (lazy initialization)
-    groq = get_groq_service()
+    # Get async Groq service (lazy initialization) so LLM calls don't block the event loop
+    groq = get_async_groq_service()
+    
+    # Get the full Active roster (cached); candidate selection trims it before the prompt
+    dev_list = await async_crud.get_active_roster(db)
+    await async_crud.refresh_skill_index(db)
+    # Return the connection to the pool while the LLM call is in flight
+    await db.commit()
     
-    # Use Groq AI for classification
-    classification = groq.classify_bug_severity(
+    # Classify severity and suggest a developer in a single Groq call
+    classification = await groq.triage(
         title=bug.title,
-        description=bug.description
+        description=bug.description,
+        developers=dev_list
     )
     
-    # Get developers for assignment suggestion
-    developers = crud.get_developers(db, status="Active")
-    dev_list = [dev.to_dict() for dev in developers]
-    
-    # Suggest developer using AI
-    if dev_list:
-        dev_suggestion = groq.suggest_developer(
-            bug_description=f"{bug.title}: {bug.description}",
-            severity=classification["severity"],
-            developers=dev_list
-        )
-        suggested_dev = dev_suggestion.get("developer_name", "Unassigned")
-    else:
-        suggested_dev = "Unassigned"
-    
     # Prepare bug data
     bug_data = {
         "title": bug.title,
         "description": bug.description,
         "source": bug.source,
-        "severity": classification["severity"],
-        "predicted_severity": classification["severity"],
-        "confidence_score": classification["confidence"],
-        "assigned_developer": suggested_dev,
+        **triage_fields(classification),
         "status": "Open"
     }
     
-    # Create bug in database
-    db_bug = crud.create_bug(db, bug_data)
+    # Store the bug and its prediction log atomically in one transaction
+    db_bug = await async_crud.create_bug_with_prediction(db, bug_data, prediction_log_fields(classification))
     
-    # Create prediction log
-    prediction_data = {
-        "bug_id": db_bug.id,
-        "model_version": "groq-mixtral-8x7b",
-        "predicted_severity": classification["severity"],
-        "confidence": classification["confidence"],
-        "features_used": f"AI: {classification.get('reasoning', 'N/A')}"
+    return db_bug.to_dict()
+
+@app.post("/api/bugs/async", response_model=BugAcceptedResponse, status_code=202)
+async def create_bug_async(bug: BugCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Accept a bug immediately and triage it in the background
+    
+    The bug is stored with a Pending severity; background workers classify
+    and assign it and write the prediction log. Poll
+    GET /api/bugs/{id}/triage (optionally with ?wait=N to long-poll) for completion.
+    """
+    db_bug = await async_crud.create_bug(db, {
+        "title": bug.title,
+        "description": bug.description,
+        "source": bug.source,
+        "severity": PENDING_SEVERITY,
+        "status": "Open"
+    })
+    
+    # A full queue only delays triage: the sweeper picks up pending bugs later
+    get_triage_queue().submit(db_bug.id)
+    
+    return {
+        "id": db_bug.id,
+        "severity": db_bug.severity,
+        "status": db_bug.status,
+        "triage_status": "pending",
+        "poll_url": f"/api/bugs/{db_bug.id}/triage"
     }
-    crud.create_prediction_log(db, prediction_data)
+
+@app.post("/api/bugs/bulk", response_model=BulkImportResponse)
+async def bulk_import_bugs(
+    request: Request,
+    classify: str = Query("defer", pattern="^(skip|defer|batch)$", description="How to classify rows without a severity"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Import many bugs (e.g. a Jira or GitHub backlog) in one request
     
-    return db_bug.to_dict()
+    The body is a JSON array of bugs, or NDJSON (Content-Type:
+    application/x-ndjson, one bug per line) which is inserted while it
+    streams in. Rows are written BULK_IMPORT_BATCH_SIZE at a time with
+    multi-row INSERTs, one transaction per batch. Rows without a severity are:
+    - skip: rejected (rows keep the severity from the source tracker)
+    - defer: stored as Pending and triaged by the background queue
+    - batch: classified with packed batch prediction before insert (no developer assignment)
+    
+    Invalid rows are reported in errors by 0-based index; the other rows are
+    still imported. At most BULK_IMPORT_MAX_ROWS rows are read (truncated is set).
+    """
+    result = {
+        "received": 0, "inserted": 0, "failed": 0, "classification": classify,
+        "queued_for_triage": 0, "truncated": False, "bug_ids": [], "errors": []
+    }
+    chunk = []
+    
+    async for index, row, error in read_bulk_rows(request):
+        if index >= BULK_IMPORT_MAX_ROWS:
+            result["truncated"] = True
+            break
+        result["received"] += 1
+        
+        if error is None:
+            row, error = validate_bulk_row(row)
+        if error is None and classify == "skip" and not row["severity"]:
+            error = "severity: required when classify=skip"
+        if error is not None:
+            result["failed"] += 1
+            result["errors"].append({"index": index, "error": error})
+            continue
+        
+        chunk.append((index, row))
+        if len(chunk) >= BULK_IMPORT_BATCH_SIZE:
+            await import_bulk_chunk(db, chunk, classify, result)
+            chunk = []
+    
+    if chunk:
+        await import_bulk_chunk(db, chunk, classify, result)
+    
+    result["errors"].sort(key=lambda item: item["index"])
+    return result
+
+@app.get("/api/bugs/{bug_id}/triage", response_model=BugTriageStatus)
+async def get_bug_triage(
+    bug_id: int,
+    wait: float = Query(0, ge=0, le=30, description="Seconds to wait for a pending bug to be triaged (long-poll)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get background triage status for a bug
+    """
+    bug = await async_crud.get_bug(db, bug_id)
+    if not bug:
+        raise HTTPException(status_code=404, detail=f"Bug with id {bug_id} not found")
+    
+    if bug.severity == PENDING_SEVERITY and wait > 0:
+        # Completion in this process wakes the waiter at once; re-checking the
+        # database every second covers bugs triaged by other workers. The
+        # session is closed while waiting so its connection goes back to the
+        # pool instead of being held for the whole long-poll.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        while bug.severity == PENDING_SEVERITY and loop.time() < deadline:
+            await db.close()
+            await get_triage_queue().wait(bug_id, min(1.0, deadline - loop.time()))
+            bug = await async_crud.get_bug(db, bug_id)
+            if not bug:
+                raise HTTPException(status_code=404, detail=f"Bug with id {bug_id} not found")
+    
+    return {
+        "bug_id": bug.id,
+        "triage_status": "pending" if bug.severity == PENDING_SEVERITY else "complete",
+        "bug": bug.to_dict()
+    }
 
 @app.get("/api/bugs", response_model=List[BugResponse])
 async def list_bugs(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    severity: Optional[str] = Query(None, pattern="^(Low|Medium|High|Critical)$"),
+    severity: Optional[str] = Query(None, pattern="^(Low|Medium|High|Critical|Pending)$"),
     status: Optional[str] = Query(None, pattern="^(Open|In Progress|Resolved|Closed)$"),
     source: Optional[str] = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get list of bugs with optional filters
+    Get list of bugs with optional filters, newest first
+    
+    Paginate with skip/limit, or with cursors: when a page is full its
+    X-Next-Cursor header holds the cursor for the next one. Cursor pages
+    cost the same at any depth and are stable under concurrent inserts.
     """
-    bugs = crud.get_bugs(db, skip=skip, limit=limit, severity=severity, status=status, source=source)
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, datetime, int)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    bugs = await async_crud.get_bugs(db, skip=skip, limit=limit, severity=severity, status=status, source=source, after=after)
+    if len(bugs) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(bugs[-1].created_at, bugs[-1].id)
     return [bug.to_dict() for bug in bugs]
 
 @app.get("/api/bugs/{bug_id}", response_model=BugResponse)
-async def get_bug(bug_id: int, db: Session = Depends(get_db)):
+async def get_bug(bug_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Get a specific bug by ID
     """
-    bug = crud.get_bug(db, bug_id)
+    bug = await async_crud.get_bug(db, bug_id)
     if not bug:
         raise HTTPException(status_code=404, detail=f"Bug with id {bug_id} not found")
     return bug.to_dict()
 
 @app.put("/api/bugs/{bug_id}", response_model=BugResponse)
-async def update_bug(bug_id: int, bug_update: BugUpdate, db: Session = Depends(get_db)):
+async def update_bug(bug_id: int, bug_update: BugUpdate, db: AsyncSession = Depends(get_async_db)):
     """
     Update a bug
     """
@@ -277,78 +732,125 @@ async def update_bug(bug_id: int, bug_update: BugUpdate, db: Session = Depends(g
     if not update_data:
         raise HTTPException(status_code=400, detail="No fields to update")
     
-    updated_bug = crud.update_bug(db, bug_id, update_data)
+    updated_bug = await async_crud.update_bug(db, bug_id, update_data)
     if not updated_bug:
         raise HTTPException(status_code=404, detail=f"Bug with id {bug_id} not found")
     
     return updated_bug.to_dict()
 
 @app.delete("/api/bugs/{bug_id}")
-async def delete_bug(bug_id: int, db: Session = Depends(get_db)):
+async def delete_bug(bug_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Delete a bug
     """
-    success = crud.delete_bug(db, bug_id)
+    success = await async_crud.delete_bug(db, bug_id)
     if not success:
         raise HTTPException(status_code=404, detail=f"Bug with id {bug_id} not found")
     
     return {"message": f"Bug {bug_id} deleted successfully"}
 
 @app.get("/api/bugs/search/{search_term}")
-async def search_bugs(search_term: str, db: Session = Depends(get_db)):
+async def search_bugs(
+    search_term: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    severity: Optional[str] = Query(None, pattern="^(Low|Medium|High|Critical|Pending)$"),
+    status: Optional[str] = Query(None, pattern="^(Open|In Progress|Resolved|Closed)$"),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
-    Search bugs by title or description
+    Search bugs by title or description, best match first
+    
+    Full-text search (web-style syntax: "quoted phrase", -excluded, or) with
+    trigram matching of partial or misspelled title words. Each bug carries
+    its relevance score.
     """
-    bugs = crud.search_bugs(db, search_term)
-    return [bug.to_dict() for bug in bugs]
+    results = await async_crud.search_bugs(db, search_term, skip=skip, limit=limit, severity=severity, status=status)
+    return [{**bug.to_dict(), "score": score} for bug, score in results]
 
 # ============================================================================
 # Developer Endpoints
 # ============================================================================
 
 @app.post("/api/developers", response_model=DeveloperResponse, status_code=201)
-async def create_developer(developer: DeveloperCreate, db: Session = Depends(get_db)):
+async def create_developer(developer: DeveloperCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Create a new developer
     """
     # Check if email already exists
-    existing = crud.get_developer_by_email(db, developer.email)
+    existing = await async_crud.get_developer_by_email(db, developer.email)
     if existing:
         raise HTTPException(status_code=400, detail="Developer with this email already exists")
     
     developer_data = developer.dict()
-    db_developer = crud.create_developer(db, developer_data)
+    db_developer = await async_crud.create_developer(db, developer_data)
     return db_developer.to_dict()
 
 @app.get("/api/developers", response_model=List[DeveloperResponse])
 async def list_developers(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
     status: Optional[str] = Query(None, pattern="^(Active|Inactive|On Leave)$"),
-    db: Session = Depends(get_db)
+    skill: Optional[List[str]] = Query(None, description="Only developers with all of these skills (aliases such as 'js' accepted), least loaded first"),
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get list of developers
+    Get list of developers (by id, or least loaded first when filtering by skill)
+    
+    Paginate with skip/limit, or with the cursor from a full page's
+    X-Next-Cursor header (not available with skill filters).
     """
-    developers = crud.get_developers(db, skip=skip, limit=limit, status=status)
+    if skill:
+        if cursor:
+            raise HTTPException(status_code=400, detail="cursor pagination is not supported with skill filters; use skip")
+        return await async_crud.get_developers_by_skills(db, skill, status=status, skip=skip, limit=limit)
+    
+    after_id = None
+    if cursor:
+        try:
+            after_id, = decode_cursor(cursor, int)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    developers = await async_crud.get_developers(db, skip=skip, limit=limit, status=status, after_id=after_id)
+    if len(developers) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(developers[-1].id)
     return [dev.to_dict() for dev in developers]
 
+@app.get("/api/developers/workload")
+async def list_developer_workloads(
+    status: Optional[str] = Query(None, pattern="^(Open|In Progress|Resolved|Closed)$", description="Only count bugs in this status"),
+    created_after: Optional[datetime] = Query(None, description="Only count bugs created at or after this time"),
+    created_before: Optional[datetime] = Query(None, description="Only count bugs created before this time"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get workload statistics for every developer in one call (one query), by id
+    
+    Declared before /api/developers/{developer_id} so "workload" is not parsed as an id.
+    """
+    if created_after and created_before and created_after >= created_before:
+        raise HTTPException(status_code=400, detail="created_after must be earlier than created_before")
+    return await async_crud.get_developers_workload(db, status=status, created_after=created_after, created_before=created_before)
+
 @app.get("/api/developers/{developer_id}", response_model=DeveloperResponse)
-async def get_developer(developer_id: int, db: Session = Depends(get_db)):
+async def get_developer(developer_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Get a specific developer by ID
     """
-    developer = crud.get_developer(db, developer_id)
+    developer = await async_crud.get_developer(db, developer_id)
     if not developer:
         raise HTTPException(status_code=404, detail=f"Developer with id {developer_id} not found")
     return developer.to_dict()
 
 @app.get("/api/developers/{developer_id}/workload")
-async def get_developer_workload(developer_id: int, db: Session = Depends(get_db)):
+async def get_developer_workload(developer_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Get workload statistics for a developer
     """
-    workload = crud.get_developer_workload(db, developer_id)
+    workload = await async_crud.get_developer_workload(db, developer_id)
     if not workload:
         raise HTTPException(status_code=404, detail=f"Developer with id {developer_id} not found")
     return workload
@@ -358,33 +860,26 @@ async def get_developer_workload(developer_id: int, db: Session = Depends(get_db
 # ============================================================================
 
 @app.post("/api/predict", response_model=PredictionResponse)
-async def predict_severity(prediction: PredictionRequest, db: Session = Depends(get_db)):
+async def predict_severity(prediction: PredictionRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Predict bug severity without saving to database using Groq AI
     """
-    # Get Groq service (lazy initialization)
-    groq = get_groq_service()
+    # Get async Groq service (lazy initialization) so LLM calls don't block the event loop
+    groq = get_async_groq_service()
+    
+    # Get the full Active roster (cached); candidate selection trims it before the prompt
+    dev_list = await async_crud.get_active_roster(db)
+    await async_crud.refresh_skill_index(db)
+    # Return the connection to the pool while the LLM call is in flight
+    await db.commit()
     
-    # Use Groq AI for classification
-    classification = groq.classify_bug_severity(
+    # Classify severity and suggest a developer in a single Groq call
+    classification = await groq.triage(
         title=prediction.title,
-        description=prediction.description
+        description=prediction.description,
+        developers=dev_list
     )
-    
-    # Get developers for assignment suggestion
-    developers = crud.get_developers(db, status="Active")
-    dev_list = [dev.to_dict() for dev in developers]
-    
-    # Suggest developer using AI
-    if dev_list:
-        dev_suggestion = groq.suggest_developer(
-            bug_description=f"{prediction.title}: {prediction.description}",
-            severity=classification["severity"],
-            developers=dev_list
-        )
-        suggested_dev = dev_suggestion.get("developer_name", "Unassigned")
-    else:
-        suggested_dev = "Unassigned"
+    suggested_dev = classification["developer_name"]
     
     return {
         "severity": classification["severity"],
@@ -393,18 +888,61 @@ async def predict_severity(prediction: PredictionRequest, db: Session = Depends(
         "reasoning": classification.get("reasoning", "AI-powered classification")
     }
 
+@app.post("/api/predict/batch", response_model=BatchPredictionResponse)
+async def predict_severity_batch(batch: BatchPredictionRequest):
+    """
+    Predict severity for many bugs at once, packing several bugs into each Groq request
+    """
+    groq = get_async_groq_service()
+    
+    classifications = await groq.classify_batch(
+        items=[{"title": item.title, "description": item.description} for item in batch.items],
+        token_budget=batch.token_budget
+    )
+    
+    return {
+        "total": len(classifications),
+        "results": [
+            {
+                "index": index,
+                "severity": classification["severity"],
+                "confidence": classification["confidence"],
+                "reasoning": classification.get("reasoning", "AI-powered classification")
+            }
+            for index, classification in enumerate(classifications)
+        ]
+    }
+
 # ============================================================================
 # Statistics Endpoint
 # ============================================================================
 
 @app.get("/api/stats")
-async def get_statistics(db: Session = Depends(get_db)):
+async def get_statistics(db: AsyncSession = Depends(get_async_db)):
     """
-    Get overall statistics for dashboard
+    Get overall statistics for dashboard (cached; recounted every STATS_RECONCILE_INTERVAL seconds)
     """
-    stats = crud.get_statistics(db)
+    stats = await async_crud.get_statistics(db)
     return stats
 
+# ============================================================================
+# Metrics Endpoint
+# ============================================================================
+
+@app.get("/api/metrics")
+async def get_metrics():
+    """
+    Get runtime metrics for the AI classification layer (cache hit rates, etc.)
+    """
+    return {
+        **get_async_groq_service().get_metrics(),
+        "roster_cache": get_roster_cache().stats(),
+        "stats_cache": get_stats_cache().stats(),
+        "triage_queue": get_triage_queue().stats(),
+        "bug_search_index": get_bug_search_index().stats(),
+        "database_pools": all_pool_stats()
+    }
+
 # ============================================================================
 # Include API Key Routes (if enabled)
 # ============================================================================
@@ -0,0 +1,137 @@
+"""
+Async CRUD operations for HackForce AI API
+Awaitable versions of the crud.py functions for AsyncSession. Each runs the
+crud.py implementation through AsyncSession.run_sync: its statements go out
+over asyncpg and are awaited on the event loop (only the ORM's Python work
+runs on it), so the queries, caches, search index and workload bookkeeping
+in crud.py stay in one place.
+
+CPU-bound work is kept off the event loop:
+- The cache and index updates that follow a commit (crud._after_commit) run
+  in the default executor once the crud function returns.
+- Roster dicts, skill index rebuilds and in-memory BM25 ranking run there too.
+- Roster and dashboard statistics cache hits return without touching the session.
+
+Everything a function returns is loaded before it returns; don't access
+unloaded relationships on returned instances outside another call.
+"""
+
+import asyncio
+import functools
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import crud
+from services.bug_search_index import BUG_SEARCH_BACKEND, get_bug_search_index
+from services.roster_cache import get_roster_cache
+from services.skill_index import get_skill_index
+from services.stats_cache import get_stats_cache
+
+
+def _awaitable(function):
+    """
+    Wrap crud.function(db, ...) as an async function of an AsyncSession; the
+    post-commit hooks it collects run in a worker thread before it returns
+    """
+    @functools.wraps(function)
+    async def wrapper(db: AsyncSession, *args, **kwargs):
+        hooks = db.info[crud.AFTER_COMMIT_HOOKS] = []
+        try:
+            return await db.run_sync(function, *args, **kwargs)
+        finally:
+            del db.info[crud.AFTER_COMMIT_HOOKS]
+            if hooks:
+                await _in_executor(crud.run_after_commit_hooks, hooks)
+    return wrapper
+
+
+async def _in_executor(function, *args, **kwargs):
+    """Run a CPU-bound function in the default executor"""
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(function, *args, **kwargs))
+
+
+# ============================================================================
+# Bug CRUD Operations
+# ============================================================================
+
+create_bug = _awaitable(crud.create_bug)
+create_bug_with_prediction = _awaitable(crud.create_bug_with_prediction)
+bulk_create_bugs = _awaitable(crud.bulk_create_bugs)
+get_bug = _awaitable(crud.get_bug)
+get_bugs = _awaitable(crud.get_bugs)
+update_bug = _awaitable(crud.update_bug)
+delete_bug = _awaitable(crud.delete_bug)
+get_pending_bug_ids = _awaitable(crud.get_pending_bug_ids)
+complete_pending_bug = _awaitable(crud.complete_pending_bug)
+_search_bugs = _awaitable(crud.search_bugs)
+get_ranked_bugs = _awaitable(crud.get_ranked_bugs)
+
+
+async def search_bugs(db: AsyncSession, search_term: str, skip: int = 0, limit: int = 50, severity=None, status=None):
+    """crud.search_bugs; with the in-memory backend, BM25 ranking runs in a worker thread"""
+    index = get_bug_search_index()
+    if BUG_SEARCH_BACKEND != "memory" or not index.is_built:
+        return await _search_bugs(db, search_term, skip=skip, limit=limit, severity=severity, status=status)
+    ranked = await _in_executor(index.search, search_term, skip=skip, limit=limit, severity=severity, status=status)
+    return await get_ranked_bugs(db, ranked)
+
+# ============================================================================
+# Developer CRUD Operations
+# ============================================================================
+
+create_developer = _awaitable(crud.create_developer)
+get_developer = _awaitable(crud.get_developer)
+get_developer_by_email = _awaitable(crud.get_developer_by_email)
+get_developers = _awaitable(crud.get_developers)
+update_developer = _awaitable(crud.update_developer)
+delete_developer = _awaitable(crud.delete_developer)
+get_developer_workload = _awaitable(crud.get_developer_workload)
+get_developers_workload = _awaitable(crud.get_developers_workload)
+reconcile_developer_workloads = _awaitable(crud.reconcile_developer_workloads)
+_get_developers_by_skills = _awaitable(crud.get_developers_by_skills)
+
+
+async def get_active_roster(db: AsyncSession):
+    """crud.get_active_roster; a reload converts the developers to dicts in a worker thread"""
+    cache = get_roster_cache()
+    roster = cache.cached()
+    if roster is not None:
+        return roster
+    version = cache.version
+    developers = await get_developers(db, status="Active", limit=None)
+    return cache.store(await _in_executor(lambda: [dev.to_dict() for dev in developers]), version)
+
+
+async def refresh_skill_index(db: AsyncSession, force: bool = False):
+    """crud.refresh_skill_index; the index is rebuilt in a worker thread"""
+    index = get_skill_index()
+    if force or index.is_stale():
+        developers = await get_developers(db, limit=None)
+        await _in_executor(lambda: index.build(dev.to_dict() for dev in developers))
+    return index
+
+
+async def get_developers_by_skills(db: AsyncSession, skills, status=None, skip: int = 0, limit=100):
+    """crud.get_developers_by_skills, with a stale skill index rebuilt off the event loop first"""
+    await refresh_skill_index(db)
+    return await _get_developers_by_skills(db, skills, status=status, skip=skip, limit=limit)
+
+# ============================================================================
+# Prediction Log CRUD Operations
+# ============================================================================
+
+create_prediction_log = _awaitable(crud.create_prediction_log)
+get_prediction_logs = _awaitable(crud.get_prediction_logs)
+
+# ============================================================================
+# Statistics and Analytics
+# ============================================================================
+
+_get_statistics = _awaitable(crud.get_statistics)
+
+
+async def get_statistics(db: AsyncSession):
+    """crud.get_statistics; a cache hit doesn't enter the session"""
+    statistics = get_stats_cache().get()
+    if statistics is not None:
+        return statistics
+    return await _get_statistics(db)
@@ -0,0 +1,75 @@
+"""
+Micro-benchmark: compiled KeywordMatcher vs. the legacy per-keyword scan
+Run from the backend directory: python benchmarks/bench_keyword_matcher.py
+"""
+
+import os
+import sys
+import random
+import timeit
+
+# Add backend to path
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from services.keyword_matcher import KeywordMatcher, SEVERITY_KEYWORDS
+
+FILLER_WORDS = (
+    "the user opened the dashboard and clicked through several pages while the "
+    "report was loading then went back to the previous view and refreshed it "
+    "stack trace follows at module line frame handler request response payload"
+).split()
+
+
+def legacy_match(text, tiers):
+    """The original fallback: lowercase, then one substring scan per keyword"""
+    text = text.lower()
+    for label, keywords in tiers:
+        if any(keyword in text for keyword in keywords):
+            return label
+    return None
+
+
+def make_description(rng, n_words, keyword=None):
+    words = [rng.choice(FILLER_WORDS) for _ in range(n_words)]
+    if keyword:
+        words.append(keyword)
+    return " ".join(words)
+
+
+def expanded_tiers(factor):
+    """Simulate a larger keyword vocabulary (e.g. per-product keyword lists)"""
+    return [
+        (label, list(keywords) + [f"{keyword}{i}" for keyword in keywords for i in range(factor)])
+        for label, keywords in SEVERITY_KEYWORDS
+    ]
+
+
+def bench(label, fn, number):
+    seconds = min(timeit.repeat(fn, number=number, repeat=3)) / number
+    return seconds * 1e6
+
+
+def run_single(tiers, tiers_label):
+    matcher = KeywordMatcher(tiers)
+    rng = random.Random(42)
+
+    print(f"\nSingle description ({tiers_label}, {sum(len(k) for _, k in tiers)} keywords)")
+    print(f"{'words':>8} {'case':<12} {'legacy (us)':>12} {'matcher (us)':>13} {'speedup':>8}")
+    for n_words in (40, 400, 4000, 20000):
+        for case, keyword in (("no match", None), ("low at end", "typo")):
+            text = make_description(rng, n_words, keyword)
+            number = max(5, 20000 // n_words)
+            legacy = bench("legacy", lambda: legacy_match(text, tiers), number)
+            compiled = bench("matcher", lambda: matcher.match(text), number)
+            print(f"{n_words:>8} {case:<12} {legacy:>12.1f} {compiled:>13.1f} {legacy / compiled:>7.2f}x")
+
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("HackForce AI - Keyword Matcher Benchmark")
+    print("=" * 60)
+    run_single(SEVERITY_KEYWORDS, "shipped keyword tiers")
+    run_single(expanded_tiers(10), "10x keyword vocabulary")
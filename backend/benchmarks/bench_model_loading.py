@@ -0,0 +1,165 @@
+"""
+Benchmark: memory-mapped model artifacts vs. pickle/joblib loading
+Run from the backend directory: python benchmarks/bench_model_loading.py [--sizes 50000,200000]
+
+Builds synthetic TF-IDF + logistic regression models at realistic vocabulary
+sizes and measures, in a fresh interpreter per run (as a new worker would),
+the time to load the model and serve a first prediction, plus the RSS growth.
+"""
+
+import os
+import sys
+import json
+import pickle
+import random
+import argparse
+import tempfile
+import subprocess
+
+# Add backend to path
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from services.local_model import save_model
+
+try:
+    import joblib
+except ImportError:
+    joblib = None
+
+CLASSES = ["Critical", "High", "Medium", "Low"]
+SAMPLE_TEXT = "Checkout fails: payment API returns 500 error when the user submits an order"
+
+# Executed in a child process; prints load time, first prediction time and RSS delta
+LOADER = r"""
+import sys, time, pickle, resource
+sys.path.insert(0, {backend_dir!r})
+from services.local_model import LocalSeverityModel, extract_terms, tfidf_vector, softmax
+
+def rss_kb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize() // 1024
+
+class PickledModel:
+    def __init__(self, state):
+        self.vocabulary = state["vocabulary"]
+        self.idf = state["idf"]
+        self.coef = state["coef"]
+        self.intercept = state["intercept"]
+
+    def predict_proba(self, text):
+        vector = tfidf_vector(extract_terms(text), self.vocabulary, self.idf)
+        logits = list(self.intercept)
+        for index, weight in vector.items():
+            row = self.coef[index]
+            for k in range(len(logits)):
+                logits[k] += row[k] * weight
+        return softmax(logits)
+
+kind, path, text = sys.argv[1], sys.argv[2], sys.argv[3]
+if kind == "joblib":
+    import joblib
+before = rss_kb()
+start = time.perf_counter()
+if kind == "mmap":
+    model = LocalSeverityModel.load(path)
+elif kind == "pickle":
+    with open(path, "rb") as f:
+        model = PickledModel(pickle.load(f))
+else:
+    model = PickledModel(joblib.load(path))
+loaded = time.perf_counter()
+model.predict_proba(text)
+predicted = time.perf_counter()
+print(loaded - start, predicted - loaded, rss_kb() - before)
+"""
+
+
+def synthetic_model(n_features, seed=42):
+    """Random vocabulary of unigrams and bigrams with random weights"""
+    rng = random.Random(seed)
+    stems = [f"w{i}" for i in range(int(n_features ** 0.5) * 4)]
+    vocabulary = set(SAMPLE_TEXT.lower().split())
+    while len(vocabulary) < n_features:
+        vocabulary.add(rng.choice(stems) if rng.random() < 0.3 else f"{rng.choice(stems)} {rng.choice(stems)}")
+    vocabulary = sorted(vocabulary)
+    idf = [rng.uniform(1.0, 8.0) for _ in vocabulary]
+    coef = [[rng.gauss(0.0, 1.0) for _ in CLASSES] for _ in vocabulary]
+    intercept = [rng.gauss(0.0, 0.1) for _ in CLASSES]
+    return vocabulary, idf, coef, intercept
+
+
+def write_artifacts(directory, n_features):
+    vocabulary, idf, coef, intercept = synthetic_model(n_features)
+    state = {
+        "vocabulary": {term: index for index, term in enumerate(vocabulary)},
+        "idf": idf,
+        "coef": coef,
+        "intercept": intercept
+    }
+    paths = {"mmap": os.path.join(directory, f"model_{n_features}.bin")}
+    save_model(paths["mmap"], CLASSES, vocabulary, idf, coef, intercept, meta={"version": "bench"})
+
+    paths["pickle"] = os.path.join(directory, f"model_{n_features}.pkl")
+    with open(paths["pickle"], "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    if joblib is not None:
+        paths["joblib"] = os.path.join(directory, f"model_{n_features}.joblib")
+        joblib.dump(state, paths["joblib"])
+    return paths
+
+
+def run_loader(kind, path, repeat):
+    """Best-of-repeat (load, first predict, RSS delta) measured in fresh interpreters"""
+    script = LOADER.format(backend_dir=backend_dir)
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", script, kind, path, SAMPLE_TEXT],
+            check=True, capture_output=True, text=True
+        ).stdout.split()
+        runs.append((float(output[0]), float(output[1]), int(output[2])))
+    return min(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare model artifact load times")
+    parser.add_argument("--sizes", default="10000,50000,200000", help="comma-separated vocabulary sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for n_features in (int(size) for size in args.sizes.split(",")):
+            paths = write_artifacts(directory, n_features)
+            for kind, path in paths.items():
+                load, first_predict, rss = run_loader(kind, path, args.repeat)
+                results.append({
+                    "features": n_features,
+                    "format": kind,
+                    "size_mb": round(os.path.getsize(path) / 1e6, 2),
+                    "load_ms": round(load * 1000, 2),
+                    "first_predict_ms": round(first_predict * 1000, 3),
+                    "rss_mb": round(rss / 1024, 1)
+                })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("=" * 72)
+    print("HackForce AI - Model Artifact Loading Benchmark")
+    print("=" * 72)
+    if joblib is None:
+        print("(joblib not installed - skipping joblib artifacts)")
+    print(f"{'features':>9} {'format':<7} {'size MB':>8} {'load ms':>9} {'1st predict ms':>15} {'RSS +MB':>8}")
+    for row in results:
+        print(f"{row['features']:>9} {row['format']:<7} {row['size_mb']:>8} {row['load_ms']:>9} "
+              f"{row['first_predict_ms']:>15} {row['rss_mb']:>8}")
+
+
+if __name__ == "__main__":
+    main()
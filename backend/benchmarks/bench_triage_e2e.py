@@ -0,0 +1,341 @@
+"""
+Benchmark: end-to-end API throughput and latency against a fake Groq server
+Run from the backend directory:
+    python benchmarks/bench_triage_e2e.py --database-url postgresql://localhost/hackforce_bench [--concurrency 16]
+
+Starts the fake Groq-compatible server from fake_groq_server.py, points the
+Groq client at it, seeds developers and bugs in the given (throwaway) database
+and drives the API in-process through httpx's ASGI transport. Each endpoint
+runs as its own phase at the configured concurrency; the report shows
+throughput, p50/p95/p99 latency, errors, SQL statements, LLM calls and
+rule-based fallbacks per request. Seeded rows are deleted afterwards unless
+--keep-data is given.
+
+The service's LLM counters and circuit breaker are read from /api/metrics
+after the run. Against a fake server that injects no errors every answer
+should come from the LLM: the run fails (exit status 1) if more than
+--max-fallback-rate of the LLM-backed requests fell back to rules.
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import asyncio
+import argparse
+
+# Add backend and benchmarks to path
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (backend_dir, os.path.join(backend_dir, "benchmarks")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from fake_groq_server import FakeGroqConfig, start_fake_groq_server
+
+LLM_ENDPOINTS = ["create_bug", "create_bug_async", "predict"]
+ENDPOINTS = ["create_bug", "create_bug_async", "predict", "list_bugs", "get_bug", "search_bugs", "list_developers", "stats"]
+SKILLS = ["Python", "JavaScript", "React", "PostgreSQL", "Docker", "Kubernetes", "Go", "Java", "AWS", "Redis", "CSS", "iOS"]
+COMPONENTS = ["checkout", "login", "dashboard", "search", "payment API", "profile page", "export job", "mobile app"]
+SYMPTOMS = ["returns 500 error", "crashes on submit", "is very slow", "shows wrong totals", "times out", "renders blank", "leaks memory"]
+
+
+def bug_text(rng: random.Random, run_id: str):
+    """Random bug title/description mentioning a component, a symptom and a skill"""
+    component, symptom, skill = rng.choice(COMPONENTS), rng.choice(SYMPTOMS), rng.choice(SKILLS)
+    title = f"{component.capitalize()} {symptom}"
+    description = f"The {component} {symptom} after the latest {skill} deploy (ref {run_id}-{rng.randrange(10**6)})"
+    return title, description
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+class QueryCounter:
+    """Counts SQL statements sent through the given (sync) engines"""
+
+    def __init__(self, *engines):
+        from sqlalchemy import event
+        self.count = 0
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+
+def seed(args, run_id: str, rng: random.Random):
+    """Insert the benchmark roster and bug backlog; returns the seeded bug IDs"""
+    import crud
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        for i in range(args.developers):
+            crud.create_developer(db, {
+                "name": f"Bench Dev {run_id} {i}",
+                "email": f"bench-{run_id}-{i}@example.com",
+                "skills": rng.sample(SKILLS, rng.randint(1, 4)),
+                "status": "Active"
+            })
+        bug_ids = []
+        for _ in range(args.seed_bugs):
+            title, description = bug_text(rng, run_id)
+            bug = crud.create_bug(db, {
+                "title": title,
+                "description": description,
+                "source": f"benchmark-{run_id}",
+                "severity": rng.choice(["Critical", "High", "Medium", "Low"]),
+                "confidence_score": 0.9,
+                "status": "Open"
+            })
+            bug_ids.append(bug.id)
+        return bug_ids
+    finally:
+        db.close()
+
+
+def cleanup(run_id: str):
+    """Delete every bug, prediction log and developer created by this run"""
+    from database import SessionLocal
+    from models import Bug, Developer, PredictionLog
+
+    db = SessionLocal()
+    try:
+        bug_ids = db.query(Bug.id).filter(Bug.source == f"benchmark-{run_id}")
+        db.query(PredictionLog).filter(PredictionLog.bug_id.in_(bug_ids)).delete(synchronize_session=False)
+        db.query(Bug).filter(Bug.source == f"benchmark-{run_id}").delete(synchronize_session=False)
+        db.query(Developer).filter(Developer.email.like(f"bench-{run_id}-%")).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def make_request(endpoint: str, rng: random.Random, run_id: str, bug_ids):
+    """(method, path, json body) for one request to the named endpoint"""
+    if endpoint in ("create_bug", "create_bug_async", "predict"):
+        title, description = bug_text(rng, run_id)
+        body = {"title": title, "description": description}
+        if endpoint == "predict":
+            return "POST", "/api/predict", body
+        body["source"] = f"benchmark-{run_id}"
+        return "POST", "/api/bugs/async" if endpoint == "create_bug_async" else "/api/bugs", body
+    if endpoint == "list_bugs":
+        return "GET", f"/api/bugs?skip={rng.randrange(max(1, len(bug_ids) - 50))}&limit=50", None
+    if endpoint == "get_bug":
+        return "GET", f"/api/bugs/{rng.choice(bug_ids)}", None
+    if endpoint == "search_bugs":
+        return "GET", f"/api/bugs/search/{rng.choice(COMPONENTS + SYMPTOMS)}?limit=20", None
+    if endpoint == "list_developers":
+        return "GET", "/api/developers", None
+    if endpoint == "stats":
+        return "GET", "/api/stats", None
+    raise ValueError(f"unknown endpoint: {endpoint}")
+
+
+async def fetch_metrics(client):
+    """The API's /api/metrics document"""
+    response = await client.get("/api/metrics")
+    response.raise_for_status()
+    return response.json()
+
+
+def fallback_count(metrics) -> int:
+    """Answers the service produced with its rule-based fallbacks"""
+    return sum(metrics["fallbacks"].values())
+
+
+async def drain_triage_queue(client, timeout: float = 120.0):
+    """Wait for the background triage workers to finish the bugs accepted by /api/bugs/async"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        queue = (await fetch_metrics(client))["triage_queue"]
+        if not queue["depth"] and not queue["in_flight"]:
+            return
+        await asyncio.sleep(0.2)
+    print(f"⚠️  Triage queue not drained after {timeout:.0f}s; async fallbacks may be undercounted")
+
+
+async def run_phase(client, endpoint, args, rng, run_id, bug_ids, counter, fake_config):
+    """Send args.requests requests to one endpoint from args.concurrency workers"""
+    requests = [make_request(endpoint, rng, run_id, bug_ids) for _ in range(args.requests)]
+    latencies, errors = [], 0
+    queries_before = counter.count if counter else 0
+    llm_before = fake_config.stats["requests"] if fake_config else 0
+    fallbacks_before = fallback_count(await fetch_metrics(client))
+
+    async def worker():
+        nonlocal errors
+        while requests:
+            method, path, body = requests.pop()
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                if response.status_code >= 400:
+                    errors += 1
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    if endpoint == "create_bug_async":
+        await drain_triage_queue(client)
+    fallbacks = fallback_count(await fetch_metrics(client)) - fallbacks_before
+
+    return {
+        "endpoint": endpoint,
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "queries_per_request": round((counter.count - queries_before) / len(latencies), 2) if counter and latencies else None,
+        "llm_calls_per_request": round((fake_config.stats["requests"] - llm_before) / len(latencies), 2) if fake_config and latencies else None,
+        "fallbacks": fallbacks
+    }
+
+
+def llm_health(before, after, results):
+    """LLM call outcomes, fallbacks and breaker state over the run"""
+    llm_requests = sum(row["requests"] for row in results if row["endpoint"] in LLM_ENDPOINTS)
+    fallbacks = fallback_count(after) - fallback_count(before)
+    breaker = after["circuit_breaker"]
+    return {
+        "llm_calls_succeeded": after["llm_calls"]["succeeded"] - before["llm_calls"]["succeeded"],
+        "llm_calls_failed": after["llm_calls"]["failed"] - before["llm_calls"]["failed"],
+        "fallbacks": fallbacks,
+        "llm_requests": llm_requests,
+        "fallback_rate": round(fallbacks / llm_requests, 4) if llm_requests else 0.0,
+        "breaker_state": breaker["state"],
+        "breaker_times_opened": breaker["times_opened"] - before["circuit_breaker"]["times_opened"],
+        "breaker_rejected_calls": breaker["rejected_calls"] - before["circuit_breaker"]["rejected_calls"]
+    }
+
+
+async def run(args):
+    import httpx
+
+    rng = random.Random(args.seed)
+    run_id = uuid.uuid4().hex[:8]
+    payload = None
+    if args.payload:
+        with open(args.payload, encoding="utf-8") as f:
+            payload = json.load(f)
+    fake_config, fake_server, app = None, None, None
+
+    if args.base_url:
+        # External server (started against its own fake Groq server): no seeding, query or LLM counts
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60)
+        counter, bug_ids = None, [1]
+    else:
+        fake_config = FakeGroqConfig(args.latency, args.error_rate, args.rate_limit_rate, payload, seed=args.seed)
+        fake_server, fake_url = start_fake_groq_server(fake_config)
+
+        # Configure the API before importing it: the database and Groq client read the environment at import
+        os.environ["DATABASE_URL"] = args.database_url
+        os.environ["GROQ_API_KEY"] = "fake"
+        os.environ["GROQ_BASE_URL"] = fake_url
+        os.environ.setdefault("LLM_REQUESTS_PER_MINUTE", str(args.llm_requests_per_minute))
+        os.environ.setdefault("LLM_TOKENS_PER_MINUTE", str(args.llm_requests_per_minute * 1000))
+
+        from app import app
+        from database import async_engine, engine
+
+        await app.router.startup()
+        bug_ids = seed(args, run_id, rng)
+        # Endpoints use the async engine; background threads use the sync one
+        counter = QueryCounter(engine, async_engine.sync_engine)
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60)
+
+    results = []
+    try:
+        metrics_before = await fetch_metrics(client)
+        for endpoint in args.endpoints:
+            results.append(await run_phase(client, endpoint, args, rng, run_id, bug_ids, counter, fake_config))
+        health = llm_health(metrics_before, await fetch_metrics(client), results)
+    finally:
+        await client.aclose()
+        if app is not None:
+            await app.router.shutdown()
+            if not args.keep_data:
+                cleanup(run_id)
+        if fake_server is not None:
+            fake_server.shutdown()
+    return results, health
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end API benchmark against a fake Groq server")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"), help="throwaway PostgreSQL database (or BENCH_DATABASE_URL)")
+    parser.add_argument("--base-url", help="benchmark an already running API instead of an in-process app")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS), help="comma-separated: " + ",".join(ENDPOINTS))
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="requests per endpoint")
+    parser.add_argument("--developers", type=int, default=50)
+    parser.add_argument("--seed-bugs", type=int, default=500)
+    parser.add_argument("--latency", default="lognormal:0.4,0.5", help="fake Groq latency: fixed:S | uniform:LO,HI | lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of fake Groq responses that are 500s")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of fake Groq responses that are 429s")
+    parser.add_argument("--payload", help="JSON file returned as every completion's content")
+    parser.add_argument("--llm-requests-per-minute", type=int, default=100000, help="scheduler limit (default effectively unlimited)")
+    parser.add_argument("--max-fallback-rate", type=float, default=0.01,
+                        help="fail if more LLM-backed requests than this fell back to rules (not checked when errors are injected)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep-data", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+    args.endpoints = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+
+    if not args.base_url and not args.database_url:
+        parser.error("--database-url (or BENCH_DATABASE_URL) is required unless --base-url is given")
+
+    results, health = asyncio.run(run(args))
+    # Injected 500s and 429s are meant to exercise the fallbacks
+    failures_injected = args.error_rate > 0 or args.rate_limit_rate > 0
+    healthy = failures_injected or health["fallback_rate"] <= args.max_fallback_rate
+
+    if args.json:
+        print(json.dumps({"phases": results, "llm_health": {**health, "passed": healthy}}, indent=2))
+        sys.exit(0 if healthy else 1)
+
+    print("=" * 60)
+    print(f"End-to-end API benchmark (concurrency {args.concurrency}, fake Groq latency {args.latency})")
+    print("=" * 60)
+    print(f"{'endpoint':<18}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}{'SQL/req':>9}{'LLM/req':>9}{'fallbacks':>11}")
+    for row in results:
+        queries = f"{row['queries_per_request']:.2f}" if row["queries_per_request"] is not None else "-"
+        llm_calls = f"{row['llm_calls_per_request']:.2f}" if row["llm_calls_per_request"] is not None else "-"
+        print(
+            f"{row['endpoint']:<18}{row['throughput_rps']:>9.1f}{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}"
+            f"{row['p99_ms']:>10.2f}{row['errors']:>8}{queries:>9}{llm_calls:>9}{row['fallbacks']:>11}"
+        )
+
+    print()
+    print(
+        f"LLM calls: {health['llm_calls_succeeded']} succeeded, {health['llm_calls_failed']} failed; "
+        f"fallbacks: {health['fallbacks']} for {health['llm_requests']} LLM-backed requests "
+        f"({health['fallback_rate']:.1%})"
+    )
+    print(
+        f"Circuit breaker: {health['breaker_state']}, opened {health['breaker_times_opened']} times, "
+        f"{health['breaker_rejected_calls']} calls rejected"
+    )
+    if not healthy:
+        print()
+        print("!" * 60)
+        print(f"❌ FAILED: {health['fallback_rate']:.1%} of LLM-backed requests fell back to rules")
+        print(f"   (limit {args.max_fallback_rate:.1%}). The timings above do not measure the LLM path.")
+        print("!" * 60)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Fake Groq-compatible HTTP server for offline benchmarks
+Serves POST .../chat/completions with configurable latency, error and 429
+rates, answering classification, developer, triage and batch prompts with
+valid JSON so the whole triage path runs without network access.
+
+Run standalone from the backend directory:
+    python benchmarks/fake_groq_server.py --port 8787 --latency lognormal:0.4,0.5 --error-rate 0.02
+then point the API at it:
+    GROQ_API_KEY=fake GROQ_BASE_URL=http://127.0.0.1:8787 uvicorn app:app
+"""
+
+import re
+import json
+import math
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+SEVERITIES = ["Critical", "High", "Medium", "Low"]
+_DEVELOPER_RE = re.compile(r"^- (.+?): Skills:", re.MULTILINE)
+_BATCH_ID_RE = re.compile(r"^Bug (\d+):", re.MULTILINE)
+
+
+class LatencyModel:
+    """
+    Response delay distribution, parsed from a spec string:
+        fixed:SECONDS | uniform:LOW,HIGH | lognormal:MEDIAN,SIGMA
+    """
+
+    def __init__(self, spec: str = "fixed:0"):
+        self.spec = spec
+        kind, _, params = spec.partition(":")
+        self.kind = kind
+        self.params = [float(value) for value in params.split(",")] if params else [0.0]
+        if kind not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"unknown latency distribution: {spec!r}")
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(self.params[0], self.params[1])
+        median, sigma = self.params
+        return rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+
+
+class FakeGroqConfig:
+    """Behaviour of the fake server (all rates are probabilities per request)"""
+
+    def __init__(
+        self,
+        latency: str = "fixed:0",
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        payload: Optional[Dict] = None,
+        tokens_per_minute: int = 1_000_000,
+        seed: int = 42
+    ):
+        self.latency = LatencyModel(latency)
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.payload = payload  # fixed JSON content returned for every prompt, if set
+        self.tokens_per_minute = tokens_per_minute
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0, "rate_limited": 0}
+
+
+def build_content(prompt: str, rng: random.Random) -> Dict:
+    """A plausible JSON answer for any of the API's prompt shapes"""
+    severity = rng.choice(SEVERITIES)
+    confidence = round(rng.uniform(0.6, 0.98), 2)
+    classification = {
+        "severity": severity,
+        "confidence": confidence,
+        "reasoning": "Synthetic classification from the fake Groq server",
+        "impact_areas": ["benchmark"]
+    }
+
+    batch_ids = _BATCH_ID_RE.findall(prompt)
+    if '"results"' in prompt and batch_ids:
+        return {"results": [
+            {"id": int(bug_id), **classification, "severity": rng.choice(SEVERITIES)}
+            for bug_id in batch_ids
+        ]}
+
+    developers = _DEVELOPER_RE.findall(prompt)
+    if "developer_name" in prompt and developers:
+        developer = {
+            "developer_name": rng.choice(developers),
+            "confidence": confidence,
+            "reasoning": "Synthetic developer match from the fake Groq server"
+        }
+        if "Severity Levels" in prompt:
+            return {
+                **classification,
+                "developer_name": developer["developer_name"],
+                "developer_confidence": confidence,
+                "developer_reasoning": developer["reasoning"]
+            }
+        return developer
+
+    return classification
+
+
+class FakeGroqHandler(BaseHTTPRequestHandler):
+    """OpenAI/Groq chat completions endpoint"""
+
+    server_version = "FakeGroq/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            config = self.server.config
+            with config.lock:
+                self._send(200, dict(config.stats))
+        else:
+            self._send(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if not self.path.endswith("/chat/completions"):
+            self._send(404, {"error": {"message": "not found"}})
+            return
+
+        config = self.server.config
+        with config.lock:
+            config.stats["requests"] += 1
+            delay = config.latency.sample(config.rng)
+            roll = config.rng.random()
+            rng = random.Random(config.rng.random())
+        time.sleep(delay)
+
+        if roll < config.rate_limit_rate:
+            with config.lock:
+                config.stats["rate_limited"] += 1
+            self._send(429, {"error": {"message": "Rate limit reached", "type": "tokens"}},
+                       {"retry-after": "1", **self._rate_limit_headers(0)})
+            return
+        if roll < config.rate_limit_rate + config.error_rate:
+            with config.lock:
+                config.stats["errors"] += 1
+            self._send(500, {"error": {"message": "Synthetic upstream error"}})
+            return
+
+        request = json.loads(body or b"{}")
+        prompt = "\n".join(message.get("content", "") for message in request.get("messages", []))
+        content = config.payload if config.payload is not None else build_content(prompt, rng)
+        prompt_tokens = len(prompt) // 4
+        completion = json.dumps(content)
+        completion_tokens = len(completion) // 4
+
+        self._send(200, {
+            "id": f"chatcmpl-fake-{config.stats['requests']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": completion},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }, self._rate_limit_headers(config.tokens_per_minute - prompt_tokens - completion_tokens))
+
+    def _rate_limit_headers(self, remaining_tokens: int) -> Dict[str, str]:
+        config = self.server.config
+        return {
+            "x-ratelimit-limit-tokens": str(config.tokens_per_minute),
+            "x-ratelimit-remaining-tokens": str(max(0, remaining_tokens)),
+            "x-ratelimit-reset-tokens": "1s"
+        }
+
+    def _send(self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def start_fake_groq_server(config: FakeGroqConfig, host: str = "127.0.0.1", port: int = 0):
+    """Start the server on a background thread; returns (server, base_url)"""
+    server = ThreadingHTTPServer((host, port), FakeGroqHandler)
+    server.daemon_threads = True
+    server.config = config
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Groq-compatible chat completions server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency", default="lognormal:0.4,0.5", help="fixed:S | uniform:LO,HI | lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of requests answered with 429")
+    parser.add_argument("--payload", help="JSON file whose content is returned for every prompt")
+    parser.add_argument("--tokens-per-minute", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    payload = None
+    if args.payload:
+        with open(args.payload, encoding="utf-8") as f:
+            payload = json.load(f)
+
+    config = FakeGroqConfig(args.latency, args.error_rate, args.rate_limit_rate, payload, args.tokens_per_minute)
+    server, base_url = start_fake_groq_server(config, args.host, args.port)
+    print(f"🤖 Fake Groq server listening on {base_url} (latency {args.latency}, errors {args.error_rate:.0%})")
+    print(f"   GROQ_API_KEY=fake GROQ_BASE_URL={base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
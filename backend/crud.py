@@ -4,10 +4,18 @@ Database operations for bugs, developers, and predictions
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
-from typing import List, Optional
-from models import Bug, Developer, PredictionLog
-from datetime import datetime
+from sqlalchemy import desc, func, insert, select, tuple_, update
+from sqlalchemy.exc import SQLAlchemyError
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from collections import Counter
+from models import Bug, Developer, PredictionLog, PENDING_SEVERITY, SEARCH_CONFIG, has_trigram_extension
+from datetime import datetime, timedelta, timezone
+from services.skill_index import get_skill_index
+from services.roster_cache import get_roster_cache
+from services.bug_search_index import (
+    BUG_SEARCH_BACKEND, BUG_SEARCH_BUILD_BATCH, BugSearchIndex, bug_version, get_bug_search_index
+)
+from services.stats_cache import SEVERITIES, STATUSES, format_counters, get_stats_cache
 
 # ============================================================================
 # Bug CRUD Operations
@@ -17,13 +25,107 @@ def create_bug(db: Session, bug_data: dict) -> Bug:
     """
     Create a new bug in the database
     """
-    db_bug = Bug(**bug_data)
+    db_bug = Bug(**_with_developer_id(db, bug_data))
     db.add(db_bug)
-    db.commit()
-    db.refresh(db_bug)
+    return _commit_new_bug(db, db_bug)
+
+
+def create_bug_with_prediction(db: Session, bug_data: dict, prediction_data: dict) -> Bug:
+    """
+    Create a bug and its prediction log in one transaction
+
+    Two INSERTs (the bug's returning its id and timestamps, then the log
+    referencing it), plus the assignee's workload UPDATE, and a single
+    commit, so a bug is never stored without its prediction log.
+    """
+    db_bug = Bug(**_with_developer_id(db, bug_data))
+    db_bug.predictions.append(PredictionLog(**prediction_data))
+    db.add(db_bug)
+    return _commit_new_bug(db, db_bug)
+
+
+def _commit_new_bug(db: Session, db_bug: Bug) -> Bug:
+    """Flush a new bug, count it in its assignee's workload, commit, then update the caches"""
+    db.flush()
+    developers = _update_workloads(db, [(None, db_bug.to_dict())])
+    _commit_loaded(db, db_bug)
+    bug = db_bug.to_dict()
+    _after_commit(db, _bug_written, bug)
+    _after_commit(db, get_stats_cache().bug_added, _stats_fields(bug))
+    _after_commit(db, _workloads_written, developers)
     return db_bug
 
 
+def bulk_create_bugs(
+    db: Session,
+    rows: List[dict],
+    predictions: Optional[List[Optional[dict]]] = None
+) -> Tuple[List[Optional[int]], List[Optional[str]]]:
+    """
+    Insert many bugs, and optionally their prediction logs, in one transaction
+
+    Rows go out as multi-row INSERT ... VALUES ... RETURNING id statements and
+    every row must have the same keys. predictions, if given, is aligned with
+    rows (None where a row has no log). If the chunk fails, rows are retried
+    one at a time in savepoints so only the offending rows are rejected.
+
+    Assignee names of rows without an assigned_developer_id are resolved to
+    developer IDs, and the assignees' workloads are updated in the same
+    transaction.
+    
+    Returns (ids, errors) aligned with rows: the new bug ID or None, and an
+    error message or None.
+    """
+    if rows and "assigned_developer" in rows[0] and "assigned_developer_id" not in rows[0]:
+        developer_ids = resolve_developer_ids(db, (row["assigned_developer"] for row in rows))
+        rows = [_named_developer_id(row, developer_ids) for row in rows]
+    
+    try:
+        ids = _insert_bugs(db, rows, predictions)
+        errors = [None] * len(rows)
+    except SQLAlchemyError:
+        db.rollback()
+        ids, errors = [], []
+        for index, row in enumerate(rows):
+            try:
+                with db.begin_nested():
+                    ids.extend(_insert_bugs(db, [row], [predictions[index]] if predictions else None))
+                errors.append(None)
+            except SQLAlchemyError as e:
+                ids.append(None)
+                errors.append(str(getattr(e, "orig", None) or e).strip().splitlines()[0])
+    
+    developers = _update_workloads(db, [
+        (None, {"status": "Open", **row}) for row, bug_id in zip(rows, ids) if bug_id is not None
+    ])
+    db.commit()
+    _after_commit(db, _workloads_written, developers)
+    _after_commit(db, _bugs_added, [{**row, "id": bug_id} for row, bug_id in zip(rows, ids) if bug_id is not None])
+    return ids, errors
+
+
+def _bugs_added(bugs: List[dict]) -> None:
+    """Apply bulk-inserted bugs to the search index and dashboard counters"""
+    index = get_bug_search_index()
+    if index.active:
+        index.upsert_many(bugs)
+    cache = get_stats_cache()
+    for bug in bugs:
+        cache.bug_added(_stats_fields({"status": "Open", **bug}))
+
+
+def _insert_bugs(db: Session, rows: List[dict], predictions: Optional[List[Optional[dict]]]) -> List[int]:
+    ids = db.scalars(insert(Bug).returning(Bug.id, sort_by_parameter_order=True), rows).all()
+    logs = [
+        {"bug_id": bug_id, **prediction}
+        for bug_id, prediction in zip(ids, predictions or [])
+        if prediction
+    ]
+    if logs:
+        db.execute(insert(PredictionLog), logs)
+    return ids
+
+
 def get_bug(db: Session, bug_id: int) -> Optional[Bug]:
     """
     Get a bug by ID
@@ -37,10 +139,16 @@ def get_bugs(
     limit: int = 100,
     severity: Optional[str] = None,
     status: Optional[str] = None,
-    source: Optional[str] = None
+    source: Optional[str] = None,
+    after: Optional[Tuple[datetime, int]] = None
 ) -> List[Bug]:
     """
-    Get list of bugs with optional filters
+    Get list of bugs with optional filters, newest first
+
+    after is the (created_at, id) of the last bug on the previous page
+    (keyset pagination): the page starts right after it via the
+    (created_at DESC, id DESC) index, so deep pages cost the same as the
+    first and don't shift when bugs are inserted.
     """
     query = db.query(Bug)
     
@@ -52,41 +160,129 @@ def get_bugs(
     if source:
         query = query.filter(Bug.source == source)
     
-    # Order by created_at descending and apply pagination
-    return query.order_by(desc(Bug.created_at)).offset(skip).limit(limit).all()
+    if after is not None:
+        query = query.filter(tuple_(Bug.created_at, Bug.id) < tuple_(*after))
+    
+    # Newest first; id breaks ties between bugs created in the same instant
+    return query.order_by(desc(Bug.created_at), desc(Bug.id)).offset(skip).limit(limit).all()
 
 
 def update_bug(db: Session, bug_id: int, bug_data: dict) -> Optional[Bug]:
     """
     Update a bug
-    """
-    db_bug = db.query(Bug).filter(Bug.id == bug_id).first()
+    
+    The row is locked until commit so the workload change derived from its
+    old and new assignee/status cannot race with another write to the bug.
+    """
+    # Reassignment: store the new assignee's ID (None if the name matches no
+    # developer), resolved before the row lock is taken
+    name = bug_data.get("assigned_developer")
+    if name is not None:
+        bug_data = {**bug_data, "assigned_developer_id": resolve_developer_ids(db, [name]).get(name)}
+    
+    db_bug = _lock_bug(db, Bug.id == bug_id)
     if not db_bug:
+        db.rollback()
         return None
     
-    # Update fields
+    old_bug = db_bug.to_dict()
+    
+    # Update fields (a None assigned_developer_id is written: the name matched nobody)
     for key, value in bug_data.items():
-        if value is not None and hasattr(db_bug, key):
+        if (value is not None or key == "assigned_developer_id") and hasattr(db_bug, key):
             setattr(db_bug, key, value)
     
+    db.flush()
+    developers = _update_workloads(db, [(old_bug, db_bug.to_dict())])
     db.commit()
     db.refresh(db_bug)
+    new_bug = db_bug.to_dict()
+    _after_commit(db, _bug_written, new_bug)
+    _after_commit(db, get_stats_cache().bug_changed, _stats_fields(old_bug), _stats_fields(new_bug))
+    _after_commit(db, _workloads_written, developers)
     return db_bug
 
 
 def delete_bug(db: Session, bug_id: int) -> bool:
     """
-    Delete a bug
+    Delete a bug (and release it from its assignee's workload)
     """
-    db_bug = db.query(Bug).filter(Bug.id == bug_id).first()
+    db_bug = _lock_bug(db, Bug.id == bug_id)
     if not db_bug:
+        db.rollback()
         return False
     
+    old_bug = db_bug.to_dict()
     db.delete(db_bug)
+    developers = _update_workloads(db, [(old_bug, None)])
     db.commit()
+    
+    _after_commit(db, _bug_removed, old_bug)
+    _after_commit(db, _workloads_written, developers)
     return True
 
 
+def _bug_removed(bug: dict) -> None:
+    """Drop a deleted bug from the search index and dashboard counters"""
+    index = get_bug_search_index()
+    if index.active:
+        index.remove(bug["id"])
+    get_stats_cache().bug_removed(_stats_fields(bug))
+
+
+def get_pending_bug_ids(db: Session, older_than_seconds: float = 0, limit: int = 500) -> List[int]:
+    """
+    Get IDs of bugs still waiting for background triage, oldest first
+    """
+    query = db.query(Bug.id).filter(Bug.severity == PENDING_SEVERITY)
+    if older_than_seconds:
+        query = query.filter(Bug.created_at < func.now() - timedelta(seconds=older_than_seconds))
+    return [bug_id for bug_id, in query.order_by(Bug.created_at).limit(limit).all()]
+
+
+def complete_pending_bug(db: Session, bug_id: int, bug_data: dict, prediction_data: dict) -> bool:
+    """
+    Apply a background triage result to a pending bug and log the prediction
+    in one transaction. Returns False if the bug is gone or has already been
+    triaged (e.g. by another worker), in which case nothing is written.
+    The assignee's workload is updated in the same transaction.
+    """
+    # A worker waiting on the lock sees the bug no longer Pending once the first commits
+    db_bug = _lock_bug(db, Bug.id == bug_id, Bug.severity == PENDING_SEVERITY)
+    if not db_bug:
+        db.rollback()
+        return False
+    
+    old_bug = db_bug.to_dict()
+    bug_data = _with_developer_id(db, bug_data)
+    for key, value in bug_data.items():
+        setattr(db_bug, key, value)
+    db.add(PredictionLog(bug_id=bug_id, **prediction_data))
+    db.flush()
+    new_bug = db_bug.to_dict()
+    developers = _update_workloads(db, [(old_bug, new_bug)])
+    db.commit()
+    
+    _after_commit(db, _bug_triaged, old_bug, new_bug)
+    _after_commit(db, _workloads_written, developers)
+    return True
+
+
+def _bug_triaged(old_bug: dict, new_bug: dict) -> None:
+    """Apply a completed background triage to the search index and dashboard counters"""
+    index = get_bug_search_index()
+    if index.active:
+        index.set_attributes(
+            new_bug["id"], severity=new_bug["severity"], status=new_bug["status"], updated_at=new_bug.get("updated_at")
+        )
+    get_stats_cache().bug_changed(_stats_fields(old_bug), _stats_fields(new_bug))
+
+
+def _lock_bug(db: Session, *criteria) -> Optional[Bug]:
+    """Load a bug with SELECT ... FOR UPDATE, overwriting any stale copy in the session"""
+    return db.query(Bug).filter(*criteria).with_for_update().populate_existing().first()
+
+
 def get_bug_count(db: Session) -> int:
     """
     Get total count of bugs
@@ -110,6 +306,14 @@ def get_bugs_by_severity_count(db: Session) -> dict:
 # Developer CRUD Operations
 # ============================================================================
 
+# Workload breakdown key for each bug status
+WORKLOAD_STATUS_KEYS = {
+    "Open": "open_bugs",
+    "In Progress": "in_progress_bugs",
+    "Resolved": "resolved_bugs",
+    "Closed": "closed_bugs"
+}
+
 def create_developer(db: Session, developer_data: dict) -> Developer:
     """
     Create a new developer
@@ -118,6 +322,8 @@ def create_developer(db: Session, developer_data: dict) -> Developer:
     db.add(db_developer)
     db.commit()
     db.refresh(db_developer)
+    _after_commit(db, _developer_written, db_developer.to_dict())
+    _after_commit(db, get_stats_cache().developers_changed, 1)
     return db_developer
 
 
@@ -138,18 +344,26 @@ def get_developer_by_email(db: Session, email: str) -> Optional[Developer]:
 def get_developers(
     db: Session,
     skip: int = 0,
-    limit: int = 100,
-    status: Optional[str] = None
+    limit: Optional[int] = 100,
+    status: Optional[str] = None,
+    after_id: Optional[int] = None
 ) -> List[Developer]:
     """
-    Get list of developers with optional filters
+    Get list of developers with optional filters (limit=None returns every match)
+
+    after_id is the id of the last developer on the previous page (keyset pagination).
     """
     query = db.query(Developer)
     
     if status:
         query = query.filter(Developer.status == status)
+    if after_id is not None:
+        query = query.filter(Developer.id > after_id)
     
-    return query.offset(skip).limit(limit).all()
+    query = query.order_by(Developer.id).offset(skip)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
 
 
 def update_developer(db: Session, developer_id: int, developer_data: dict) -> Optional[Developer]:
@@ -166,6 +380,7 @@ def update_developer(db: Session, developer_id: int, developer_data: dict) -> Op
     
     db.commit()
     db.refresh(db_developer)
+    _after_commit(db, _developer_written, db_developer.to_dict())
     return db_developer
 
 
@@ -179,39 +394,356 @@ def delete_developer(db: Session, developer_id: int) -> bool:
     
     db.delete(db_developer)
     db.commit()
+    _after_commit(db, _developer_deleted, developer_id)
     return True
 
 
+def get_active_roster(db: Session) -> List[dict]:
+    """
+    Get every Active developer as a dict (read-only), served from the
+    versioned roster cache; developer writes below invalidate it
+    """
+    return get_roster_cache().get(
+        lambda: [dev.to_dict() for dev in get_developers(db, status="Active", limit=None)]
+    )
+
+
 def get_developer_workload(db: Session, developer_id: int) -> dict:
     """
     Get workload statistics for a developer
     """
-    developer = db.query(Developer).filter(Developer.id == developer_id).first()
-    if not developer:
-        return None
+    workloads = get_developers_workload(db, developer_ids=[developer_id])
+    return workloads[0] if workloads else None
+
+
+def get_developers_workload(
+    db: Session,
+    status: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    developer_ids: Optional[List[int]] = None
+) -> List[dict]:
+    """
+    Get workload statistics for every developer (or the given ones), by id
+
+    One statement: the assigned bugs are counted with a GROUP BY over
+    (assigned_developer_id, status), served by idx_bugs_assigned_developer,
+    and left-joined to developers so those without bugs report zeros.
+    status and the created_at bounds restrict which bugs are counted.
+    """
+    counts = db.query(
+        Bug.assigned_developer_id.label("developer_id"),
+        Bug.status.label("status"),
+        func.count(Bug.id).label("bugs")
+    ).filter(Bug.assigned_developer_id.isnot(None))
     
-    total_bugs = db.query(Bug).filter(Bug.assigned_developer_id == developer_id).count()
-    open_bugs = db.query(Bug).filter(
-        Bug.assigned_developer_id == developer_id,
-        Bug.status == "Open"
-    ).count()
-    in_progress = db.query(Bug).filter(
-        Bug.assigned_developer_id == developer_id,
-        Bug.status == "In Progress"
-    ).count()
-    resolved = db.query(Bug).filter(
-        Bug.assigned_developer_id == developer_id,
-        Bug.status == "Resolved"
-    ).count()
+    if status:
+        counts = counts.filter(Bug.status == status)
+    if created_after:
+        counts = counts.filter(Bug.created_at >= created_after)
+    if created_before:
+        counts = counts.filter(Bug.created_at < created_before)
+    if developer_ids is not None:
+        counts = counts.filter(Bug.assigned_developer_id.in_(developer_ids))
+    counts = counts.group_by(Bug.assigned_developer_id, Bug.status).subquery()
     
-    return {
-        "developer_id": developer_id,
-        "developer_name": developer.name,
-        "total_bugs": total_bugs,
-        "open_bugs": open_bugs,
-        "in_progress_bugs": in_progress,
-        "resolved_bugs": resolved
-    }
+    query = db.query(Developer.id, Developer.name, counts.c.status, counts.c.bugs).outerjoin(
+        counts, counts.c.developer_id == Developer.id
+    )
+    if developer_ids is not None:
+        query = query.filter(Developer.id.in_(developer_ids))
+    
+    workloads = {}
+    for developer_id, name, bug_status, bugs in query.order_by(Developer.id):
+        workload = workloads.get(developer_id)
+        if workload is None:
+            workload = workloads[developer_id] = {
+                "developer_id": developer_id,
+                "developer_name": name,
+                "total_bugs": 0,
+                "open_bugs": 0,
+                "in_progress_bugs": 0,
+                "resolved_bugs": 0,
+                "closed_bugs": 0
+            }
+        if bug_status in WORKLOAD_STATUS_KEYS:
+            workload[WORKLOAD_STATUS_KEYS[bug_status]] = bugs
+        if bugs:
+            workload["total_bugs"] += bugs
+    return list(workloads.values())
+
+
+# ============================================================================
+# Developer Skill Index
+# ============================================================================
+
+def refresh_skill_index(db: Session, force: bool = False):
+    """
+    (Re)build the in-memory skill index from the developers table when it
+    has never been built or its TTL has expired
+    """
+    index = get_skill_index()
+    if force or index.is_stale():
+        index.build(dev.to_dict() for dev in db.query(Developer).all())
+    return index
+
+
+def get_developers_by_skills(
+    db: Session,
+    skills: List[str],
+    status: Optional[str] = None,
+    skip: int = 0,
+    limit: Optional[int] = 100
+) -> List[dict]:
+    """
+    Get developers having all of the given skills (aliases such as "js"
+    accepted), least loaded first, as dicts served from the skill index
+    """
+    developers = refresh_skill_index(db).query(skills, status=status)
+    return developers[skip:skip + limit] if limit is not None else developers[skip:]
+
+
+def _developer_written(developer: dict) -> None:
+    """Invalidate the roster cache and apply a developer write to the skill index"""
+    get_roster_cache().invalidate()
+    _index_developers([developer])
+
+
+def _developer_deleted(developer_id: int) -> None:
+    """Drop a deleted developer from the counters, roster cache and skill index"""
+    get_stats_cache().developers_changed(-1)
+    get_roster_cache().invalidate()
+    if get_skill_index().is_built:
+        get_skill_index().remove(developer_id)
+
+
+# ============================================================================
+# Developer Workload
+# ============================================================================
+
+# Bugs in these statuses count towards their assigned developer's workload
+ACTIVE_BUG_STATUSES = ("Open", "In Progress")
+
+# Assignee name used when triage found nobody; never a developer
+UNASSIGNED = "Unassigned"
+
+
+def resolve_developer_ids(db: Session, names: Iterable[Optional[str]]) -> Dict[str, int]:
+    """
+    Map developer names to IDs (the lowest ID when a name is shared)
+
+    Active developers come from the cached roster; other names, such as an
+    Inactive developer assigned by hand, are looked up in one query. Names
+    matching no developer are left out.
+    """
+    names = {name for name in names if name and name != UNASSIGNED}
+    if not names:
+        return {}
+    
+    developer_ids = {}
+    for dev in get_active_roster(db):
+        if dev["name"] in names:
+            developer_ids.setdefault(dev["name"], dev["id"])
+    
+    missing = names - developer_ids.keys()
+    if missing:
+        query = db.query(Developer.name, func.min(Developer.id)).filter(Developer.name.in_(missing))
+        developer_ids.update(query.group_by(Developer.name).all())
+    return developer_ids
+
+
+def _with_developer_id(db: Session, bug_data: dict) -> dict:
+    """
+    bug_data with assigned_developer_id set. Triage results carry the ID of
+    the roster entry they chose and are kept as they are; a name supplied by
+    a client (without an ID) is resolved.
+    """
+    if "assigned_developer_id" in bug_data or "assigned_developer" not in bug_data:
+        return bug_data
+    return _named_developer_id(bug_data, resolve_developer_ids(db, [bug_data["assigned_developer"]]))
+
+
+def _named_developer_id(bug_data: dict, developer_ids: Dict[str, int]) -> dict:
+    """bug_data with assigned_developer_id set from its assigned_developer name"""
+    return {**bug_data, "assigned_developer_id": developer_ids.get(bug_data["assigned_developer"])}
+
+
+def _update_workloads(db: Session, changes: Iterable[Tuple[Optional[dict], Optional[dict]]]) -> List[dict]:
+    """
+    Apply the workload changes implied by bug writes, in the caller's transaction
+
+    changes holds (old, new) bug dicts, None for the old side of an insert
+    and the new side of a delete. A bug counts towards its assignee while
+    its status is in ACTIVE_BUG_STATUSES, so assigning, reassigning,
+    resolving, reopening and deleting all net out to per-developer deltas.
+    Each is applied with an atomic UPDATE ... SET workload = workload + delta,
+    in developer ID order so concurrent writers lock rows in the same order.
+    Returns the updated developers, for _workloads_written() after commit.
+    """
+    deltas = _workload_deltas(changes)
+    developers = []
+    for developer_id in sorted(deltas):
+        statement = update(Developer).where(Developer.id == developer_id).values(
+            workload=func.greatest(func.coalesce(Developer.workload, 0) + deltas[developer_id], 0)
+        ).returning(Developer)
+        developers.extend(dev.to_dict() for dev in db.scalars(statement))
+    return developers
+
+
+def _workload_deltas(changes: Iterable[Tuple[Optional[dict], Optional[dict]]]) -> Dict[int, int]:
+    """Net workload change per developer ID for (old, new) bug dicts, without zeros"""
+    deltas = Counter()
+    for old, new in changes:
+        for bug, sign in ((old, -1), (new, 1)):
+            if bug and bug.get("assigned_developer_id") is not None and bug.get("status") in ACTIVE_BUG_STATUSES:
+                deltas[bug["assigned_developer_id"]] += sign
+    return {developer_id: delta for developer_id, delta in deltas.items() if delta}
+
+
+def _workloads_written(developers: List[dict]) -> None:
+    """
+    Apply workload changes to the cached roster entries (keeping the cache warm
+    for the next triage) and to the skill index
+    """
+    if not developers:
+        return
+    get_roster_cache().update(developers)
+    _index_developers(developers)
+
+
+def _index_developers(developers: List[dict]) -> None:
+    """Apply developer changes to the skill index, if it is built"""
+    index = get_skill_index()
+    if index.is_built:
+        for developer in developers:
+            index.upsert(developer)
+
+
+def reconcile_developer_workloads(db: Session) -> int:
+    """
+    Recount every developer's workload from the bugs table and correct those
+    that drifted (bugs written outside crud.py, manual edits), in one UPDATE
+    with a correlated COUNT per developer served by idx_bugs_assigned_developer.
+    Returns the number of developers corrected.
+    """
+    active_bugs = select(func.count(Bug.id)).where(
+        Bug.assigned_developer_id == Developer.id,
+        Bug.status.in_(ACTIVE_BUG_STATUSES)
+    ).scalar_subquery()
+    statement = update(Developer).where(
+        Developer.workload.is_distinct_from(active_bugs)
+    ).values(workload=active_bugs).returning(Developer)
+    
+    developers = [dev.to_dict() for dev in db.scalars(statement)]
+    db.commit()
+    _after_commit(db, _workloads_written, developers)
+    return len(developers)
+
+
+# ============================================================================
+# Bug Search Index (BUG_SEARCH_BACKEND=memory)
+# ============================================================================
+
+# Fields the in-process search index needs from each bug
+_SEARCH_INDEX_COLUMNS = (Bug.id, Bug.title, Bug.description, Bug.severity, Bug.status, Bug.updated_at)
+
+# Bugs updated this long before the sync watermark are re-read, covering
+# transactions that were still in flight (updated_at is set when they start)
+SEARCH_INDEX_SYNC_MARGIN = timedelta(seconds=60)
+
+
+def load_bug_search_index(db: Session, snapshot_path: Optional[str] = None) -> BugSearchIndex:
+    """
+    Fill the in-process search index: restore the snapshot at snapshot_path
+    if there is a usable one, otherwise stream every bug from the database in
+    keyset batches. Writes in this process are applied by the crud hooks from
+    the start; everything else is caught up by sync_bug_search_index.
+    
+    A build sets the sync watermark to the newest updated_at it read, so the
+    catch-up sync only re-reads bugs near or after it, and finds those it
+    already indexed unchanged.
+    """
+    index = get_bug_search_index()
+    index.activate()
+    
+    taken_at = index.restore(snapshot_path) if snapshot_path else None
+    if taken_at is None:
+        last_id, watermark = 0, 0.0
+        while True:
+            rows = db.query(*_SEARCH_INDEX_COLUMNS).filter(Bug.id > last_id).order_by(Bug.id).limit(BUG_SEARCH_BUILD_BATCH).all()
+            if not rows:
+                break
+            index.upsert_many(dict(row._mapping) for row in rows)
+            last_id = rows[-1].id
+            watermark = max(watermark, max(bug_version(row.updated_at) for row in rows))
+        index.synced_at = watermark
+    else:
+        index.synced_at = taken_at
+    
+    sync_bug_search_index(db, full=taken_at is not None)
+    index.mark_built()
+    return index
+
+
+def sync_bug_search_index(db: Session, full: bool = False) -> None:
+    """
+    Re-read bugs updated since the index was last synced: writes made by other
+    worker processes, or made while a build was reading older rows. With full,
+    also drop bugs that no longer exist (deleted elsewhere).
+    
+    The watermark is the newest updated_at read so far (the database's clock);
+    bugs the index already holds at the same updated_at are skipped.
+    """
+    index = get_bug_search_index()
+    if full:
+        index.retain(bug_id for bug_id, in db.query(Bug.id))
+    
+    since = datetime.fromtimestamp(index.synced_at or 0, timezone.utc) - SEARCH_INDEX_SYNC_MARGIN
+    rows = db.query(*_SEARCH_INDEX_COLUMNS).filter(Bug.updated_at >= since).all()
+    index.upsert_many(dict(row._mapping) for row in rows)
+    index.synced_at = max([index.synced_at or 0.0] + [bug_version(row.updated_at) for row in rows])
+    db.commit()
+
+
+def search_bugs_in_memory(
+    db: Session,
+    search_term: str,
+    skip: int = 0,
+    limit: int = 50,
+    severity: Optional[str] = None,
+    status: Optional[str] = None
+) -> List[Tuple[Bug, float]]:
+    """
+    search_bugs answered by the BM25 index: ranked IDs from memory, then one
+    primary-key query for the rows. Until the index has finished loading,
+    falls back to an unranked substring scan (score 0).
+    """
+    index = get_bug_search_index()
+    if not index.is_built:
+        pattern = f"%{search_term}%"
+        query = db.query(Bug).filter(Bug.title.ilike(pattern) | Bug.description.ilike(pattern))
+        if severity:
+            query = query.filter(Bug.severity == severity)
+        if status:
+            query = query.filter(Bug.status == status)
+        bugs = query.order_by(desc(Bug.created_at), desc(Bug.id)).offset(skip).limit(limit).all()
+        return [(bug, 0.0) for bug in bugs]
+    
+    ranked = index.search(search_term, skip=skip, limit=limit, severity=severity, status=status)
+    return get_ranked_bugs(db, ranked)
+
+
+def get_ranked_bugs(db: Session, ranked: List[Tuple[int, float]]) -> List[Tuple[Bug, float]]:
+    """(bug, score) pairs for ranked (bug ID, score) pairs, in one primary-key query"""
+    bugs = {bug.id: bug for bug in db.query(Bug).filter(Bug.id.in_([bug_id for bug_id, _ in ranked]))} if ranked else {}
+    return [(bugs[bug_id], score) for bug_id, score in ranked if bug_id in bugs]
+
+
+def _bug_written(bug: dict) -> None:
+    """Apply a bug write to the search index (once it is accepting writes)"""
+    index = get_bug_search_index()
+    if index.active:
+        index.upsert(bug)
 
 
 # ============================================================================
@@ -224,9 +756,46 @@ def create_prediction_log(db: Session, prediction_data: dict) -> PredictionLog:
     """
     db_prediction = PredictionLog(**prediction_data)
     db.add(db_prediction)
+    return _commit_loaded(db, db_prediction)
+
+
+def _commit_loaded(db: Session, instance):
+    """
+    Flush and commit a new instance without the refresh round trip
+
+    The flush's INSERT ... RETURNING fills in the id and server defaults
+    (eager_defaults on the models). Detaching before the commit keeps those
+    values loaded instead of expired, so serializing the instance afterwards
+    issues no SELECT. Relationships of the returned instance are not loadable.
+    """
+    db.flush()
+    db.expunge(instance)
     db.commit()
-    db.refresh(db_prediction)
-    return db_prediction
+    return instance
+
+
+# Session.info key under which async_crud collects post-commit hooks
+AFTER_COMMIT_HOOKS = "after_commit_hooks"
+
+
+def _after_commit(db: Session, hook: Callable, *args) -> None:
+    """
+    Apply a committed write to the in-process caches and indexes: hook(*args)
+    now, or, in sessions driven by async_crud, after the call returns, in a
+    worker thread (the index updates are CPU-bound and would otherwise run
+    on the event loop)
+    """
+    hooks = db.info.get(AFTER_COMMIT_HOOKS)
+    if hooks is None:
+        hook(*args)
+    else:
+        hooks.append((hook, args))
+
+
+def run_after_commit_hooks(hooks: List[Tuple[Callable, tuple]]) -> None:
+    """Run hooks collected by _after_commit, in order"""
+    for hook, args in hooks:
+        hook(*args)
 
 
 def get_prediction_logs(
@@ -253,55 +822,116 @@ def get_prediction_logs(
 def get_statistics(db: Session) -> dict:
     """
     Get overall statistics for the dashboard
-    """
-    total_bugs = db.query(Bug).count()
-    
-    # Count by severity
-    severity_counts = db.query(
-        Bug.severity,
-        func.count(Bug.id).label('count')
-    ).group_by(Bug.severity).all()
+
+    Served from the stats cache, which bug and developer writes keep current;
+    a full recount runs when the cache is empty or older than
+    STATS_RECONCILE_INTERVAL.
+    """
+    cache = get_stats_cache()
+    statistics = cache.get()
+    if statistics is None:
+        generation = cache.generation()
+        counters = count_statistics(db)
+        if cache.load(counters, generation):
+            statistics = cache.get()
+        if statistics is None:
+            # The recount raced with a write: serve the counters still held
+            # (or the recount itself, if there are none) and recount next time
+            statistics = cache.get(stale_ok=True) or format_counters(counters)
+    return statistics
+
+
+def count_statistics(db: Session) -> dict:
+    """
+    Full recount of the dashboard counters in one aggregate query
+
+    Every severity/status count is a COUNT(*) FILTER over a single scan of
+    bugs; the developer total is a scalar subquery in the same statement.
+    Confidence is returned as SUM/COUNT so the cache can maintain the average.
+    """
+    severities = SEVERITIES + [PENDING_SEVERITY]
+    total_developers = db.query(func.count(Developer.id)).scalar_subquery()
+    row = db.query(
+        func.count(Bug.id),
+        *[func.count(Bug.id).filter(Bug.severity == severity) for severity in severities],
+        *[func.count(Bug.id).filter(Bug.status == status) for status in STATUSES],
+        func.coalesce(func.sum(Bug.confidence_score), 0.0),
+        func.count(Bug.confidence_score),
+        total_developers
+    ).one()
     
-    severity_dict = {
-        "Critical": 0,
-        "High": 0,
-        "Medium": 0,
-        "Low": 0
+    values = iter(row)
+    return {
+        "total_bugs": next(values),
+        "severity": {severity: next(values) for severity in severities},
+        "status": {status: next(values) for status in STATUSES},
+        "confidence_sum": float(next(values)),
+        "confidence_count": next(values),
+        "total_developers": next(values)
     }
-    for severity, count in severity_counts:
-        severity_dict[severity] = count
-    
-    # Count by status
-    status_counts = db.query(
-        Bug.status,
-        func.count(Bug.id).label('count')
-    ).group_by(Bug.status).all()
-    
-    status_dict = {}
-    for status, count in status_counts:
-        status_dict[status] = count
-    
-    # Average confidence score
-    avg_confidence = db.query(func.avg(Bug.confidence_score)).scalar() or 0
-    
-    # Total developers
-    total_developers = db.query(Developer).count()
-    
+
+
+def _stats_fields(bug: dict) -> dict:
+    """The bug fields the dashboard counters depend on"""
     return {
-        "total_bugs": total_bugs,
-        "severity": severity_dict,
-        "status": status_dict,
-        "average_confidence": round(float(avg_confidence), 2),
-        "total_developers": total_developers
+        "severity": bug["severity"],
+        "status": bug.get("status"),
+        "confidence_score": bug.get("confidence_score")
     }
 
 
-def search_bugs(db: Session, search_term: str, limit: int = 50) -> List[Bug]:
+# Whether pg_trgm is installed, probed on the first database search
+_trigram_available: Optional[bool] = None
+
+
+def _trigram_search(db: Session) -> bool:
+    """Whether search_bugs may use trigram operators (probed once per process)"""
+    global _trigram_available
+    if _trigram_available is None:
+        _trigram_available = has_trigram_extension(db.connection())
+        if not _trigram_available:
+            print("⚠️  pg_trgm not available. Bug search uses full-text matching only.")
+    return _trigram_available
+
+
+def search_bugs(
+    db: Session,
+    search_term: str,
+    skip: int = 0,
+    limit: int = 50,
+    severity: Optional[str] = None,
+    status: Optional[str] = None
+) -> List[Tuple[Bug, float]]:
     """
-    Search bugs by title or description
+    Ranked search of bugs by title and description, best match first
+
+    A bug matches when its search_vector matches the term as a web-style
+    query ("login -timeout", "quoted phrase", or) or when the term is a
+    close trigram match for a word in its title, which catches partial
+    words and typos. Both conditions are served by GIN indexes. The score
+    is the normalized full-text rank plus the title word similarity.
+    Without pg_trgm (see models.BUG_SEARCH_TRIGRAM) only the full-text
+    condition and rank are used. Returns (bug, score) pairs.
+
+    With BUG_SEARCH_BACKEND=memory the in-process BM25 index answers
+    instead (see search_bugs_in_memory).
     """
-    search_pattern = f"%{search_term}%"
-    return db.query(Bug).filter(
-        (Bug.title.ilike(search_pattern)) | 
-        (Bug.description.ilike(search_pattern))
-    ).order_by(desc(Bug.created_at)).limit(limit).all()
+    if BUG_SEARCH_BACKEND == "memory":
+        return search_bugs_in_memory(db, search_term, skip=skip, limit=limit, severity=severity, status=status)
+    
+    search_vector = Bug.__table__.c.search_vector
+    query_vector = func.websearch_to_tsquery(SEARCH_CONFIG, search_term)
+    score = func.ts_rank_cd(search_vector, query_vector, 32)
+    condition = search_vector.op("@@")(query_vector)
+    if _trigram_search(db):
+        score = score + func.word_similarity(search_term, Bug.title)
+        condition = condition | Bug.title.op("%>")(search_term)
+    
+    query = db.query(Bug, score.label("score")).filter(condition)
+    if severity:
+        query = query.filter(Bug.severity == severity)
+    if status:
+        query = query.filter(Bug.status == status)
+    
+    rows = query.order_by(desc("score"), desc(Bug.created_at), desc(Bug.id)).offset(skip).limit(limit).all()
+    return [(bug, round(float(bug_score), 4)) for bug, bug_score in rows]
@@ -1,14 +1,21 @@
 """
 Database configuration and connection setup for HackForce AI API
-Uses SQLAlchemy with PostgreSQL (Supabase)
+Uses SQLAlchemy with PostgreSQL (Supabase): an async engine (asyncpg) for the
+API endpoints and a sync engine (psycopg2) for scripts and worker threads
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 import os
+import uuid
 from dotenv import load_dotenv
 
+from services.pool_metrics import get_pool_metrics, instrument_engine, timed_pool_class
+
 # Load environment variables
 load_dotenv()
 
@@ -18,20 +25,116 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
+# Serverless platforms (Vercel, AWS Lambda) run many short-lived instances,
+# each with its own pools
+SERVERLESS = bool(os.getenv("VERCEL") or os.getenv("AWS_LAMBDA_FUNCTION_NAME"))
+
+def uses_external_pooler(url) -> bool:
+    """
+    Whether DATABASE_URL points at a transaction-mode pooler (pgbouncer,
+    Supavisor): DB_EXTERNAL_POOLER=true/false, or "auto" to detect Supabase's
+    pooler host or port 6543
+    """
+    setting = os.getenv("DB_EXTERNAL_POOLER", "auto").lower()
+    if setting != "auto":
+        return setting in ("1", "true", "yes")
+    url = make_url(url)
+    return url.port == 6543 or (url.host or "").endswith("pooler.supabase.com")
+
+EXTERNAL_POOLER = uses_external_pooler(DATABASE_URL)
+
+# Pooling mode per process:
+# - queue: persistent pool (long-running servers)
+# - small: at most a couple of connections per instance (serverless, direct connections)
+# - null: a new connection per checkout, closed on release; the external pooler
+#   keeps the server connections warm, so bursts of instances cost it no backends
+DB_POOL_MODE = os.getenv("DB_POOL_MODE") or (
+    ("null" if EXTERNAL_POOLER else "small") if SERVERLESS else "queue"
+)
+if DB_POOL_MODE not in ("queue", "small", "null"):
+    raise ValueError(f"DB_POOL_MODE must be queue, small or null, not {DB_POOL_MODE!r}")
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "1" if DB_POOL_MODE == "small" else "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "1" if DB_POOL_MODE == "small" else "20"))
+# Seconds to wait for a pooled connection before failing the request
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10" if SERVERLESS else "30"))
+
+# The API serves requests from the async engine; the sync engine only runs
+# scripts and periodic background jobs (search index sync, workload
+# reconciliation, the triage sweep). Outside "queue" mode it keeps no pool of
+# its own, so an instance's persistent connections are the async pool's budget.
+SYNC_POOL_MODE = DB_POOL_MODE if DB_POOL_MODE == "queue" else "null"
+
+def engine_options(name: str, queue_pool_class, mode: str = DB_POOL_MODE) -> dict:
+    """
+    Pool arguments for create_engine/create_async_engine in the given pooling
+    mode, with checkout timing recorded under name (see /api/metrics)
+    """
+    metrics = get_pool_metrics(name)
+    metrics.settings = {
+        "mode": mode,
+        "external_pooler": EXTERNAL_POOLER,
+        "pool_size": 0 if mode == "null" else DB_POOL_SIZE,
+        "max_overflow": 0 if mode == "null" else DB_MAX_OVERFLOW
+    }
+    if mode == "null":
+        # Fresh connections need no pre-ping
+        return {"poolclass": timed_pool_class(NullPool, metrics)}
+    return {
+        "poolclass": timed_pool_class(queue_pool_class, metrics),
+        "pool_pre_ping": True,  # Verify connections before using them
+        "pool_size": DB_POOL_SIZE,  # Number of connections to maintain
+        "max_overflow": DB_MAX_OVERFLOW,  # Maximum number of connections to create beyond pool_size
+        "pool_timeout": DB_POOL_TIMEOUT
+    }
+
 # Create SQLAlchemy engine
-# Note: Supabase uses connection pooling, so we configure accordingly
-# Using psycopg2-binary for Vercel compatibility
+# Using psycopg2-binary for Vercel compatibility (psycopg2 never uses
+# server-side prepared statements, so it works through transaction poolers as is)
 engine = create_engine(
     DATABASE_URL,  # psycopg2 is the default driver
-    pool_pre_ping=True,  # Verify connections before using them
-    pool_size=10,  # Number of connections to maintain
-    max_overflow=20,  # Maximum number of connections to create beyond pool_size
-    echo=False  # Set to True for SQL query logging (useful for debugging)
+    echo=False,  # Set to True for SQL query logging (useful for debugging)
+    **engine_options("sync", QueuePool, SYNC_POOL_MODE)
 )
+instrument_engine(engine, get_pool_metrics("sync"))
 
 # Create SessionLocal class for database sessions
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def async_database_url(url: str) -> URL:
+    """
+    DATABASE_URL for the asyncpg driver
+    libpq's sslmode (e.g. Supabase's ?sslmode=require) becomes asyncpg's ssl
+    """
+    url = make_url(url)
+    query = dict(url.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    return url.set(drivername="postgresql+asyncpg", query=query)
+
+# A transaction pooler may run consecutive statements on different server
+# connections, so asyncpg must not reuse prepared statements: no statement
+# caches, and unique statement names so they never collide on a shared backend
+ASYNC_CONNECT_ARGS = {
+    "statement_cache_size": 0,
+    "prepared_statement_cache_size": 0,
+    "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__"
+} if EXTERNAL_POOLER else {}
+
+# Async engine used by the API endpoints: queries are awaited instead of blocking
+# the event loop. ASYNC_DATABASE_URL overrides the URL derived from DATABASE_URL.
+async_engine = create_async_engine(
+    os.getenv("ASYNC_DATABASE_URL") or async_database_url(DATABASE_URL),
+    echo=False,
+    connect_args=ASYNC_CONNECT_ARGS,
+    **engine_options("async", AsyncAdaptedQueuePool)
+)
+instrument_engine(async_engine.sync_engine, get_pool_metrics("async"))
+
+# Instances stay loaded after commit: attribute access must not trigger I/O
+# outside an awaited call
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 # Base class for declarative models
 Base = declarative_base()
 
@@ -50,6 +153,18 @@ def get_db():
     finally:
         db.close()
 
+# Dependency to get an async database session
+async def get_async_db():
+    """
+    Async dependency function to get database session
+    Usage in FastAPI endpoints (with the async_crud functions):
+        @app.get("/endpoint")
+        async def endpoint(db: AsyncSession = Depends(get_async_db)):
+            bug = await async_crud.get_bug(db, 1)
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
 # Function to test database connection
 def test_connection():
     """
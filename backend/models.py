@@ -3,11 +3,35 @@ SQLAlchemy ORM Models for HackForce AI API
 Defines database tables: developers, bugs, predictions_log
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, ARRAY
+import os
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, ARRAY, Index, Computed, event, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from database import Base
 
+# Severity of a bug accepted for background triage that has not been classified yet
+PENDING_SEVERITY = "Pending"
+
+# Text search configuration of bugs.search_vector (must match database/schema.sql)
+SEARCH_CONFIG = "english"
+
+# Trigram title matching in search needs the pg_trgm extension: "auto" creates
+# it if the database role may and otherwise searches without it, "on" requires
+# it, "off" never uses it
+BUG_SEARCH_TRIGRAM = os.getenv("BUG_SEARCH_TRIGRAM", "auto").lower()
+
+
+def has_trigram_extension(connection) -> bool:
+    """Whether trigram matching can be used on this connection's database"""
+    if BUG_SEARCH_TRIGRAM == "off" or connection.dialect.name != "postgresql":
+        return False
+    return bool(connection.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+    ).scalar())
+
+
 class Developer(Base):
     """
     Developer model - stores information about developers
@@ -48,6 +72,10 @@ class Bug(Base):
     Bug model - stores bug reports and their classifications
     """
     __tablename__ = "bugs"
+    # Fetch server-generated columns (created_at, updated_at) in the INSERT/UPDATE's
+    # RETURNING clause instead of a follow-up SELECT. search_vector is only
+    # queried (crud.search_bugs), never loaded into Bug objects.
+    __mapper_args__ = {"eager_defaults": True, "exclude_properties": ["search_vector"]}
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -61,9 +89,29 @@ class Bug(Base):
     assigned_developer = Column(String(100))
     notion_page_id = Column(String(100))
     jira_issue_key = Column(String(50))
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
+    # Full-text search document: title weighted above description
+    search_vector = Column(TSVECTOR, Computed(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+        persisted=True
+    ))
+    
+    __table_args__ = (
+        # Serves newest-first listings and their (created_at, id) keyset pagination
+        Index("idx_bugs_created_at", created_at.desc(), id.desc()),
+        # Ranked full-text search, and trigram matching of partial or misspelled
+        # titles (only created when pg_trgm is installed)
+        Index("idx_bugs_search_vector", "search_vector", postgresql_using="gin"),
+        Index("idx_bugs_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}).ddl_if(
+            callable_=lambda ddl, target, bind, **kw: bind is not None and has_trigram_extension(bind)
+        ),
+        # Per-developer workload aggregation (crud.get_developers_workload)
+        Index("idx_bugs_assigned_developer", "assigned_developer_id"),
+    )
+    
     # Relationship with developer
     developer = relationship("Developer", back_populates="bugs")
     
@@ -93,11 +141,32 @@ class Bug(Base):
         }
 
 
+@event.listens_for(Bug.__table__, "before_create")
+def create_trigram_extension(target, connection, **kw):
+    """
+    Enable pg_trgm before the bugs table (and its trigram index) is created.
+    In "auto" mode a role without the privilege to create extensions only
+    loses trigram matching instead of failing create_all.
+    """
+    if BUG_SEARCH_TRIGRAM == "off" or connection.dialect.name != "postgresql":
+        return
+    statement = text("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    if BUG_SEARCH_TRIGRAM == "on":
+        connection.execute(statement)
+        return
+    try:
+        with connection.begin_nested():
+            connection.execute(statement)
+    except DBAPIError as e:
+        print(f"⚠️  Could not enable pg_trgm ({str(e.orig).strip().splitlines()[0]}). Bug search runs without trigram matching.")
+
+
 class PredictionLog(Base):
     """
     Prediction Log model - stores AI prediction history
     """
     __tablename__ = "predictions_log"
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
     bug_id = Column(Integer, ForeignKey("bugs.id", ondelete="CASCADE"), index=True)
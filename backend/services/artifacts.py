@@ -0,0 +1,206 @@
+"""
+Array-backed artifact format for HackForce AI API
+Model and index artifacts are stored as typed arrays and opened with mmap, so
+loading costs a few system calls (no unpickling) and pages are shared between
+worker processes through the OS page cache
+
+Layout (little-endian):
+    magic "HFAR" | uint32 format version | uint64 header length | JSON header
+    | padding | sections, each aligned to 8 bytes
+
+The JSON header holds free-form metadata plus, for every section, its typecode,
+item count and offset relative to the start of the data region.
+"""
+
+import os
+import sys
+import json
+import mmap
+import zlib
+import struct
+from array import array
+from typing import Dict, Iterable, Optional, Union
+
+MAGIC = b"HFAR"
+FORMAT_VERSION = 1
+ALIGNMENT = 8
+_PREAMBLE = struct.Struct("<4sIQ")
+
+# Marks an empty slot in a StringTable hash table
+EMPTY_SLOT = 0xFFFFFFFF
+
+Section = Union[array, bytes, bytearray]
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_artifact(path: str, meta: Dict, sections: Dict[str, Section]) -> None:
+    """
+    Write metadata and typed arrays to path atomically
+
+    Args:
+        path: Destination file
+        meta: JSON-serializable metadata
+        sections: name -> array.array (typecodes f, d, I, i, H, B...) or bytes
+    """
+    layout = {}
+    payloads = []
+    offset = 0
+    for name, data in sections.items():
+        if isinstance(data, array):
+            typecode = data.typecode
+            payload = data.tobytes()
+            length = len(data)
+        else:
+            typecode = "B"
+            payload = bytes(data)
+            length = len(payload)
+        offset = _align(offset)
+        layout[name] = {"typecode": typecode, "length": length, "offset": offset}
+        payloads.append((offset, payload))
+        offset += len(payload)
+
+    header = json.dumps({
+        "byteorder": sys.byteorder,
+        "meta": meta,
+        "sections": layout
+    }, separators=(",", ":")).encode("utf-8")
+    data_start = _align(_PREAMBLE.size + len(header))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+        f.write(header)
+        for section_offset, payload in payloads:
+            f.seek(data_start + section_offset)
+            f.write(payload)
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+
+
+class Artifact:
+    """
+    Read-only, memory-mapped view of an artifact written by write_artifact
+
+    Sections are returned as zero-copy memoryviews over the mapping, so the
+    artifact must stay open for as long as they are in use.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, header_length = _PREAMBLE.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a HackForce artifact")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported artifact version {version} in {path}")
+
+        header = json.loads(self._mmap[_PREAMBLE.size:_PREAMBLE.size + header_length])
+        self.meta = header["meta"]
+        self._sections = header["sections"]
+        self._data_start = _align(_PREAMBLE.size + header_length)
+        self._swap = header["byteorder"] != sys.byteorder
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sections
+
+    def section(self, name: str):
+        """Return a section as a typed memoryview (or a byteswapped array copy on foreign-endian hosts)"""
+        spec = self._sections[name]
+        typecode = spec["typecode"]
+        start = self._data_start + spec["offset"]
+        view = memoryview(self._mmap)[start:start + spec["length"] * array(typecode).itemsize]
+
+        if typecode == "B":
+            return view
+        if self._swap:
+            copy = array(typecode)
+            copy.frombytes(view)
+            copy.byteswap()
+            return copy
+        return view.cast(typecode)
+
+
+def build_string_table(strings: Iterable[str]) -> Dict[str, Section]:
+    """
+    Encode strings (index = position) as sections for a StringTable:
+    a UTF-8 blob, uint32 offsets and an open-addressing hash table of indexes
+    """
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = array("I", [0])
+    for item in encoded:
+        offsets.append(offsets[-1] + len(item))
+
+    capacity = 1
+    while capacity < 2 * max(len(encoded), 1):
+        capacity *= 2
+    table = array("I", [EMPTY_SLOT]) * capacity
+    mask = capacity - 1
+    for index, item in enumerate(encoded):
+        slot = zlib.crc32(item) & mask
+        while table[slot] != EMPTY_SLOT:
+            slot = (slot + 1) & mask
+        table[slot] = index
+
+    return {"blob": b"".join(encoded), "offsets": offsets, "table": table}
+
+
+class StringTable:
+    """
+    Read-only string -> index lookup over build_string_table sections
+
+    Behaves like a dict for get()/[]/len(), but needs no construction at load
+    time: lookups hash the key with CRC32 and probe the mapped table.
+    """
+
+    def __init__(self, blob, offsets, table):
+        self._blob = blob
+        self._offsets = offsets
+        self._table = table
+        self._mask = len(table) - 1
+
+    @classmethod
+    def from_artifact(cls, artifact: Artifact, prefix: str) -> "StringTable":
+        return cls(
+            artifact.section(f"{prefix}_blob"),
+            artifact.section(f"{prefix}_offsets"),
+            artifact.section(f"{prefix}_table")
+        )
+
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        encoded = key.encode("utf-8")
+        table = self._table
+        offsets = self._offsets
+        slot = zlib.crc32(encoded) & self._mask
+        while True:
+            index = table[slot]
+            if index == EMPTY_SLOT:
+                return default
+            if self._blob[offsets[index]:offsets[index + 1]] == encoded:
+                return index
+            slot = (slot + 1) & self._mask
+
+    def __getitem__(self, key: str) -> int:
+        index = self.get(key)
+        if index is None:
+            raise KeyError(key)
+        return index
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def string(self, index: int) -> str:
+        """Return the string stored at index"""
+        return bytes(self._blob[self._offsets[index]:self._offsets[index + 1]]).decode("utf-8")
+
+
+def prefixed(prefix: str, sections: Dict[str, Section]) -> Dict[str, Section]:
+    """Namespace a group of sections, e.g. a StringTable stored as '<prefix>_blob'"""
+    return {f"{prefix}_{name}": data for name, data in sections.items()}
@@ -0,0 +1,547 @@
+"""
+Bug Search Index for HackForce AI API
+In-process BM25 inverted index over bug titles and descriptions, for
+deployments that cannot add PostgreSQL extensions. Postings are typed arrays;
+the index is built from the bugs table in streaming batches (or restored from
+a snapshot artifact), then kept current by the bug writes in crud.py.
+"""
+
+import os
+import re
+import math
+import time
+import heapq
+import bisect
+import threading
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from services.artifacts import Artifact, StringTable, build_string_table, prefixed, write_artifact
+from services.resilience import LatencyTracker
+
+# "postgres" (full-text search in the database) or "memory" (this index)
+BUG_SEARCH_BACKEND = os.getenv("BUG_SEARCH_BACKEND", "postgres")
+
+# Snapshot artifact restored on start-up instead of a full rebuild (empty: no snapshots)
+BUG_SEARCH_SNAPSHOT_PATH = os.getenv("BUG_SEARCH_SNAPSHOT_PATH", "")
+BUG_SEARCH_SNAPSHOT_INTERVAL = float(os.getenv("BUG_SEARCH_SNAPSHOT_INTERVAL", "300"))
+
+# How often bugs written by other worker processes are re-read from the database
+BUG_SEARCH_SYNC_INTERVAL = float(os.getenv("BUG_SEARCH_SYNC_INTERVAL", "30"))
+
+# Bugs read per query while building from the database
+BUG_SEARCH_BUILD_BATCH = int(os.getenv("BUG_SEARCH_BUILD_BATCH", "2000"))
+
+# BM25 parameters; title terms are counted TITLE_WEIGHT times (a simple BM25F)
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_WEIGHT = 2
+
+# The last query word also matches terms it is a prefix of ("authen" ->
+# "authentication"), at a reduced weight, for the most common PREFIX_EXPANSIONS terms
+PREFIX_WEIGHT = 0.5
+PREFIX_EXPANSIONS = 20
+MIN_PREFIX_LENGTH = 2
+
+# Terms in more than this share of bugs only add to the scores of bugs matched
+# by the query's rarer terms (when those fill the page), instead of scanning
+# their long posting lists
+COMMON_TERM_FRACTION = 0.1
+
+# Bumped when tokenization changes, invalidating older snapshots
+TOKENIZER_VERSION = 1
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have if in into is it its of on or "
+    "that the their then there these this to was were when where which while with".split()
+)
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+SEVERITY_CODES = {"Critical": 1, "High": 2, "Medium": 3, "Low": 4, "Pending": 5}
+STATUS_CODES = {"Open": 1, "In Progress": 2, "Resolved": 3, "Closed": 4}
+
+_DELETED = -1
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric words of text, without stopwords"""
+    return [token for token in _TOKEN_RE.findall((text or "").lower()) if token not in STOPWORDS]
+
+
+def bug_version(updated_at) -> float:
+    """
+    A bug's updated_at (datetime or ISO string) as epoch seconds, 0.0 if
+    unknown; timestamps without a zone are taken as UTC
+    """
+    if not updated_at:
+        return 0.0
+    if isinstance(updated_at, str):
+        updated_at = datetime.fromisoformat(updated_at)
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return updated_at.timestamp()
+
+
+def _copy(typecode: str, data) -> array:
+    """Mutable array copy of an artifact section slice"""
+    if isinstance(data, array):
+        return array(typecode, data)
+    copy = array(typecode)
+    copy.frombytes(data.tobytes())
+    return copy
+
+
+class BugSearchIndex:
+    """
+    BM25 index of bugs keyed by bug ID
+
+    Each bug occupies a document slot. Postings per term are parallel
+    arrays of slots and term frequencies; removing a bug tombstones its slot
+    and the postings are compacted once enough slots are dead. Severity and
+    status are kept per slot so searches filter without the database, and so
+    is the bug's updated_at: re-reading a bug that hasn't changed since it was
+    indexed leaves its slot alone.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+        self.active = False  # accepting writes (set when a build starts)
+        self.built_at: Optional[float] = None
+        self.synced_at: Optional[float] = None  # newest updated_at read from the database (epoch seconds)
+        self.changes_since_snapshot = 0
+        self.search_time = LatencyTracker()
+        self._stats = {"searches": 0, "upserts": 0, "unchanged": 0, "removals": 0, "compactions": 0, "snapshots": 0, "restored": False}
+
+    def _reset(self) -> None:
+        self._terms: Dict[str, int] = {}
+        self._term_list: List[str] = []
+        self._sorted_terms: List[str] = []
+        self._unsorted_terms: List[str] = []
+        self._posting_slots: List[array] = []
+        self._posting_freqs: List[array] = []
+        self._df = array("I")
+        self._doc_ids = array("i")
+        self._doc_lengths = array("I")
+        self._doc_severity = array("B")
+        self._doc_status = array("B")
+        self._doc_versions = array("d")
+        self._doc_terms: List[Optional[array]] = []
+        self._slots: Dict[int, int] = {}
+        self._total_length = 0
+        self._dead = 0
+        self._norm_cache = (1.0, array("d"))
+
+    @property
+    def is_built(self) -> bool:
+        return self.built_at is not None
+
+    def activate(self) -> None:
+        """Start applying writes (before a build, so writes made during it are not lost)"""
+        self.active = True
+
+    def mark_built(self) -> None:
+        self.built_at = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, bug: Dict) -> None:
+        """
+        Index a bug dict (id, title, description, severity, status, and
+        updated_at if known), replacing any older version
+        """
+        self.upsert_many([bug])
+
+    def upsert_many(self, bugs: Iterable[Dict]) -> None:
+        with self._lock:
+            for bug in bugs:
+                if self._unchanged(bug):
+                    self._stats["unchanged"] += 1
+                    continue
+                self._remove(bug["id"])
+                self._add(bug)
+                self._stats["upserts"] += 1
+                self.changes_since_snapshot += 1
+
+    def remove(self, bug_id: int) -> None:
+        with self._lock:
+            if self._remove(bug_id):
+                self._stats["removals"] += 1
+                self.changes_since_snapshot += 1
+            self._maybe_compact()
+
+    def retain(self, bug_ids: Iterable[int]) -> int:
+        """Drop every indexed bug not in bug_ids (bugs deleted elsewhere); returns how many"""
+        keep = set(bug_ids)
+        with self._lock:
+            removed = [bug_id for bug_id in self._slots if bug_id not in keep]
+            for bug_id in removed:
+                self._remove(bug_id)
+            self._maybe_compact()
+            self.changes_since_snapshot += len(removed)
+        return len(removed)
+
+    def set_attributes(
+        self,
+        bug_id: int,
+        severity: Optional[str] = None,
+        status: Optional[str] = None,
+        updated_at=None
+    ) -> None:
+        """Apply a severity/status change that leaves the bug's text unchanged"""
+        with self._lock:
+            slot = self._slots.get(bug_id)
+            if slot is None:
+                return
+            self._doc_versions[slot] = bug_version(updated_at)
+            if severity is not None:
+                self._doc_severity[slot] = SEVERITY_CODES.get(severity, 0)
+            if status is not None:
+                self._doc_status[slot] = STATUS_CODES.get(status, 0)
+            self.changes_since_snapshot += 1
+
+    def _unchanged(self, bug: Dict) -> bool:
+        """Whether the bug is indexed at the same (known) updated_at"""
+        slot = self._slots.get(bug["id"])
+        version = bug_version(bug.get("updated_at"))
+        return slot is not None and version > 0 and self._doc_versions[slot] == version
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._terms.get(term)
+        if term_id is None:
+            term_id = len(self._term_list)
+            self._terms[term] = term_id
+            self._term_list.append(term)
+            self._unsorted_terms.append(term)
+            self._posting_slots.append(array("I"))
+            self._posting_freqs.append(array("H"))
+            self._df.append(0)
+        return term_id
+
+    def _add(self, bug: Dict) -> None:
+        counts = Counter(tokenize(bug.get("title")) * TITLE_WEIGHT + tokenize(bug.get("description")))
+        slot = len(self._doc_ids)
+        term_ids = array("I")
+        for term, frequency in counts.items():
+            term_id = self._term_id(term)
+            self._posting_slots[term_id].append(slot)
+            self._posting_freqs[term_id].append(min(frequency, 0xFFFF))
+            self._df[term_id] += 1
+            term_ids.append(term_id)
+
+        length = sum(counts.values())
+        self._doc_ids.append(bug["id"])
+        self._doc_lengths.append(length)
+        self._doc_severity.append(SEVERITY_CODES.get(bug.get("severity"), 0))
+        self._doc_status.append(STATUS_CODES.get(bug.get("status"), 0))
+        self._doc_versions.append(bug_version(bug.get("updated_at")))
+        self._doc_terms.append(term_ids)
+        self._slots[bug["id"]] = slot
+        self._total_length += length
+        average, norms = self._norm_cache
+        if len(norms) == slot:
+            norms.append(BM25_K1 * (1 - BM25_B + BM25_B * length / average))
+
+    def _remove(self, bug_id: int) -> bool:
+        slot = self._slots.pop(bug_id, None)
+        if slot is None:
+            return False
+        for term_id in self._doc_terms[slot]:
+            self._df[term_id] -= 1
+        self._doc_terms[slot] = None
+        self._doc_ids[slot] = _DELETED
+        self._total_length -= self._doc_lengths[slot]
+        norms = self._norm_cache[1]
+        if slot < len(norms):
+            norms[slot] = math.inf
+        self._dead += 1
+        return True
+
+    def _maybe_compact(self) -> None:
+        if self._dead > max(1000, len(self._doc_ids) // 4):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Renumber live slots densely and drop tombstoned postings"""
+        if not self._dead:
+            return
+        new_slot = array("i", [_DELETED]) * len(self._doc_ids)
+        doc_ids, doc_lengths, doc_severity, doc_status = array("i"), array("I"), array("B"), array("B")
+        doc_versions = array("d")
+        doc_terms = []
+        for slot, bug_id in enumerate(self._doc_ids):
+            if bug_id == _DELETED:
+                continue
+            new_slot[slot] = len(doc_ids)
+            doc_ids.append(bug_id)
+            doc_lengths.append(self._doc_lengths[slot])
+            doc_severity.append(self._doc_severity[slot])
+            doc_status.append(self._doc_status[slot])
+            doc_versions.append(self._doc_versions[slot])
+            doc_terms.append(self._doc_terms[slot])
+
+        for term_id, slots in enumerate(self._posting_slots):
+            freqs = self._posting_freqs[term_id]
+            kept_slots, kept_freqs = array("I"), array("H")
+            for slot, frequency in zip(slots, freqs):
+                if new_slot[slot] != _DELETED:
+                    kept_slots.append(new_slot[slot])
+                    kept_freqs.append(frequency)
+            self._posting_slots[term_id] = kept_slots
+            self._posting_freqs[term_id] = kept_freqs
+
+        self._doc_ids, self._doc_lengths = doc_ids, doc_lengths
+        self._doc_severity, self._doc_status = doc_severity, doc_status
+        self._doc_versions = doc_versions
+        self._doc_terms = doc_terms
+        self._slots = {bug_id: slot for slot, bug_id in enumerate(doc_ids)}
+        self._dead = 0
+        self._norm_cache = (1.0, array("d"))
+        self._stats["compactions"] += 1
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _prefix_terms(self, prefix: str) -> List[int]:
+        """IDs of the most common live terms starting with prefix"""
+        if self._unsorted_terms:
+            if len(self._unsorted_terms) < 100:
+                for term in self._unsorted_terms:
+                    bisect.insort(self._sorted_terms, term)
+            else:
+                self._sorted_terms = sorted(self._terms)
+            self._unsorted_terms = []
+
+        matches = []
+        position = bisect.bisect_left(self._sorted_terms, prefix)
+        while position < len(self._sorted_terms) and self._sorted_terms[position].startswith(prefix):
+            term_id = self._terms[self._sorted_terms[position]]
+            if self._df[term_id]:
+                matches.append(term_id)
+            position += 1
+        return heapq.nlargest(PREFIX_EXPANSIONS, matches, key=lambda term_id: self._df[term_id])
+
+    def _idf(self, term_id: int, documents: int) -> float:
+        """BM25 idf of a term, pre-multiplied by (k1 + 1)"""
+        df = self._df[term_id]
+        return math.log(1 + (documents - df + 0.5) / (df + 0.5)) * (BM25_K1 + 1)
+
+    def _postings(self, term_id: int, severity_code: int, status_code: int):
+        """(slot, frequency) pairs of a term, restricted to the severity/status filters"""
+        postings = zip(self._posting_slots[term_id], self._posting_freqs[term_id])
+        if not severity_code and not status_code:
+            return postings
+        doc_severity, doc_status = self._doc_severity, self._doc_status
+        return [
+            (slot, frequency) for slot, frequency in postings
+            if (not severity_code or doc_severity[slot] == severity_code)
+            and (not status_code or doc_status[slot] == status_code)
+        ]
+
+    def _length_norms(self) -> array:
+        """
+        Per-slot BM25 length normalization k1 * (1 - b + b * length / average
+        length), cached until the average length drifts by more than 1% or
+        slots change
+        """
+        documents = len(self._slots)
+        average = self._total_length / documents if documents else 1.0
+        cached_average, norms = self._norm_cache
+        if len(norms) == len(self._doc_ids) and abs(average - cached_average) <= 0.01 * cached_average:
+            return norms
+        norms = array("d", (
+            BM25_K1 * (1 - BM25_B + BM25_B * length / average) if bug_id != _DELETED else math.inf
+            for length, bug_id in zip(self._doc_lengths, self._doc_ids)
+        ))
+        self._norm_cache = (average, norms)
+        return norms
+
+    def search(
+        self,
+        text: str,
+        skip: int = 0,
+        limit: int = 50,
+        severity: Optional[str] = None,
+        status: Optional[str] = None,
+        prefix: bool = True
+    ) -> List[Tuple[int, float]]:
+        """
+        Rank bugs against the query text with BM25, best match first
+
+        Returns (bug ID, score) pairs; ties go to the newer (higher) bug ID.
+        """
+        started = time.perf_counter()
+        tokens = tokenize(text)
+        severity_code = SEVERITY_CODES.get(severity, 0) if severity else 0
+        status_code = STATUS_CODES.get(status, 0) if status else 0
+
+        with self._lock:
+            weights: Dict[int, float] = {}
+            for position, token in enumerate(tokens):
+                term_id = self._terms.get(token)
+                if term_id is not None:
+                    weights[term_id] = weights.get(term_id, 0.0) + 1.0
+                if prefix and position == len(tokens) - 1 and len(token) >= MIN_PREFIX_LENGTH:
+                    for expansion in self._prefix_terms(token):
+                        if expansion != term_id:
+                            weights[expansion] = weights.get(expansion, 0.0) + PREFIX_WEIGHT
+
+            documents = len(self._slots)
+            doc_ids = self._doc_ids
+            norms = self._length_norms()
+            terms = [(term_id, weight) for term_id, weight in weights.items() if self._df[term_id]]
+            common = [item for item in terms if self._df[item[0]] > COMMON_TERM_FRACTION * documents]
+            selective = [item for item in terms if self._df[item[0]] <= COMMON_TERM_FRACTION * documents]
+
+            scores: Dict[int, float] = {}
+            get_score = scores.get
+            for term_id, weight in selective:
+                idf = self._idf(term_id, documents) * weight
+                # Tombstoned slots have an infinite norm and score 0; they are dropped below
+                for slot, frequency in self._postings(term_id, severity_code, status_code):
+                    scores[slot] = get_score(slot, 0.0) + idf * frequency / (frequency + norms[slot])
+
+            if common and len(scores) >= skip + limit:
+                # Common terms contribute little (low idf): only add them to documents
+                # the selective terms found, looking each slot up in the sorted postings
+                candidates = list(scores)
+                for term_id, weight in common:
+                    idf = self._idf(term_id, documents) * weight
+                    slots, freqs = self._posting_slots[term_id], self._posting_freqs[term_id]
+                    for slot in candidates:
+                        position = bisect.bisect_left(slots, slot)
+                        if position < len(slots) and slots[position] == slot:
+                            frequency = freqs[position]
+                            scores[slot] += idf * frequency / (frequency + norms[slot])
+            else:
+                for term_id, weight in common:
+                    idf = self._idf(term_id, documents) * weight
+                    for slot, frequency in self._postings(term_id, severity_code, status_code):
+                        scores[slot] = get_score(slot, 0.0) + idf * frequency / (frequency + norms[slot])
+
+            top = heapq.nlargest(skip + limit, scores.items(), key=lambda item: (item[1], doc_ids[item[0]]))
+            results = [(doc_ids[slot], round(score, 4)) for slot, score in top[skip:] if score > 0]
+
+        self._stats["searches"] += 1
+        self.search_time.record(time.perf_counter() - started)
+        return results
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def snapshot(self, path: str) -> None:
+        """Write the index to an artifact at path (atomically)"""
+        with self._lock:
+            self._compact()
+            taken_at = time.time()
+            offsets = array("I", [0])
+            slots, freqs = array("I"), array("H")
+            for term_slots, term_freqs in zip(self._posting_slots, self._posting_freqs):
+                slots.extend(term_slots)
+                freqs.extend(term_freqs)
+                offsets.append(len(slots))
+            sections = {
+                **prefixed("terms", build_string_table(self._term_list)),
+                "posting_offsets": offsets,
+                "posting_slots": slots,
+                "posting_freqs": freqs,
+                "doc_ids": array("i", self._doc_ids),
+                "doc_lengths": array("I", self._doc_lengths),
+                "doc_severity": array("B", self._doc_severity),
+                "doc_status": array("B", self._doc_status),
+                "doc_versions": array("d", self._doc_versions)
+            }
+            meta = {
+                "kind": "bug-search-bm25",
+                "tokenizer_version": TOKENIZER_VERSION,
+                "documents": len(self._slots),
+                "terms": len(self._term_list),
+                "total_length": self._total_length,
+                "taken_at": taken_at,
+                # Writes from other processes after this point are not in the snapshot
+                "synced_at": min(self.synced_at or taken_at, taken_at)
+            }
+            self.changes_since_snapshot = 0
+
+        write_artifact(path, meta, sections)
+        self._stats["snapshots"] += 1
+
+    def restore(self, path: str) -> Optional[float]:
+        """
+        Load a snapshot written by snapshot(); returns the time its contents
+        were last synced with the database (for catching up with later writes),
+        or None if it is missing or incompatible
+        """
+        try:
+            artifact = Artifact(path)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Bug search snapshot not loaded ({e})")
+            return None
+        meta = artifact.meta
+        if meta.get("kind") != "bug-search-bm25" or meta.get("tokenizer_version") != TOKENIZER_VERSION:
+            print(f"⚠️  Bug search snapshot {path} is incompatible; rebuilding")
+            return None
+
+        terms = StringTable.from_artifact(artifact, "terms")
+        offsets = artifact.section("posting_offsets")
+        slots = artifact.section("posting_slots")
+        freqs = artifact.section("posting_freqs")
+
+        with self._lock:
+            self._reset()
+            self._term_list = [terms.string(term_id) for term_id in range(len(terms))]
+            self._terms = {term: term_id for term_id, term in enumerate(self._term_list)}
+            self._unsorted_terms = list(self._term_list)
+            self._doc_ids = _copy("i", artifact.section("doc_ids"))
+            self._doc_lengths = _copy("I", artifact.section("doc_lengths"))
+            self._doc_severity = _copy("B", artifact.section("doc_severity"))
+            self._doc_status = _copy("B", artifact.section("doc_status"))
+            # Snapshots written before versions were kept re-index each bug once on sync
+            self._doc_versions = (
+                _copy("d", artifact.section("doc_versions")) if "doc_versions" in artifact
+                else array("d", bytes(8 * len(self._doc_ids)))
+            )
+            self._doc_terms = [array("I") for _ in range(len(self._doc_ids))]
+            for term_id in range(len(self._term_list)):
+                start, end = offsets[term_id], offsets[term_id + 1]
+                term_slots = _copy("I", slots[start:end])
+                self._posting_slots.append(term_slots)
+                self._posting_freqs.append(_copy("H", freqs[start:end]))
+                self._df.append(len(term_slots))
+                for slot in term_slots:
+                    self._doc_terms[slot].append(term_id)
+            self._slots = {bug_id: slot for slot, bug_id in enumerate(self._doc_ids)}
+            self._total_length = meta["total_length"]
+            self.changes_since_snapshot = 0
+            self._stats["restored"] = True
+        return meta["synced_at"]
+
+    def stats(self) -> Dict[str, any]:
+        """Index size and search latency for the metrics endpoint"""
+        return {
+            "backend": BUG_SEARCH_BACKEND,
+            "built": self.is_built,
+            "documents": len(self._slots),
+            "terms": len(self._term_list),
+            "dead_slots": self._dead,
+            "changes_since_snapshot": self.changes_since_snapshot,
+            **self._stats,
+            "search_seconds": {"p50": self.search_time.percentile(50), "p95": self.search_time.percentile(95)}
+        }
+
+
+# Singleton instance - built or restored by the app's startup event (BUG_SEARCH_BACKEND=memory)
+bug_search_index = None
+
+def get_bug_search_index() -> BugSearchIndex:
+    """Get or create the bug search index singleton (lazy initialization)"""
+    global bug_search_index
+    if bug_search_index is None:
+        bug_search_index = BugSearchIndex()
+    return bug_search_index
@@ -0,0 +1,120 @@
+"""
+Developer Candidate Selection for HackForce AI API
+Scores the roster by skill overlap with the bug text and current workload,
+so only the top-K candidates are sent to the LLM, and a clearly dominant
+candidate is assigned without an LLM call at all
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+from services.skill_index import SkillIndex, skill_key, text_skill_keys
+
+# Candidates sent to the developer-suggestion prompt
+DEVELOPER_CANDIDATES_TOP_K = int(os.getenv("DEVELOPER_CANDIDATES_TOP_K", "5"))
+
+# Score lead over the runner-up at which the top candidate is assigned directly
+DEVELOPER_DOMINANCE_MARGIN = float(os.getenv("DEVELOPER_DOMINANCE_MARGIN", "1.0"))
+
+# Score penalty per bug already assigned (10 open bugs cost one matched skill)
+DEVELOPER_WORKLOAD_WEIGHT = float(os.getenv("DEVELOPER_WORKLOAD_WEIGHT", "0.1"))
+
+
+class CandidateSelection:
+    """
+    Result of CandidateSelector.select
+
+    candidates: best-first developers to offer the LLM (at most top_k)
+    matched_skills: developer ID -> skills found in the bug text
+    decisive: developer suggestion (developer_name, developer_id, confidence, reasoning)
+        when one candidate clearly dominates, otherwise None
+    """
+
+    def __init__(self, candidates: List[Dict], matched_skills: Dict[int, List[str]], decisive: Optional[Dict] = None):
+        self.candidates = candidates
+        self.matched_skills = matched_skills
+        self.decisive = decisive
+
+
+class CandidateSelector:
+    """
+    Rank developers for a bug before the developer-suggestion prompt
+
+    score = matched skills - workload_weight * workload. A skill matches when
+    its name or an alias occurs in the bug text ("js" matches "JavaScript").
+    """
+
+    def __init__(
+        self,
+        top_k: int = DEVELOPER_CANDIDATES_TOP_K,
+        dominance_margin: float = DEVELOPER_DOMINANCE_MARGIN,
+        workload_weight: float = DEVELOPER_WORKLOAD_WEIGHT
+    ):
+        self.top_k = max(1, top_k)
+        self.dominance_margin = dominance_margin
+        self.workload_weight = workload_weight
+        self.stats = {"selections": 0, "decided": 0, "roster_size": 0, "candidates_sent": 0}
+
+    def select(self, text: str, developers: List[Dict], index: Optional[SkillIndex] = None) -> CandidateSelection:
+        """
+        Score developers against the bug text and keep the top-K
+
+        With a built SkillIndex, skill matches come from its posting lists
+        instead of comparing the text with every developer's skills.
+        """
+        if index is not None and index.is_built:
+            by_id = index.match_text(text)
+            matches_for = lambda dev: by_id.get(dev.get("id"), [])
+        else:
+            keys = text_skill_keys(text)
+            matches_for = lambda dev: [skill for skill in dev.get("skills") or [] if skill_key(skill) in keys]
+
+        # Developers are told apart by ID; names can repeat
+        scored: List[Tuple[float, int, List[str], Dict]] = []
+        for dev in developers:
+            matched = matches_for(dev)
+            workload = dev.get("workload") or 0
+            scored.append((len(matched) - self.workload_weight * workload, workload, matched, dev))
+
+        scored.sort(key=lambda item: (-item[0], item[1], item[3]["name"], item[3].get("id") or 0))
+        candidates = [dev for _, _, _, dev in scored[:self.top_k]]
+        matched_skills = {dev.get("id"): matched for _, _, matched, dev in scored}
+
+        self.stats["selections"] += 1
+        self.stats["roster_size"] += len(developers)
+
+        decisive = None
+        if scored and scored[0][2]:
+            runner_up = scored[1][0] if len(scored) > 1 else float("-inf")
+            if scored[0][0] - runner_up >= self.dominance_margin:
+                decisive = self._suggestion(scored[0][3], scored[0][2])
+                self.stats["decided"] += 1
+
+        if decisive is None:
+            self.stats["candidates_sent"] += len(candidates)
+        return CandidateSelection(candidates, matched_skills, decisive)
+
+    def _suggestion(self, dev: Dict, matched: List[str]) -> Dict[str, any]:
+        """Developer suggestion for a candidate assigned without the LLM"""
+        return {
+            "developer_name": dev["name"],
+            "developer_id": dev.get("id"),
+            "confidence": round(min(0.95, 0.6 + 0.1 * len(matched)), 2),
+            "reasoning": (
+                f"Skill match ({', '.join(matched)}) with workload {dev.get('workload') or 0}; "
+                f"no other developer within {self.dominance_margin:g} points"
+            )
+        }
+
+    def get_stats(self) -> Dict[str, any]:
+        """Selection counters for the metrics endpoint"""
+        selections = self.stats["selections"]
+        prompted = selections - self.stats["decided"]
+        return {
+            "top_k": self.top_k,
+            "dominance_margin": self.dominance_margin,
+            "selections": selections,
+            "assigned_without_llm": self.stats["decided"],
+            "avg_roster_size": round(self.stats["roster_size"] / selections, 2) if selections else 0.0,
+            "avg_candidates_prompted": round(self.stats["candidates_sent"] / prompted, 2) if prompted else 0.0
+        }
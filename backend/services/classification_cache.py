@@ -0,0 +1,314 @@
+"""
+Classification Cache for HackForce AI API
+Content-addressed cache for Groq severity classifications, so repeated bug
+reports (retries, webhook replays, duplicate crash reports) skip the LLM
+"""
+
+import os
+import re
+import json
+import time
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+# Try to import redis for the shared tier, but don't fail if it's not available
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Casefold and collapse whitespace so trivially different reports share a key"""
+    return _WHITESPACE_RE.sub(" ", (text or "").strip()).casefold()
+
+
+def make_cache_key(title: str, description: str, model: str, prompt_version: str) -> str:
+    """
+    Build a content-addressed key for a classification
+
+    The model name and prompt version are part of the key so that changing
+    either naturally invalidates previously cached answers.
+    """
+    payload = "\x1f".join([
+        model,
+        prompt_version,
+        normalize_text(title),
+        normalize_text(description)
+    ])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LocalSharedBackend:
+    """
+    In-process stand-in for a shared cache server (same get/set surface as Redis)
+    """
+
+    # Calls never wait on I/O, so the async path runs them on the event loop
+    blocking = False
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+
+    def set_many(self, values: Dict[str, str], ttl: int) -> None:
+        for key, value in values.items():
+            self.set(key, value, ttl)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class RedisBackend:
+    """
+    Shared cache tier backed by Redis
+
+    The client is synchronous (shared with the sync service and scripts); the
+    async path runs its calls in the default executor.
+    """
+
+    blocking = True
+
+    def __init__(self, url: str, prefix: str = "hackforce:classification:"):
+        self.client = redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.25)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(self.prefix + key)
+        return value.decode("utf-8") if value is not None else None
+
+    def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """One MGET round trip for several keys"""
+        values = self.client.mget([self.prefix + key for key in keys])
+        return [value.decode("utf-8") if value is not None else None for value in values]
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        self.client.set(self.prefix + key, value, ex=ttl)
+
+    def set_many(self, values: Dict[str, str], ttl: int) -> None:
+        """Pipeline several SETs into one round trip"""
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value in values.items():
+            pipeline.set(self.prefix + key, value, ex=ttl)
+        pipeline.execute()
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+
+class ClassificationCache:
+    """
+    Two-tier cache: in-process LRU with TTL, backed by an optional shared tier
+    """
+
+    def __init__(
+        self,
+        max_size: int = 2048,
+        ttl: int = 3600,
+        backend=None,
+        shared_ttl: int = 86400
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.backend = backend
+        self.shared_ttl = shared_ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.shared_errors = 0
+
+    def get(self, key: str) -> Optional[Dict[str, any]]:
+        """Return a cached classification, or None on miss"""
+        now = time.monotonic()
+        value = self._get_local(key, now)
+        if value is not None:
+            return value
+
+        raw = None
+        if self.backend is not None:
+            try:
+                raw = self.backend.get(key)
+            except Exception as e:
+                print(f"⚠️  Shared classification cache unavailable: {e}")
+                self.shared_errors += 1
+        return self._shared_result(key, raw, now)
+
+    async def aget(self, key: str) -> Optional[Dict[str, any]]:
+        """get() for the event loop: the shared tier is never read on the loop thread"""
+        return (await self.aget_many([key]))[0]
+
+    async def aget_many(self, keys: List[str]) -> List[Optional[Dict[str, any]]]:
+        """Cached classifications aligned with keys; local misses share one shared-tier round trip"""
+        now = time.monotonic()
+        results = [self._get_local(key, now) for key in keys]
+        missing = [index for index, value in enumerate(results) if value is None]
+        if not missing:
+            return results
+
+        raws = [None] * len(missing)
+        if self.backend is not None:
+            try:
+                raws = await self._call_backend(self.backend.get_many, [keys[index] for index in missing])
+            except Exception as e:
+                print(f"⚠️  Shared classification cache unavailable: {e}")
+                self.shared_errors += 1
+        for index, raw in zip(missing, raws):
+            results[index] = self._shared_result(keys[index], raw, now)
+        return results
+
+    def set(self, key: str, value: Dict[str, any]) -> None:
+        """Store a classification in both tiers"""
+        value = dict(value)
+        self._store_local(key, value, time.monotonic())
+
+        if self.backend is not None:
+            try:
+                self.backend.set(key, json.dumps(value), self.shared_ttl)
+            except Exception as e:
+                print(f"⚠️  Shared classification cache unavailable: {e}")
+                self.shared_errors += 1
+
+    async def aset(self, key: str, value: Dict[str, any]) -> None:
+        """set() for the event loop"""
+        await self.aset_many({key: value})
+
+    async def aset_many(self, values: Dict[str, Dict[str, any]]) -> None:
+        """Store several classifications, writing the shared tier in one round trip"""
+        now = time.monotonic()
+        values = {key: dict(value) for key, value in values.items()}
+        for key, value in values.items():
+            self._store_local(key, value, now)
+
+        if self.backend is not None and values:
+            try:
+                serialized = {key: json.dumps(value) for key, value in values.items()}
+                await self._call_backend(self.backend.set_many, serialized, self.shared_ttl)
+            except Exception as e:
+                print(f"⚠️  Shared classification cache unavailable: {e}")
+                self.shared_errors += 1
+
+    async def _call_backend(self, method, *args):
+        """Run a shared-tier call, in the default executor if it does network I/O"""
+        if not getattr(self.backend, "blocking", True):
+            return method(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, method, *args)
+
+    def clear(self) -> None:
+        """Drop every cached entry (both tiers)"""
+        with self._lock:
+            self._entries.clear()
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self) -> Dict[str, any]:
+        """Hit/miss counters for the metrics endpoint"""
+        hits = self.local_hits + self.shared_hits
+        lookups = hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            "shared_backend": type(self.backend).__name__ if self.backend is not None else None,
+            "hits": hits,
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "shared_errors": self.shared_errors
+        }
+
+    def _get_local(self, key: str, now: float) -> Optional[Dict[str, any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self.local_hits += 1
+                return dict(value)
+            del self._entries[key]
+            self.expirations += 1
+            return None
+
+    def _shared_result(self, key: str, raw: Optional[str], now: float) -> Optional[Dict[str, any]]:
+        """Count a local miss as a shared hit (promoting the value) or a miss"""
+        if raw is None:
+            self.misses += 1
+            return None
+        value = json.loads(raw)
+        self._store_local(key, value, now)
+        self.shared_hits += 1
+        return dict(value)
+
+    def _store_local(self, key: str, value: Dict[str, any], now: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, now + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+
+def _create_backend():
+    """Pick the shared tier from CLASSIFICATION_CACHE_BACKEND (none|local|redis)"""
+    backend = os.getenv("CLASSIFICATION_CACHE_BACKEND", "none").lower()
+
+    if backend == "local":
+        return LocalSharedBackend()
+    if backend == "redis":
+        url = os.getenv("CLASSIFICATION_CACHE_REDIS_URL") or os.getenv("REDIS_URL")
+        if not REDIS_AVAILABLE or not url:
+            print("⚠️  Redis cache backend requested but redis/REDIS_URL unavailable. Using local cache only.")
+            return None
+        return RedisBackend(url)
+    return None
+
+
+# Singleton instance - will be created on first use
+classification_cache = None
+
+def get_classification_cache():
+    """Get or create the classification cache singleton (lazy initialization)"""
+    global classification_cache
+    if classification_cache is None:
+        classification_cache = ClassificationCache(
+            max_size=int(os.getenv("CLASSIFICATION_CACHE_SIZE", "2048")),
+            ttl=int(os.getenv("CLASSIFICATION_CACHE_TTL", "3600")),
+            backend=_create_backend(),
+            shared_ttl=int(os.getenv("CLASSIFICATION_CACHE_SHARED_TTL", "86400"))
+        )
+    return classification_cache
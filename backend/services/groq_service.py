@@ -5,11 +5,56 @@ Uses Groq's LLM API to intelligently classify bug severity
 
 import os
 import json
-from typing import Dict, Optional
+import time
+import asyncio
+import hashlib
+from typing import Dict, List, Optional
+
+from services.classification_cache import get_classification_cache, make_cache_key
+from services.single_flight import SingleFlight
+from services.resilience import CircuitBreaker, CircuitOpenError, LatencyTracker, hedged_call
+from services.keyword_matcher import get_keyword_matcher
+from services.local_model import get_local_model
+from services.candidate_selector import CandidateSelector
+from services.skill_index import get_skill_index
+from services.llm_scheduler import (
+    LLMScheduler, SchedulerTimeout,
+    PRIORITY_CRITICAL, PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND, PRIORITY_BATCH
+)
+
+# Bump whenever the classification prompt changes so cached answers are invalidated
+CLASSIFICATION_PROMPT_VERSION = "v1"
+
+# Confidence and impact area reported for each keyword tier in fallback mode
+FALLBACK_TIERS = {
+    "Critical": (0.75, "system"),
+    "High": (0.70, "functionality"),
+    "Low": (0.65, "ui")
+}
+
+# Local model tier: predictions at or above this confidence never reach the LLM
+LOCAL_MODEL_CONFIDENCE_THRESHOLD = float(os.getenv("LOCAL_MODEL_CONFIDENCE_THRESHOLD", "0.8"))
+
+# Batch classification sizing (prompt tokens are estimated at ~4 characters per token)
+BATCH_TOKEN_BUDGET = int(os.getenv("GROQ_BATCH_TOKEN_BUDGET", "6000"))
+BATCH_MAX_ITEMS = int(os.getenv("GROQ_BATCH_MAX_ITEMS", "40"))
+BATCH_CONCURRENCY = int(os.getenv("GROQ_BATCH_CONCURRENCY", "4"))
+BATCH_ITEM_OVERHEAD_TOKENS = 20
+
+# Upstream deadlines, circuit breaker and hedging
+GROQ_TIMEOUT_SECONDS = float(os.getenv("GROQ_TIMEOUT_SECONDS", "8"))
+GROQ_MAX_RETRIES = int(os.getenv("GROQ_MAX_RETRIES", "1"))
+GROQ_LATENCY_SLO_SECONDS = float(os.getenv("GROQ_LATENCY_SLO_SECONDS", "4"))
+GROQ_BREAKER_FAILURES = int(os.getenv("GROQ_BREAKER_FAILURES", "5"))
+GROQ_BREAKER_SLOW_CALLS = int(os.getenv("GROQ_BREAKER_SLOW_CALLS", "5"))
+GROQ_BREAKER_RESET_SECONDS = float(os.getenv("GROQ_BREAKER_RESET_SECONDS", "30"))
+GROQ_HEDGE_ENABLED = os.getenv("GROQ_HEDGE_ENABLED", "false").lower() == "true"
+GROQ_HEDGE_MIN_DELAY_SECONDS = float(os.getenv("GROQ_HEDGE_MIN_DELAY_SECONDS", "0.5"))
+GROQ_HEDGE_MIN_SAMPLES = 20
 
 # Try to import Groq, but don't fail if it's not available
 try:
-    from groq import Groq
+    from groq import Groq, AsyncGroq
     GROQ_AVAILABLE = True
 except ImportError:
     GROQ_AVAILABLE = False
@@ -22,25 +67,53 @@ class GroqService:
     
     def __init__(self):
         """Initialize Groq client"""
+        # Use Mixtral model (fast and accurate)
+        self.model = "mixtral-8x7b-32768"
+        self.cache = get_classification_cache()
+        self.flights = SingleFlight()
+        self.batch_stats = {"requests": 0, "items": 0, "dropped_items": 0}
+        self.timeout = GROQ_TIMEOUT_SECONDS
+        self.breaker = CircuitBreaker(
+            name="groq",
+            failure_threshold=GROQ_BREAKER_FAILURES,
+            slow_call_threshold=GROQ_BREAKER_SLOW_CALLS,
+            latency_slo=GROQ_LATENCY_SLO_SECONDS,
+            reset_timeout=GROQ_BREAKER_RESET_SECONDS
+        )
+        self.latency = LatencyTracker()
+        # Hedges sent, and hedges skipped for lack of rate-limit headroom
+        self.hedge_stats = {"fired": 0, "denied": 0}
+        self.llm_stats = {"succeeded": 0, "failed": 0}
+        # Answers produced by the rule-based fallbacks instead of the LLM
+        self.fallback_stats = {"classifications": 0, "developer_suggestions": 0}
+        self.local_model = get_local_model()
+        self.local_latency = LatencyTracker()
+        self.tier_stats = {"local": 0, "escalated": 0}
+        self.selector = CandidateSelector()
+        self.client = self._create_client()
+    
+    def _create_client(self):
+        """Create the Groq client, or return None to use fallback classification"""
         if not GROQ_AVAILABLE:
             print("⚠️  Groq not installed. Using fallback classification.")
-            self.client = None
-            return
+            return None
             
         api_key = os.getenv("GROQ_API_KEY")
         if not api_key:
             print("⚠️  Warning: GROQ_API_KEY not found. Using fallback classification.")
-            self.client = None
-        else:
-            try:
-                self.client = Groq(api_key=api_key)
-                print("✅ Groq client initialized successfully")
-            except Exception as e:
-                print(f"⚠️  Failed to initialize Groq client: {e}")
-                self.client = None
+            return None
         
-        # Use Mixtral model (fast and accurate)
-        self.model = "mixtral-8x7b-32768"
+        try:
+            client = self._new_client(api_key)
+            print(f"✅ {type(client).__name__} client initialized successfully")
+            return client
+        except Exception as e:
+            print(f"⚠️  Failed to initialize Groq client: {e}")
+            return None
+    
+    def _new_client(self, api_key: str):
+        """Instantiate the underlying SDK client"""
+        return Groq(api_key=api_key, timeout=self.timeout, max_retries=GROQ_MAX_RETRIES)
     
     def classify_bug_severity(self, title: str, description: str) -> Dict[str, any]:
         """
@@ -56,34 +129,23 @@ class GroqService:
         if not self.client:
             return self._fallback_classification(title, description)
         
+        # Confident local-model predictions never reach the LLM
+        local = self._local_tier(title, description)
+        if local is not None:
+            return local
+        
+        cache_key = self._cache_key(title, description)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            # Create prompt for Groq
-            prompt = self._create_classification_prompt(title, description)
-            
-            # Call Groq API
-            response = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert software bug triaging system. Analyze bugs and classify their severity accurately."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                model=self.model,
-                temperature=0.3,  # Lower temperature for more consistent results
-                max_tokens=500,
-                response_format={"type": "json_object"}  # Request JSON response
+            # Identical concurrent reports share one upstream call
+            classification = self.flights.do_sync(
+                cache_key,
+                lambda: self._request_classification(title, description, cache_key)
             )
-            
-            # Parse response
-            result_text = response.choices[0].message.content
-            result = json.loads(result_text)
-            
-            # Validate and normalize result
-            return self._normalize_result(result)
+            return dict(classification)
             
         except Exception as e:
             print(f"❌ Groq API error: {e}")
@@ -101,37 +163,299 @@ class GroqService:
         Returns:
             Dict with suggested developer and reasoning
         """
-        if not self.client or not developers:
+        if not developers:
             return self._fallback_developer_suggestion(developers)
         
+        # Only the best skill/workload candidates reach the prompt; a dominant one skips it
+        selection = self.selector.select(bug_description, developers, get_skill_index())
+        if selection.decisive is not None:
+            return selection.decisive
+        return self._suggest_among(bug_description, severity, selection.candidates)
+    
+    def _suggest_among(self, bug_description: str, severity: str, candidates: list) -> Dict[str, any]:
+        """Ask Groq to pick one of the pre-selected candidates"""
+        if not self.client:
+            return self._fallback_developer_suggestion(candidates)
+        
         try:
-            prompt = self._create_developer_prompt(bug_description, severity, developers)
-            
-            response = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert at matching bugs to developers based on their skills and workload."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                model=self.model,
-                temperature=0.3,
-                max_tokens=300,
-                response_format={"type": "json_object"}
-            )
+            return self._complete(self._build_developer_request(bug_description, severity, candidates))
             
-            result_text = response.choices[0].message.content
-            result = json.loads(result_text)
+        except Exception as e:
+            print(f"❌ Groq API error in developer suggestion: {e}")
+            return self._fallback_developer_suggestion(candidates)
+    
+    def triage_bug(self, title: str, description: str, developers: list) -> Dict[str, any]:
+        """
+        Classify severity and suggest a developer with a single LLM call
+        
+        Falls back to the two-call path (classify_bug_severity then
+        suggest_developer) only when the combined response fails validation.
+        
+        Args:
+            title: Bug title
+            description: Bug description
+            developers: List of available developers with skills
             
-            return result
+        Returns:
+            Dict with severity, confidence, reasoning, impact_areas, developer_name
+            and developer_id (None when unassigned)
+        """
+        if not developers:
+            return self._merge_triage(self.classify_bug_severity(title, description), developers)
+        
+        # Rank the roster first: a dominant candidate is assigned without asking
+        # the LLM, otherwise only the top-K candidates go into the prompt
+        selection = self.selector.select(f"{title} {description}", developers, get_skill_index())
+        if selection.decisive is not None:
+            return self._merge_triage(self.classify_bug_severity(title, description), developers, selection.decisive)
+        developers = selection.candidates
+        
+        if not self.client:
+            return self._fallback_triage(title, description, developers)
+        
+        # A confident local prediction or a cached classification leaves only
+        # the developer suggestion to ask for
+        cache_key = self._cache_key(title, description)
+        cached = self._local_tier(title, description) or self.cache.get(cache_key)
+        if cached is not None:
+            suggestion = self._suggest_among(
+                bug_description=f"{title}: {description}",
+                severity=cached["severity"],
+                candidates=developers
+            )
+            return self._merge_triage(cached, developers, suggestion)
+        
+        try:
+            triage = self.flights.do_sync(
+                self._triage_flight_key(cache_key, developers),
+                lambda: self._request_triage(title, description, developers, cache_key)
+            )
+            return dict(triage)
             
+        except ValueError as e:
+            print(f"⚠️  Combined triage response invalid ({e}), using two-call path")
+            classification = self.classify_bug_severity(title, description)
+            suggestion = self._suggest_among(
+                bug_description=f"{title}: {description}",
+                severity=classification["severity"],
+                candidates=developers
+            )
+            return self._merge_triage(classification, developers, suggestion)
         except Exception as e:
-            print(f"❌ Groq API error in developer suggestion: {e}")
-            return self._fallback_developer_suggestion(developers)
+            print(f"❌ Groq API error in triage: {e}")
+            return self._fallback_triage(title, description, developers)
+    
+    def _complete(self, request: Dict[str, any]) -> Dict[str, any]:
+        """
+        Run one chat completion behind the circuit breaker and return the parsed JSON
+        
+        Raises CircuitOpenError without contacting Groq while the circuit is open.
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError("Groq circuit open")
+        
+        started = time.perf_counter()
+        try:
+            response = self.client.chat.completions.create(**request, timeout=self.timeout)
+        except Exception:
+            self.llm_stats["failed"] += 1
+            self.breaker.record_failure()
+            raise
+        
+        self._record_latency(time.perf_counter() - started)
+        return json.loads(response.choices[0].message.content)
+    
+    def _record_latency(self, latency: float) -> None:
+        """Feed a successful call's latency to the breaker and percentile tracker"""
+        self.llm_stats["succeeded"] += 1
+        self.latency.record(latency)
+        self.breaker.record_success(latency)
+    
+    def _local_tier(self, title: str, description: str) -> Optional[Dict[str, any]]:
+        """
+        First classification tier: the local model's prediction if it clears
+        LOCAL_MODEL_CONFIDENCE_THRESHOLD, otherwise None to escalate to the LLM
+        """
+        if self.local_model is None:
+            return None
+        
+        started = time.perf_counter()
+        classification = self.local_model.predict(title, description)
+        self.local_latency.record(time.perf_counter() - started)
+        
+        if classification["confidence"] >= LOCAL_MODEL_CONFIDENCE_THRESHOLD:
+            self.tier_stats["local"] += 1
+            return classification
+        
+        self.tier_stats["escalated"] += 1
+        return None
+    
+    def _request_classification(self, title: str, description: str, cache_key: str) -> Dict[str, any]:
+        """Call Groq for a classification and cache the normalized result"""
+        result = self._complete(self._build_classification_request(title, description))
+        
+        # Validate and normalize result
+        classification = self._normalize_result(result)
+        self.cache.set(cache_key, classification)
+        return classification
+    
+    def _request_triage(self, title: str, description: str, developers: list, cache_key: str) -> Dict[str, any]:
+        """Call Groq for a combined triage; raises ValueError if the response is invalid"""
+        result = self._complete(self._build_triage_request(title, description, developers))
+        triage = self._normalize_triage_result(result, developers)
+        self.cache.set(cache_key, self._classification_part(triage))
+        return triage
+    
+    def get_metrics(self) -> Dict[str, any]:
+        """Runtime metrics for the AI layer"""
+        return {
+            "model": self.model,
+            "llm_enabled": self.client is not None,
+            "cache": self.cache.stats(),
+            "coalescing": self.flights.stats(),
+            "batch": dict(self.batch_stats),
+            "circuit_breaker": self.breaker.stats(),
+            "latency": {
+                "p50_seconds": self.latency.percentile(50),
+                "p95_seconds": self.latency.percentile(95),
+                "samples": len(self.latency)
+            },
+            "hedging": {"enabled": GROQ_HEDGE_ENABLED, **self.hedge_stats},
+            "llm_calls": dict(self.llm_stats),
+            "fallbacks": dict(self.fallback_stats),
+            "tiers": self._tier_metrics(),
+            "candidate_selection": {**self.selector.get_stats(), "skill_index": get_skill_index().stats()}
+        }
+    
+    def _tier_metrics(self) -> Dict[str, any]:
+        """Local model vs. LLM tier usage and latency"""
+        answered = self.tier_stats["local"] + self.tier_stats["escalated"]
+        return {
+            "local_model": self.local_model.version if self.local_model is not None else None,
+            "confidence_threshold": LOCAL_MODEL_CONFIDENCE_THRESHOLD,
+            "answered_locally": self.tier_stats["local"],
+            "escalated_to_llm": self.tier_stats["escalated"],
+            "escalation_rate": round(self.tier_stats["escalated"] / answered, 4) if answered else 0.0,
+            "local_latency": {
+                "p50_seconds": self.local_latency.percentile(50),
+                "p95_seconds": self.local_latency.percentile(95)
+            },
+            "llm_latency": {
+                "p50_seconds": self.latency.percentile(50),
+                "p95_seconds": self.latency.percentile(95)
+            }
+        }
+    
+    def _cache_key(self, title: str, description: str) -> str:
+        """Content-addressed cache key for a classification"""
+        return make_cache_key(title, description, self.model, CLASSIFICATION_PROMPT_VERSION)
+    
+    def _triage_flight_key(self, cache_key: str, developers: list) -> str:
+        """Coalescing key for triage: same bug text against the same roster"""
+        roster = json.dumps(
+            [[dev.get("id"), dev["name"], dev.get("workload", 0), dev.get("skills") or []] for dev in developers],
+            sort_keys=True
+        )
+        return f"triage:{cache_key}:{hashlib.sha256(roster.encode('utf-8')).hexdigest()}"
+    
+    def _classification_part(self, triage: Dict[str, any]) -> Dict[str, any]:
+        """Extract the cacheable severity classification from a triage result"""
+        return {key: triage[key] for key in ("severity", "confidence", "reasoning", "impact_areas")}
+    
+    def _build_classification_request(self, title: str, description: str) -> Dict[str, any]:
+        """Build chat completion arguments for bug classification"""
+        return {
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an expert software bug triaging system. Analyze bugs and classify their severity accurately."
+                },
+                {
+                    "role": "user",
+                    "content": self._create_classification_prompt(title, description)
+                }
+            ],
+            "model": self.model,
+            "temperature": 0.3,  # Lower temperature for more consistent results
+            "max_tokens": 500,
+            "response_format": {"type": "json_object"}  # Request JSON response
+        }
+    
+    def _build_developer_request(self, bug_description: str, severity: str, developers: list) -> Dict[str, any]:
+        """Build chat completion arguments for developer suggestion"""
+        return {
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an expert at matching bugs to developers based on their skills and workload."
+                },
+                {
+                    "role": "user",
+                    "content": self._create_developer_prompt(bug_description, severity, developers)
+                }
+            ],
+            "model": self.model,
+            "temperature": 0.3,
+            "max_tokens": 300,
+            "response_format": {"type": "json_object"}
+        }
+    
+    def _build_triage_request(self, title: str, description: str, developers: list) -> Dict[str, any]:
+        """Build chat completion arguments for combined severity + developer triage"""
+        return {
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an expert software bug triaging system. Classify bug severity accurately and match bugs to developers based on their skills and workload."
+                },
+                {
+                    "role": "user",
+                    "content": self._create_triage_prompt(title, description, developers)
+                }
+            ],
+            "model": self.model,
+            "temperature": 0.3,
+            "max_tokens": 600,
+            "response_format": {"type": "json_object"}
+        }
+    
+    def _build_batch_request(self, items: List[Dict[str, any]]) -> Dict[str, any]:
+        """Build chat completion arguments for classifying several bugs at once"""
+        return {
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an expert software bug triaging system. Analyze bugs and classify their severity accurately."
+                },
+                {
+                    "role": "user",
+                    "content": self._create_batch_prompt(items)
+                }
+            ],
+            "model": self.model,
+            "temperature": 0.3,
+            "max_tokens": 100 + 80 * len(items),
+            "response_format": {"type": "json_object"}
+        }
+    
+    def _chunk_batch(self, items: List[Dict[str, any]], token_budget: int) -> List[List[Dict[str, any]]]:
+        """Split batch items into chunks whose estimated prompt size fits the token budget"""
+        chunks = []
+        current = []
+        current_tokens = 0
+        
+        for item in items:
+            item_tokens = (len(item["title"]) + len(item["description"])) // 4 + BATCH_ITEM_OVERHEAD_TOKENS
+            if current and (current_tokens + item_tokens > token_budget or len(current) >= BATCH_MAX_ITEMS):
+                chunks.append(current)
+                current = []
+                current_tokens = 0
+            current.append(item)
+            current_tokens += item_tokens
+        
+        if current:
+            chunks.append(current)
+        return chunks
     
     def _create_classification_prompt(self, title: str, description: str) -> str:
         """Create prompt for bug classification"""
@@ -189,17 +513,99 @@ Respond in JSON format:
     "reasoning": "why this developer is the best match"
 }}"""
     
-    def _normalize_result(self, result: Dict) -> Dict[str, any]:
-        """Normalize and validate AI result"""
+    def _create_batch_prompt(self, items: List[Dict[str, any]]) -> str:
+        """Create prompt for classifying several bugs in one request"""
+        bug_list = "\n\n".join([
+            f"Bug {item['id']}:\nTitle: {item['title']}\nDescription: {item['description']}"
+            for item in items
+        ])
+        
+        return f"""Analyze each of these bug reports and classify its severity.
+
+{bug_list}
+
+Severity Levels:
+- Critical: System crashes, security vulnerabilities, data loss, affects all users
+- High: Major functionality broken, affects many users, no workaround
+- Medium: Functionality impaired, affects some users, workaround exists
+- Low: Minor issues, cosmetic problems, affects few users
+
+Respond in JSON format with one entry per bug, using the bug numbers given above:
+{{
+    "results": [
+        {{
+            "id": 0,
+            "severity": "Critical|High|Medium|Low",
+            "confidence": 0.0-1.0,
+            "reasoning": "brief explanation of why this severity was chosen",
+            "impact_areas": ["list", "of", "affected", "areas"]
+        }}
+    ]
+}}"""
+    
+    def _create_triage_prompt(self, title: str, description: str, developers: list) -> str:
+        """Create prompt for combined severity classification and developer assignment"""
+        dev_list = "\n".join([
+            f"- {dev['name']}: Skills: {', '.join(dev.get('skills') or [])}, Current workload: {dev.get('workload', 0)} bugs"
+            for dev in developers
+        ])
+        
+        return f"""Analyze this bug report, classify its severity and suggest the best developer to assign.
+
+Bug Title: {title}
+
+Bug Description: {description}
+
+Severity Levels:
+- Critical: System crashes, security vulnerabilities, data loss, affects all users
+- High: Major functionality broken, affects many users, no workaround
+- Medium: Functionality impaired, affects some users, workaround exists
+- Low: Minor issues, cosmetic problems, affects few users
+
+Available Developers:
+{dev_list}
+
+When choosing a developer consider:
+1. Developer skills matching the bug type
+2. Current workload (prefer less busy developers)
+3. Severity (critical bugs need experienced developers)
+
+Respond in JSON format:
+{{
+    "severity": "Critical|High|Medium|Low",
+    "confidence": 0.0-1.0,
+    "reasoning": "brief explanation of why this severity was chosen",
+    "impact_areas": ["list", "of", "affected", "areas"],
+    "developer_name": "exact name of suggested developer from the list",
+    "developer_confidence": 0.0-1.0,
+    "developer_reasoning": "why this developer is the best match"
+}}"""
+    
+    def _normalize_result(self, result: Dict, strict: bool = False) -> Dict[str, any]:
+        """
+        Normalize and validate AI result
+        
+        With strict=True invalid values raise ValueError instead of being
+        coerced to defaults, so callers can detect a malformed response.
+        """
         severity = result.get("severity", "Medium")
         
         # Ensure severity is valid
         valid_severities = ["Critical", "High", "Medium", "Low"]
         if severity not in valid_severities:
+            if strict:
+                raise ValueError(f"invalid severity: {severity!r}")
             severity = "Medium"
         
         # Ensure confidence is between 0 and 1
-        confidence = float(result.get("confidence", 0.7))
+        if strict and "confidence" not in result:
+            raise ValueError("missing confidence")
+        try:
+            confidence = float(result.get("confidence", 0.7))
+        except (TypeError, ValueError):
+            if strict:
+                raise ValueError(f"invalid confidence: {result.get('confidence')!r}")
+            confidence = 0.7
         confidence = max(0.0, min(1.0, confidence))
         
         return {
@@ -209,61 +615,89 @@ Respond in JSON format:
             "impact_areas": result.get("impact_areas", [])
         }
     
+    def _normalize_triage_result(self, result: Dict, developers: list) -> Dict[str, any]:
+        """Validate a combined triage response; raises ValueError if unusable"""
+        triage = self._normalize_result(result, strict=True)
+        
+        developer_name = result.get("developer_name")
+        if developer_name not in {dev["name"] for dev in developers}:
+            raise ValueError(f"unknown developer: {developer_name!r}")
+        
+        try:
+            developer_confidence = float(result.get("developer_confidence", triage["confidence"]))
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid developer_confidence: {result.get('developer_confidence')!r}")
+        triage.update({
+            "developer_name": developer_name,
+            "developer_id": self._developer_id(developer_name, developers),
+            "developer_confidence": max(0.0, min(1.0, developer_confidence)),
+            "developer_reasoning": result.get("developer_reasoning", "AI developer match")
+        })
+        return triage
+    
+    def _merge_triage(self, classification: Dict, developers: list, suggestion: Optional[Dict] = None) -> Dict[str, any]:
+        """Combine separate classification and developer suggestion results"""
+        if suggestion is None:
+            suggestion = self._fallback_developer_suggestion(developers)
+        
+        developer_name = suggestion.get("developer_name", "Unassigned")
+        triage = dict(classification)
+        triage.update({
+            "developer_name": developer_name,
+            "developer_id": self._developer_id(developer_name, developers, suggestion.get("developer_id")),
+            "developer_confidence": suggestion.get("confidence", 0.0),
+            "developer_reasoning": suggestion.get("reasoning", "")
+        })
+        return triage
+    
+    def _developer_id(self, developer_name: Optional[str], developers: list, preferred_id: Optional[int] = None) -> Optional[int]:
+        """
+        ID of the named developer among those offered, or None; LLM answers
+        name developers, bugs store IDs. preferred_id (set by the rule-based
+        suggestions) picks between developers sharing the name, otherwise
+        the first one wins.
+        """
+        matches = [dev.get("id") for dev in developers if dev["name"] == developer_name]
+        if preferred_id in matches:
+            return preferred_id
+        return matches[0] if matches else None
+    
+    def _fallback_triage(self, title: str, description: str, developers: list) -> Dict[str, any]:
+        """Rule-based triage when Groq is unavailable"""
+        return self._merge_triage(self._fallback_classification(title, description), developers)
+    
     def _fallback_classification(self, title: str, description: str) -> Dict[str, any]:
         """
-        Simple rule-based classification when Groq is unavailable
+        Classification when Groq is unavailable: the local model's prediction
+        if it clears LOCAL_MODEL_CONFIDENCE_THRESHOLD (the same bar as for
+        skipping the LLM), otherwise simple keyword rules
         """
-        text = f"{title} {description}".lower()
-        
-        # Critical keywords
-        critical_keywords = [
-            "crash", "security", "data loss", "critical", "urgent",
-            "vulnerability", "exploit", "breach", "sql injection",
-            "authentication bypass", "production down"
-        ]
-        
-        # High severity keywords
-        high_keywords = [
-            "error", "bug", "broken", "not working", "fails", "failure",
-            "cannot", "unable", "doesn't work", "500 error", "timeout",
-            "database", "api down", "login failed"
-        ]
-        
-        # Low severity keywords
-        low_keywords = [
-            "typo", "cosmetic", "minor", "suggestion", "improvement",
-            "enhancement", "ui", "text", "color", "spacing", "alignment"
-        ]
-        
-        # Check for keywords
-        if any(keyword in text for keyword in critical_keywords):
-            return {
-                "severity": "Critical",
-                "confidence": 0.75,
-                "reasoning": "Keyword-based classification (fallback mode)",
-                "impact_areas": ["system"]
-            }
-        elif any(keyword in text for keyword in high_keywords):
-            return {
-                "severity": "High",
-                "confidence": 0.70,
-                "reasoning": "Keyword-based classification (fallback mode)",
-                "impact_areas": ["functionality"]
-            }
-        elif any(keyword in text for keyword in low_keywords):
-            return {
-                "severity": "Low",
-                "confidence": 0.65,
-                "reasoning": "Keyword-based classification (fallback mode)",
-                "impact_areas": ["ui"]
-            }
-        else:
+        self.fallback_stats["classifications"] += 1
+        if self.local_model is not None:
+            classification = self.local_model.predict(title, description)
+            if classification["confidence"] >= LOCAL_MODEL_CONFIDENCE_THRESHOLD:
+                return classification
+        
+        severity = get_keyword_matcher().match(f"{title} {description}")
+        return self._fallback_result(severity)
+    
+    def _fallback_result(self, severity: Optional[str]) -> Dict[str, any]:
+        """Build a fallback classification for a keyword tier (None means no keyword hit)"""
+        if severity is None:
             return {
                 "severity": "Medium",
                 "confidence": 0.60,
                 "reasoning": "Default classification (fallback mode)",
                 "impact_areas": ["general"]
             }
+        
+        confidence, impact_area = FALLBACK_TIERS[severity]
+        return {
+            "severity": severity,
+            "confidence": confidence,
+            "reasoning": "Keyword-based classification (fallback mode)",
+            "impact_areas": [impact_area]
+        }
     
     def _fallback_developer_suggestion(self, developers: list) -> Dict[str, any]:
         """Fallback developer suggestion based on workload"""
@@ -274,18 +708,373 @@ Respond in JSON format:
                 "reasoning": "No developers available"
             }
         
+        self.fallback_stats["developer_suggestions"] += 1
         # Find developer with lowest workload
         best_dev = min(developers, key=lambda d: d.get('workload', 0))
         
         return {
             "developer_name": best_dev['name'],
+            "developer_id": best_dev.get('id'),
             "confidence": 0.5,
             "reasoning": f"Assigned to developer with lowest workload ({best_dev.get('workload', 0)} bugs)"
         }
 
 
-# Singleton instance - will be created on first use to avoid import-time errors
+class AsyncGroqService(GroqService):
+    """
+    Non-blocking variant of GroqService built on the AsyncGroq client
+
+    Prompts, normalization and fallbacks are shared with GroqService; only the
+    transport differs, so FastAPI handlers can await LLM calls without
+    freezing the event loop. Every call goes through an LLMScheduler, which
+    orders calls by priority and keeps them within the provider's rate limits.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.scheduler = LLMScheduler()
+        self.batch_stats["shed_items"] = 0
+    
+    def _new_client(self, api_key: str):
+        """Instantiate the underlying SDK client"""
+        return AsyncGroq(api_key=api_key, timeout=self.timeout, max_retries=GROQ_MAX_RETRIES)
+    
+    def get_metrics(self) -> Dict[str, any]:
+        """Runtime metrics for the AI layer, including the call scheduler"""
+        return {**super().get_metrics(), "scheduler": self.scheduler.stats()}
+    
+    def _call_priority(self, priority: int, title: str, description: str) -> int:
+        """Promote interactive and background calls for suspected Critical bugs ahead of other traffic"""
+        if PRIORITY_CRITICAL < priority <= PRIORITY_BACKGROUND and get_keyword_matcher().match(f"{title} {description}") == "Critical":
+            return PRIORITY_CRITICAL
+        return priority
+    
+    async def classify(self, title: str, description: str, priority: int = PRIORITY_INTERACTIVE) -> Dict[str, any]:
+        """
+        Classify bug severity without blocking the event loop
+        
+        Args:
+            title: Bug title
+            description: Bug description
+            priority: Scheduler priority for the LLM call (PRIORITY_* constants)
+            
+        Returns:
+            Dict with severity, confidence, and reasoning
+        """
+        if not self.client:
+            return self._fallback_classification(title, description)
+        
+        # Confident local-model predictions never reach the LLM
+        local = self._local_tier(title, description)
+        if local is not None:
+            return local
+        
+        cache_key = self._cache_key(title, description)
+        cached = await self.cache.aget(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            # Identical concurrent reports share one upstream call
+            priority = self._call_priority(priority, title, description)
+            classification = await self.flights.do(
+                cache_key,
+                lambda: self._arequest_classification(title, description, cache_key, priority)
+            )
+            return dict(classification)
+            
+        except Exception as e:
+            print(f"❌ Groq API error: {e}")
+            return self._fallback_classification(title, description)
+    
+    async def suggest(self, bug_description: str, severity: str, developers: list, priority: int = PRIORITY_INTERACTIVE) -> Dict[str, any]:
+        """
+        Suggest best developer for the bug without blocking the event loop
+        
+        Args:
+            bug_description: Full bug description
+            severity: Bug severity level
+            developers: List of available developers with skills
+            priority: Scheduler priority for the LLM call (PRIORITY_* constants)
+            
+        Returns:
+            Dict with suggested developer and reasoning
+        """
+        if not developers:
+            return self._fallback_developer_suggestion(developers)
+        
+        # Only the best skill/workload candidates reach the prompt; a dominant one skips it
+        selection = self.selector.select(bug_description, developers, get_skill_index())
+        if selection.decisive is not None:
+            return selection.decisive
+        return await self._asuggest_among(bug_description, severity, selection.candidates, priority)
+    
+    async def _asuggest_among(self, bug_description: str, severity: str, candidates: list, priority: int) -> Dict[str, any]:
+        """Ask Groq to pick one of the pre-selected candidates"""
+        if not self.client:
+            return self._fallback_developer_suggestion(candidates)
+        
+        try:
+            return await self._acomplete(self._build_developer_request(bug_description, severity, candidates), priority=priority)
+            
+        except Exception as e:
+            print(f"❌ Groq API error in developer suggestion: {e}")
+            return self._fallback_developer_suggestion(candidates)
+    
+    async def triage(self, title: str, description: str, developers: list, priority: int = PRIORITY_INTERACTIVE) -> Dict[str, any]:
+        """
+        Classify severity and suggest a developer with a single awaited LLM call
+        
+        Args:
+            title: Bug title
+            description: Bug description
+            developers: List of available developers with skills
+            priority: Scheduler priority for LLM calls (PRIORITY_* constants);
+                suspected Critical bugs are promoted automatically
+            
+        Returns:
+            Dict with severity, confidence, reasoning, impact_areas, developer_name
+            and developer_id (None when unassigned)
+        """
+        if not developers:
+            return self._merge_triage(await self.classify(title, description, priority), developers)
+        
+        # Rank the roster first: a dominant candidate is assigned without asking
+        # the LLM, otherwise only the top-K candidates go into the prompt
+        selection = self.selector.select(f"{title} {description}", developers, get_skill_index())
+        if selection.decisive is not None:
+            return self._merge_triage(await self.classify(title, description, priority), developers, selection.decisive)
+        developers = selection.candidates
+        
+        if not self.client:
+            return self._fallback_triage(title, description, developers)
+        priority = self._call_priority(priority, title, description)
+        
+        # A confident local prediction or a cached classification leaves only
+        # the developer suggestion to ask for
+        cache_key = self._cache_key(title, description)
+        cached = self._local_tier(title, description) or await self.cache.aget(cache_key)
+        if cached is not None:
+            suggestion = await self._asuggest_among(
+                bug_description=f"{title}: {description}",
+                severity=cached["severity"],
+                candidates=developers,
+                priority=priority
+            )
+            return self._merge_triage(cached, developers, suggestion)
+        
+        try:
+            triage = await self.flights.do(
+                self._triage_flight_key(cache_key, developers),
+                lambda: self._arequest_triage(title, description, developers, cache_key, priority)
+            )
+            return dict(triage)
+            
+        except ValueError as e:
+            print(f"⚠️  Combined triage response invalid ({e}), using two-call path")
+            classification = await self.classify(title, description, priority)
+            suggestion = await self._asuggest_among(
+                bug_description=f"{title}: {description}",
+                severity=classification["severity"],
+                candidates=developers,
+                priority=priority
+            )
+            return self._merge_triage(classification, developers, suggestion)
+        except Exception as e:
+            print(f"❌ Groq API error in triage: {e}")
+            return self._fallback_triage(title, description, developers)
+    
+    async def classify_batch(self, items: List[Dict[str, str]], token_budget: Optional[int] = None) -> List[Dict[str, any]]:
+        """
+        Classify many bugs, packing several into each Groq request
+        
+        Items are answered by the local model tier or the cache where possible
+        and deduplicated. The remaining ones are chunked to fit the token budget, one chat
+        completion per chunk. Any item the model drops or answers invalidly
+        is retried with a per-item classify() call. Chunks run at batch
+        priority; chunks the scheduler sheds under load fall back to local
+        classification instead of competing with interactive traffic.
+        
+        Args:
+            items: List of dicts with title and description
+            token_budget: Estimated prompt tokens per request (defaults to GROQ_BATCH_TOKEN_BUDGET)
+            
+        Returns:
+            List of classifications in the same order as items
+        """
+        if not self.client:
+            if self.local_model is not None:
+                return [self._fallback_classification(item["title"], item["description"]) for item in items]
+            severities = get_keyword_matcher().match_many(
+                f"{item['title']} {item['description']}" for item in items
+            )
+            self.fallback_stats["classifications"] += len(items)
+            return [self._fallback_result(severity) for severity in severities]
+        
+        results = [None] * len(items)
+        pending = {}
+        cache_keys = [self._cache_key(item["title"], item["description"]) for item in items]
+        known = [self._local_tier(item["title"], item["description"]) for item in items]
+        # One shared-cache round trip for every item the local model left open
+        open_indexes = [index for index, classification in enumerate(known) if classification is None]
+        cached = await self.cache.aget_many([cache_keys[index] for index in open_indexes])
+        for index, classification in zip(open_indexes, cached):
+            known[index] = classification
+        
+        for index, item in enumerate(items):
+            cache_key = cache_keys[index]
+            if known[index] is not None:
+                results[index] = known[index]
+            elif cache_key in pending:
+                pending[cache_key]["indexes"].append(index)
+            else:
+                pending[cache_key] = {
+                    "id": len(pending),
+                    "title": item["title"],
+                    "description": item["description"],
+                    "cache_key": cache_key,
+                    "indexes": [index]
+                }
+        
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        
+        async def run_chunk(chunk):
+            async with semaphore:
+                classified = await self._arequest_batch(chunk)
+            for item in chunk:
+                if classified is None:
+                    self.batch_stats["shed_items"] += 1
+                    classification = self._fallback_classification(item["title"], item["description"])
+                else:
+                    classification = classified.get(item["id"])
+                if classification is None:
+                    self.batch_stats["dropped_items"] += 1
+                    classification = await self.classify(item["title"], item["description"], PRIORITY_BATCH)
+                for index in item["indexes"]:
+                    results[index] = dict(classification)
+        
+        chunks = self._chunk_batch(list(pending.values()), token_budget or BATCH_TOKEN_BUDGET)
+        await asyncio.gather(*[run_chunk(chunk) for chunk in chunks])
+        return results
+    
+    async def _arequest_batch(self, chunk: List[Dict[str, any]]) -> Optional[Dict[int, Dict[str, any]]]:
+        """
+        Classify one chunk with a single request; returns valid results keyed
+        by item id, or None if the scheduler shed the chunk
+        """
+        self.batch_stats["requests"] += 1
+        self.batch_stats["items"] += len(chunk)
+        
+        try:
+            # Batch requests are never hedged: duplicating them would double quota usage
+            result = await self._acomplete(self._build_batch_request(chunk), hedge=False, priority=PRIORITY_BATCH)
+            entries = result.get("results", [])
+        except SchedulerTimeout as e:
+            print(f"⚠️  Batch chunk shed by the LLM scheduler: {e}")
+            return None
+        except Exception as e:
+            print(f"❌ Groq API error in batch classification: {e}")
+            return {}
+        
+        items_by_id = {item["id"]: item for item in chunk}
+        classified = {}
+        for entry in entries:
+            try:
+                item = items_by_id[int(entry["id"])]
+                classification = self._normalize_result(entry, strict=True)
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue
+            classified[item["id"]] = classification
+        await self.cache.aset_many({items_by_id[item_id]["cache_key"]: classification for item_id, classification in classified.items()})
+        return classified
+    
+    async def _acomplete(self, request: Dict[str, any], hedge: bool = True, priority: int = PRIORITY_INTERACTIVE) -> Dict[str, any]:
+        """
+        Await one chat completion behind the circuit breaker and the call
+        scheduler, with a hard deadline
+        
+        The call first waits for admission at the given priority (raising
+        SchedulerTimeout if it waits too long). With hedging enabled, a second
+        identical request is fired once the first has been outstanding longer
+        than the observed p95 latency, if the rate limits have room for it,
+        and whichever answers first wins.
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError("Groq circuit open")
+        
+        estimated_tokens = self._estimate_tokens(request)
+        try:
+            await self.scheduler.acquire(priority, estimated_tokens)
+        except BaseException:
+            self.breaker.release()
+            raise
+        
+        attempts = 0
+        
+        async def call():
+            nonlocal attempts
+            attempts += 1
+            if attempts > 1:
+                if not self.scheduler.try_acquire(priority, estimated_tokens):
+                    self.hedge_stats["denied"] += 1
+                    raise SchedulerTimeout("no rate-limit headroom for a hedged request")
+                self.hedge_stats["fired"] += 1
+            raw = await self.client.chat.completions.with_raw_response.create(**request)
+            self.scheduler.observe(raw.headers)
+            # AsyncAPIResponse.parse() is a coroutine
+            return await raw.parse()
+        
+        started = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(
+                hedged_call(call, self._hedge_delay() if hedge else None),
+                timeout=self.timeout
+            )
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+        except Exception as e:
+            self.llm_stats["failed"] += 1
+            if getattr(e, "status_code", None) == 429:
+                # Rate limiting is the scheduler's job, not a sign Groq is unhealthy
+                self.scheduler.throttle(getattr(getattr(e, "response", None), "headers", None))
+                self.breaker.release()
+            else:
+                self.breaker.record_failure()
+            raise
+        
+        self._record_latency(time.perf_counter() - started)
+        self.scheduler.settle(estimated_tokens, getattr(getattr(response, "usage", None), "total_tokens", None))
+        return json.loads(response.choices[0].message.content)
+    
+    def _estimate_tokens(self, request: Dict[str, any]) -> int:
+        """Prompt tokens (~4 characters each) plus the completion allowance"""
+        prompt_chars = sum(len(message["content"]) for message in request["messages"])
+        return prompt_chars // 4 + request.get("max_tokens", 0)
+    
+    def _hedge_delay(self) -> Optional[float]:
+        """Delay before hedging: observed p95 latency, or None when hedging is off"""
+        if not GROQ_HEDGE_ENABLED or len(self.latency) < GROQ_HEDGE_MIN_SAMPLES:
+            return None
+        return max(self.latency.percentile(95), GROQ_HEDGE_MIN_DELAY_SECONDS)
+    
+    async def _arequest_classification(self, title: str, description: str, cache_key: str, priority: int) -> Dict[str, any]:
+        """Await Groq for a classification and cache the normalized result"""
+        result = await self._acomplete(self._build_classification_request(title, description), priority=priority)
+        classification = self._normalize_result(result)
+        await self.cache.aset(cache_key, classification)
+        return classification
+    
+    async def _arequest_triage(self, title: str, description: str, developers: list, cache_key: str, priority: int) -> Dict[str, any]:
+        """Await Groq for a combined triage; raises ValueError if the response is invalid"""
+        result = await self._acomplete(self._build_triage_request(title, description, developers), priority=priority)
+        triage = self._normalize_triage_result(result, developers)
+        await self.cache.aset(cache_key, self._classification_part(triage))
+        return triage
+
+# Singleton instances - will be created on first use to avoid import-time errors
 groq_service = None
+async_groq_service = None
 
 def get_groq_service():
     """Get or create the Groq service singleton (lazy initialization)"""
@@ -293,3 +1082,10 @@ def get_groq_service():
     if groq_service is None:
         groq_service = GroqService()
     return groq_service
+
+def get_async_groq_service():
+    """Get or create the async Groq service singleton (lazy initialization)"""
+    global async_groq_service
+    if async_groq_service is None:
+        async_groq_service = AsyncGroqService()
+    return async_groq_service
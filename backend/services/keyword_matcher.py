@@ -0,0 +1,103 @@
+"""
+Keyword Matcher for the rule-based severity fallback
+Compiles the severity keyword tiers once and classifies text in a single
+tokenizing pass with word-boundary aware matching
+"""
+
+import string
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Severity tiers in precedence order: the first tier with a hit wins
+SEVERITY_KEYWORDS: List[Tuple[str, List[str]]] = [
+    ("Critical", [
+        "crash", "security", "data loss", "critical", "urgent",
+        "vulnerability", "exploit", "breach", "sql injection",
+        "authentication bypass", "production down"
+    ]),
+    ("High", [
+        "error", "bug", "broken", "not working", "fails", "failure",
+        "cannot", "unable", "doesn't work", "500 error", "timeout",
+        "database", "api down", "login failed"
+    ]),
+    ("Low", [
+        "typo", "cosmetic", "minor", "suggestion", "improvement",
+        "enhancement", "ui", "text", "color", "spacing", "alignment"
+    ])
+]
+
+# Inflections accepted after a keyword ("crash" also matches "crashes", "crashed")
+KEYWORD_SUFFIXES = ("", "s", "es", "ed", "ing")
+
+# Punctuation (except apostrophes, used by "doesn't") separates words
+_WORD_SEPARATORS = str.maketrans({char: " " for char in string.punctuation if char != "'"})
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern matcher over whole words
+
+    All keywords are compiled into one hash table of word forms, so a text
+    is tokenized once and every token is checked with a single lookup,
+    instead of rescanning the text once per keyword. Multi-word keywords are
+    only confirmed (on the whitespace-normalized text) when all of their
+    words occur as tokens.
+    """
+
+    def __init__(self, tiers: Sequence[Tuple[str, Iterable[str]]] = SEVERITY_KEYWORDS):
+        self.labels = [label for label, _ in tiers]
+        self._word_rank: Dict[str, int] = {}
+        self._phrases: List[Tuple[int, str, Tuple[str, ...]]] = []
+
+        for rank, (_, keywords) in enumerate(tiers):
+            for keyword in keywords:
+                words = tuple(keyword.lower().translate(_WORD_SEPARATORS).split())
+                if len(words) == 1:
+                    for suffix in KEYWORD_SUFFIXES:
+                        form = words[0] + suffix
+                        self._word_rank[form] = min(rank, self._word_rank.get(form, rank))
+                else:
+                    self._phrases.append((rank, " ".join(words), words))
+
+        # Every token that can contribute to a match
+        self._phrase_words = frozenset(word for _, _, words in self._phrases for word in words)
+        self._vocabulary = frozenset(self._word_rank) | self._phrase_words
+
+    def match(self, text: str) -> Optional[str]:
+        """Return the highest-precedence tier label matched in text, or None"""
+        tokens = text.lower().translate(_WORD_SEPARATORS).split()
+        present = self._vocabulary.intersection(tokens)
+        if not present:
+            return None
+
+        no_match = len(self.labels)
+        word_rank = self._word_rank
+        best = min([word_rank[word] for word in present if word in word_rank] or [no_match])
+
+        if best and not present.isdisjoint(self._phrase_words):
+            normalized = f" {' '.join(tokens)} "
+            for rank, phrase, words in self._phrases:
+                if rank < best and present.issuperset(words) and f" {phrase} " in normalized:
+                    best = rank
+
+        return self.labels[best] if best < no_match else None
+
+    def match_many(self, texts: Iterable[str]) -> List[Optional[str]]:
+        """
+        Classify many texts; returns one tier label (or None) per text
+
+        A convenience loop over match(), no faster per text: tokenizing is
+        the dominant cost and cannot be shared between texts.
+        """
+        match = self.match
+        return [match(text) for text in texts]
+
+
+# Singleton instance - compiled on first use
+keyword_matcher = None
+
+def get_keyword_matcher():
+    """Get or create the severity keyword matcher singleton (lazy initialization)"""
+    global keyword_matcher
+    if keyword_matcher is None:
+        keyword_matcher = KeywordMatcher()
+    return keyword_matcher
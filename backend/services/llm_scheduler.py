@@ -0,0 +1,287 @@
+"""
+LLM Call Scheduler for HackForce AI API
+Admits outbound Groq calls in priority order against token-bucket models of
+the provider's requests-per-minute and tokens-per-minute limits. The buckets
+start from configured limits and are corrected from the x-ratelimit-*
+response headers, so interactive traffic is not starved into 429s by bulk
+work: lower priorities queue (and eventually give up) first.
+"""
+
+import os
+import re
+import time
+import heapq
+import asyncio
+import itertools
+from typing import Dict, Mapping, Optional
+
+from services.resilience import LatencyTracker
+
+# Priorities, most urgent first
+PRIORITY_CRITICAL = 0     # suspected Critical bugs
+PRIORITY_INTERACTIVE = 1  # a user is waiting on the response (/api/predict, /api/bugs)
+PRIORITY_BACKGROUND = 2   # asynchronous ingestion workers
+PRIORITY_BATCH = 3        # batch predictions, bulk imports, re-classification
+PRIORITY_NAMES = {
+    PRIORITY_CRITICAL: "critical",
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_BACKGROUND: "background",
+    PRIORITY_BATCH: "batch"
+}
+
+# Starting limits; replaced by the provider's limits once headers are seen
+LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "30"))
+LLM_TOKENS_PER_MINUTE = float(os.getenv("LLM_TOKENS_PER_MINUTE", "6000"))
+
+# Share of each bucket that background and batch calls may not use, kept
+# free for interactive and Critical traffic
+LLM_RESERVED_FRACTION = float(os.getenv("LLM_RESERVED_FRACTION", "0.25"))
+
+# Longest time a call may wait for admission before the caller falls back
+LLM_MAX_WAIT_SECONDS = {
+    PRIORITY_CRITICAL: float(os.getenv("LLM_CRITICAL_MAX_WAIT", "2")),
+    PRIORITY_INTERACTIVE: float(os.getenv("LLM_INTERACTIVE_MAX_WAIT", "2")),
+    PRIORITY_BACKGROUND: float(os.getenv("LLM_BACKGROUND_MAX_WAIT", "30")),
+    PRIORITY_BATCH: float(os.getenv("LLM_BATCH_MAX_WAIT", "120"))
+}
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class SchedulerTimeout(Exception):
+    """Raised when a call is not admitted within its priority's maximum wait"""
+    pass
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parse rate-limit reset values such as "7.66s", "2m59.56s", "120ms" or "30" (seconds)"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """Continuously refilling bucket; levels may go negative when estimates undershoot"""
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.rate = refill_per_second
+        self.level = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, reserve: float = 0.0) -> float:
+        """
+        Seconds until amount can be taken while leaving reserve (a fraction of capacity)
+
+        Calls larger than the usable share (capacity minus reserve) wait for
+        that whole share rather than forever; the level then goes negative and
+        later calls wait for the refill.
+        """
+        self._refill()
+        needed = min(amount, self.capacity * (1 - reserve)) + reserve * self.capacity
+        if self.level >= needed:
+            return 0.0
+        return (needed - self.level) / self.rate if self.rate > 0 else float("inf")
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.level -= amount
+
+    def give(self, amount: float) -> None:
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+    def cap(self, level: float) -> None:
+        """Lower the level to what the provider reports as remaining"""
+        self._refill()
+        self.level = min(self.level, level)
+
+    def resize(self, capacity: float, refill_per_second: float) -> None:
+        self._refill()
+        self.capacity = capacity
+        self.rate = refill_per_second
+        self.level = min(self.level, capacity)
+
+
+class LLMScheduler:
+    """
+    Priority admission queue in front of the LLM client
+
+    acquire() returns once a call may be sent: waiters are admitted strictly in
+    (priority, arrival) order, and only when both the request and the token
+    bucket allow it. Background and batch calls must also leave the reserved
+    share of each bucket untouched. A 429 or an exhausted limit reported in
+    headers pauses all admissions until the provider's reset time.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = LLM_REQUESTS_PER_MINUTE,
+        tokens_per_minute: float = LLM_TOKENS_PER_MINUTE,
+        reserved_fraction: float = LLM_RESERVED_FRACTION,
+        max_wait: Optional[Dict[int, float]] = None
+    ):
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+        self.reserved_fraction = reserved_fraction
+        self.max_wait = dict(max_wait or LLM_MAX_WAIT_SECONDS)
+        self._heap = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._paused_until = 0.0
+        self._waits = {priority: LatencyTracker() for priority in PRIORITY_NAMES}
+        self._admitted = {priority: 0 for priority in PRIORITY_NAMES}
+        self._timed_out = {priority: 0 for priority in PRIORITY_NAMES}
+        self._stats = {"rate_limited": 0, "headers_seen": 0}
+
+    async def acquire(self, priority: int, tokens: float) -> None:
+        """
+        Wait for admission of a call estimated at tokens (prompt + max completion)
+
+        Raises SchedulerTimeout after the priority's maximum wait.
+        """
+        loop = asyncio.get_running_loop()
+        if not self._heap and self._wait_time(priority, tokens) == 0:
+            self._admit(priority, tokens, 0.0)
+            return
+
+        future = loop.create_future()
+        heapq.heappush(self._heap, (priority, next(self._sequence), tokens, future, time.monotonic()))
+        self._pump()
+        try:
+            await asyncio.wait_for(future, self.max_wait.get(priority, 0))
+        except asyncio.TimeoutError:
+            self._timed_out[priority] += 1
+            self._pump()
+            raise SchedulerTimeout(
+                f"LLM call ({PRIORITY_NAMES.get(priority, priority)}) not admitted within "
+                f"{self.max_wait.get(priority, 0):g}s"
+            )
+
+    def try_acquire(self, priority: int, tokens: float) -> bool:
+        """Admit a call only if it can go immediately without jumping the queue (used for hedges)"""
+        if self._heap or self._wait_time(priority, tokens) > 0:
+            return False
+        self._admit(priority, tokens, 0.0)
+        return True
+
+    def settle(self, estimated: float, actual: Optional[float]) -> None:
+        """Correct the token bucket once a response reports its real usage"""
+        if actual is None:
+            return
+        if actual < estimated:
+            self.tokens.give(estimated - actual)
+        else:
+            self.tokens.take(actual - estimated)
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Learn limits and remaining quota from x-ratelimit-* response headers"""
+        self._stats["headers_seen"] += 1
+        limit_tokens = _header_number(headers, "x-ratelimit-limit-tokens")
+        if limit_tokens:
+            self.tokens.resize(limit_tokens, limit_tokens / 60.0)
+
+        remaining_tokens = _header_number(headers, "x-ratelimit-remaining-tokens")
+        if remaining_tokens is not None:
+            self.tokens.cap(remaining_tokens)
+            if remaining_tokens <= 0:
+                self._pause(parse_duration(headers.get("x-ratelimit-reset-tokens")))
+
+        remaining_requests = _header_number(headers, "x-ratelimit-remaining-requests")
+        if remaining_requests is not None:
+            self.requests.cap(remaining_requests)
+            if remaining_requests <= 0:
+                self._pause(parse_duration(headers.get("x-ratelimit-reset-requests")))
+
+    def throttle(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        """Pause admissions after a 429, for retry-after (or the reported reset) seconds"""
+        self._stats["rate_limited"] += 1
+        headers = headers or {}
+        delay = (
+            parse_duration(headers.get("retry-after"))
+            or parse_duration(headers.get("x-ratelimit-reset-tokens"))
+            or parse_duration(headers.get("x-ratelimit-reset-requests"))
+            or 1.0
+        )
+        self._pause(delay)
+
+    def _pause(self, seconds: Optional[float]) -> None:
+        if seconds:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _wait_time(self, priority: int, tokens: float) -> float:
+        reserve = self.reserved_fraction if priority > PRIORITY_INTERACTIVE else 0.0
+        return max(
+            self._paused_until - time.monotonic(),
+            self.requests.wait_time(1, reserve),
+            self.tokens.wait_time(tokens, reserve),
+            0.0
+        )
+
+    def _admit(self, priority: int, tokens: float, waited: float) -> None:
+        self.requests.take(1)
+        self.tokens.take(tokens)
+        self._admitted[priority] += 1
+        self._waits[priority].record(waited)
+
+    def _pump(self) -> None:
+        """Admit queued calls from the head while limits allow, then sleep until the next can go"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._heap:
+            priority, _, tokens, future, enqueued = self._heap[0]
+            if future.done():
+                heapq.heappop(self._heap)
+                continue
+            wait = self._wait_time(priority, tokens)
+            if wait > 0:
+                self._timer = asyncio.get_running_loop().call_later(wait, self._pump)
+                return
+            heapq.heappop(self._heap)
+            self._admit(priority, tokens, time.monotonic() - enqueued)
+            future.set_result(None)
+
+    def stats(self) -> Dict[str, any]:
+        """Queue depth, admission wait times and bucket state for the metrics endpoint"""
+        depth = {name: 0 for name in PRIORITY_NAMES.values()}
+        for priority, _, _, future, _ in self._heap:
+            if not future.done():
+                depth[PRIORITY_NAMES[priority]] += 1
+        self.requests.wait_time(0)
+        self.tokens.wait_time(0)
+        return {
+            "queue_depth": depth,
+            "admitted": {PRIORITY_NAMES[p]: count for p, count in self._admitted.items()},
+            "timed_out": {PRIORITY_NAMES[p]: count for p, count in self._timed_out.items()},
+            "wait_seconds": {
+                PRIORITY_NAMES[p]: {"p50": tracker.percentile(50), "p95": tracker.percentile(95)}
+                for p, tracker in self._waits.items()
+            },
+            "requests_bucket": {"level": round(self.requests.level, 2), "per_minute": round(self.requests.capacity, 2)},
+            "tokens_bucket": {"level": round(self.tokens.level, 1), "per_minute": round(self.tokens.capacity, 1)},
+            "paused_seconds": round(max(0.0, self._paused_until - time.monotonic()), 2),
+            **self._stats
+        }
@@ -0,0 +1,185 @@
+"""
+Local Severity Model for HackForce AI API
+TF-IDF + logistic regression classifier trained by ai_model/train.py and
+served in-process as the first classification tier in front of Groq
+
+The artifact is memory-mapped (see services/artifacts.py): weights are read
+straight from the page cache and the vocabulary is a mapped hash table, so
+loading does not parse or materialize the model.
+"""
+
+import os
+import re
+import math
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from services.artifacts import Artifact, StringTable, build_string_table, prefixed, write_artifact
+
+# Repository root (backend/services -> backend -> repo)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_MODEL_PATH = os.path.join(REPO_ROOT, "ai_model", "models", "severity_model.bin")
+
+MODEL_FORMAT = "hackforce-severity-tfidf-lr"
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9']*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into word tokens"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def extract_terms(text: str, ngram_range: Sequence[int] = (1, 2)) -> List[str]:
+    """Word n-grams used as TF-IDF terms (shared by training and serving)"""
+    tokens = tokenize(text)
+    low, high = ngram_range
+    terms = []
+    for n in range(low, high + 1):
+        if n == 1:
+            terms.extend(tokens)
+        else:
+            terms.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+    return terms
+
+
+def tfidf_vector(terms: Sequence[str], vocabulary, idf: Sequence[float]) -> Dict[int, float]:
+    """Sparse, L2-normalized sublinear TF-IDF vector as {feature index: weight}"""
+    counts = {}
+    for term in terms:
+        index = vocabulary.get(term)
+        if index is not None:
+            counts[index] = counts.get(index, 0) + 1
+
+    vector = {index: (1.0 + math.log(count)) * idf[index] for index, count in counts.items()}
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    if norm > 0:
+        for index in vector:
+            vector[index] /= norm
+    return vector
+
+
+def softmax(logits: Sequence[float]) -> List[float]:
+    peak = max(logits)
+    exps = [math.exp(logit - peak) for logit in logits]
+    total = sum(exps)
+    return [value / total for value in exps]
+
+
+class LocalSeverityModel:
+    """
+    Multinomial logistic regression over TF-IDF word n-grams
+
+    vocabulary is anything with a dict-like get(term) (a dict or a mapped
+    StringTable); idf, coef and intercept are flat float sequences, with coef
+    feature-major: the weights of feature i are coef[i * n_classes:(i + 1) * n_classes].
+    """
+
+    def __init__(
+        self,
+        classes: List[str],
+        vocabulary,
+        idf: Sequence[float],
+        coef: Sequence[float],
+        intercept: Sequence[float],
+        ngram_range: Sequence[int] = (1, 2),
+        version: str = "unknown",
+        metrics: Optional[Dict] = None,
+        artifact: Optional[Artifact] = None
+    ):
+        self.classes = classes
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.coef = coef
+        self.intercept = list(intercept)
+        self.ngram_range = tuple(ngram_range)
+        self.version = version
+        self.metrics = metrics or {}
+        self.artifact = artifact  # keeps the mapping alive while views are in use
+
+    @classmethod
+    def load(cls, path: str) -> "LocalSeverityModel":
+        """Memory-map a model artifact written by ai_model/train.py"""
+        artifact = Artifact(path)
+        meta = artifact.meta
+        if meta.get("format") != MODEL_FORMAT:
+            raise ValueError(f"unsupported model format: {meta.get('format')!r}")
+
+        return cls(
+            classes=meta["classes"],
+            vocabulary=StringTable.from_artifact(artifact, "vocabulary"),
+            idf=artifact.section("idf"),
+            coef=artifact.section("coef"),
+            intercept=artifact.section("intercept"),
+            ngram_range=meta.get("ngram_range", (1, 2)),
+            version=meta.get("version", "unknown"),
+            metrics=meta.get("metrics"),
+            artifact=artifact
+        )
+
+    def predict_proba(self, text: str) -> List[float]:
+        """Class probabilities for text, in the order of self.classes"""
+        vector = tfidf_vector(extract_terms(text, self.ngram_range), self.vocabulary, self.idf)
+        logits = list(self.intercept)
+        n_classes = len(logits)
+        coef = self.coef
+        for index, weight in vector.items():
+            base = index * n_classes
+            for k in range(n_classes):
+                logits[k] += coef[base + k] * weight
+        return softmax(logits)
+
+    def predict(self, title: str, description: str) -> Dict[str, any]:
+        """Classify a bug; same result shape as GroqService classifications"""
+        probabilities = self.predict_proba(f"{title} {description}")
+        best = max(range(len(probabilities)), key=probabilities.__getitem__)
+        return {
+            "severity": self.classes[best],
+            "confidence": round(probabilities[best], 4),
+            "reasoning": f"Local TF-IDF model ({self.version})",
+            "impact_areas": [],
+            "model_version": f"local-{self.version}"
+        }
+
+
+def save_model(
+    path: str,
+    classes: List[str],
+    vocabulary: List[str],
+    idf: Sequence[float],
+    coef: Sequence[Sequence[float]],
+    intercept: Sequence[float],
+    meta: Optional[Dict] = None
+) -> None:
+    """Write a model artifact (coef given as one row of per-class weights per feature)"""
+    header = {"format": MODEL_FORMAT, "classes": list(classes), **(meta or {})}
+    sections = {
+        "idf": array("f", idf),
+        "coef": array("f", (value for row in coef for value in row)),
+        "intercept": array("f", intercept),
+        **prefixed("vocabulary", build_string_table(vocabulary))
+    }
+    write_artifact(path, header, sections)
+
+
+# Singleton instance - loaded on first use; False marks a failed/disabled load
+local_model = None
+
+def get_local_model() -> Optional[LocalSeverityModel]:
+    """Get or load the local severity model (None if disabled or unavailable)"""
+    global local_model
+    if local_model is None:
+        path = os.getenv("LOCAL_MODEL_PATH", DEFAULT_MODEL_PATH)
+        if os.getenv("LOCAL_MODEL_ENABLED", "false").lower() != "true":
+            local_model = False
+        elif not os.path.exists(path):
+            print(f"⚠️  Local severity model not found at {path}. Skipping local tier.")
+            local_model = False
+        else:
+            try:
+                local_model = LocalSeverityModel.load(path)
+                print(f"✅ Local severity model loaded ({local_model.version})")
+            except Exception as e:
+                print(f"⚠️  Failed to load local severity model: {e}")
+                local_model = False
+    return local_model or None
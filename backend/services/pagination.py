@@ -0,0 +1,43 @@
+"""
+Cursor Pagination Helpers for HackForce AI API
+Opaque keyset cursors: the sort key of the last row on a page, encoded as
+URL-safe base64 JSON. Clients pass it back unchanged to get the next page.
+"""
+
+import json
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple, Type
+
+# Header carrying the cursor for the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor cannot be decoded into the expected sort key"""
+    pass
+
+
+def encode_cursor(*values) -> str:
+    """Encode a sort key (ints, strings, datetimes) as an opaque cursor"""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, *types: Type) -> Tuple:
+    """Decode a cursor into a sort key of the given types (datetime, int or str)"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursor(f"malformed cursor: {e}")
+    if not isinstance(values, list) or len(values) != len(types):
+        raise InvalidCursor("cursor does not match this listing")
+    try:
+        return tuple(
+            datetime.fromisoformat(value) if kind is datetime else kind(value)
+            for kind, value in zip(types, values)
+        )
+    except (TypeError, ValueError) as e:
+        raise InvalidCursor(f"malformed cursor: {e}")
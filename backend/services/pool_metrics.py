@@ -0,0 +1,119 @@
+"""
+Database Connection Metrics for HackForce AI API
+Times new connections (connect) and connection acquisition from the pool
+(checkout: waiting for a free slot, plus connecting and pre-ping if needed),
+and tracks how many connections each engine has checked out.
+"""
+
+import time
+import threading
+from typing import Dict, Type
+
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+
+from services.resilience import LatencyTracker
+
+
+class PoolMetrics:
+    """Connect/checkout latencies and connection counts for one engine"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.connect_latency = LatencyTracker()
+        self.checkout_latency = LatencyTracker()
+        self._lock = threading.Lock()
+        self._stats = {"connects": 0, "connect_failures": 0, "checkouts": 0, "checked_out": 0, "peak_checked_out": 0}
+        self.settings: Dict[str, any] = {}
+
+    def record_connect(self, seconds: float, failed: bool = False) -> None:
+        self.connect_latency.record(seconds)
+        with self._lock:
+            self._stats["connect_failures" if failed else "connects"] += 1
+
+    def record_checkout(self, seconds: float) -> None:
+        self.checkout_latency.record(seconds)
+        with self._lock:
+            self._stats["checkouts"] += 1
+
+    def connection_checked_out(self) -> None:
+        with self._lock:
+            self._stats["checked_out"] += 1
+            self._stats["peak_checked_out"] = max(self._stats["peak_checked_out"], self._stats["checked_out"])
+
+    def connection_checked_in(self) -> None:
+        with self._lock:
+            self._stats["checked_out"] -= 1
+
+    def stats(self) -> Dict[str, any]:
+        """Counters, latency percentiles and pool settings for the metrics endpoint"""
+        return {
+            **self._stats,
+            "connect": {
+                "p50_seconds": self.connect_latency.percentile(50),
+                "p95_seconds": self.connect_latency.percentile(95),
+                "p99_seconds": self.connect_latency.percentile(99)
+            },
+            "checkout": {
+                "p50_seconds": self.checkout_latency.percentile(50),
+                "p95_seconds": self.checkout_latency.percentile(95),
+                "p99_seconds": self.checkout_latency.percentile(99)
+            },
+            **self.settings
+        }
+
+
+def timed_pool_class(pool_class: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """Subclass of pool_class that records how long each checkout takes"""
+
+    class TimedPool(pool_class):
+        def connect(self):
+            start = time.perf_counter()
+            try:
+                return super().connect()
+            finally:
+                metrics.record_checkout(time.perf_counter() - start)
+
+    TimedPool.__name__ = f"Timed{pool_class.__name__}"
+    return TimedPool
+
+
+def instrument_engine(engine, metrics: PoolMetrics) -> None:
+    """
+    Record connect latency and the checked-out count of a (sync) engine;
+    pass AsyncEngine.sync_engine for async engines
+    """
+
+    @event.listens_for(engine, "do_connect")
+    def timed_connect(dialect, connection_record, cargs, cparams):
+        start = time.perf_counter()
+        try:
+            connection = dialect.connect(*cargs, **cparams)
+        except Exception:
+            metrics.record_connect(time.perf_counter() - start, failed=True)
+            raise
+        metrics.record_connect(time.perf_counter() - start)
+        return connection
+
+    @event.listens_for(engine, "checkout")
+    def checked_out(dbapi_connection, connection_record, connection_proxy):
+        metrics.connection_checked_out()
+
+    @event.listens_for(engine, "checkin")
+    def checked_in(dbapi_connection, connection_record):
+        metrics.connection_checked_in()
+
+
+# Singleton instances - one per engine name, created on first use
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+def get_pool_metrics(name: str) -> PoolMetrics:
+    """Get or create the connection metrics for an engine (e.g. "sync", "async")"""
+    if name not in pool_metrics:
+        pool_metrics[name] = PoolMetrics(name)
+    return pool_metrics[name]
+
+
+def all_pool_stats() -> Dict[str, Dict[str, any]]:
+    """Stats of every instrumented engine, by name"""
+    return {name: metrics.stats() for name, metrics in pool_metrics.items()}
@@ -0,0 +1,193 @@
+"""
+Resilience helpers for outbound LLM calls
+Circuit breaker, rolling latency percentiles and hedged requests
+"""
+
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised when the circuit breaker rejects a call without contacting the upstream"""
+
+
+class LatencyTracker:
+    """
+    Rolling window of call latencies with percentile lookup
+    """
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Return the p-th percentile (0-100) of the window, or None if empty"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker with a latency SLO and half-open probing
+
+    CLOSED: calls flow; consecutive failures or SLO-violating calls trip it OPEN.
+    OPEN: calls are rejected until reset_timeout elapses.
+    HALF_OPEN: a limited number of probe calls are allowed; a healthy probe
+    closes the circuit, a failed or slow one re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str = "groq",
+        failure_threshold: int = 5,
+        slow_call_threshold: int = 5,
+        latency_slo: float = 5.0,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.latency_slo = latency_slo
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = self.CLOSED
+        self._consecutive_failures = 0
+        self._consecutive_slow = 0
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._lock = threading.Lock()
+
+        self.rejected = 0
+        self.times_opened = 0
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed (reserving a probe slot when half-open)"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    self.rejected += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self._half_open_in_flight = 0
+                print(f"🟡 Circuit '{self.name}' half-open, probing upstream")
+
+            if self.state == self.HALF_OPEN:
+                if self._half_open_in_flight >= self.half_open_max_calls:
+                    self.rejected += 1
+                    return False
+                self._half_open_in_flight += 1
+            return True
+
+    def record_success(self, latency: float) -> None:
+        """Record a completed call; calls slower than the SLO count against the circuit"""
+        with self._lock:
+            self._consecutive_failures = 0
+            slow = latency > self.latency_slo
+
+            if self.state == self.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if slow:
+                    self._trip("probe exceeded latency SLO")
+                else:
+                    self.state = self.CLOSED
+                    self._consecutive_slow = 0
+                    print(f"🟢 Circuit '{self.name}' closed")
+                return
+
+            if slow:
+                self._consecutive_slow += 1
+                if self._consecutive_slow >= self.slow_call_threshold:
+                    self._trip(f"{self._consecutive_slow} consecutive calls over {self.latency_slo}s SLO")
+            else:
+                self._consecutive_slow = 0
+
+    def record_failure(self) -> None:
+        """Record a failed or timed-out call"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                self._trip("probe failed")
+                return
+
+            self._consecutive_failures += 1
+            if self.state == self.CLOSED and self._consecutive_failures >= self.failure_threshold:
+                self._trip(f"{self._consecutive_failures} consecutive failures")
+
+    def release(self) -> None:
+        """Give back a half-open probe slot for a call that was cancelled, not failed"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker state for the metrics endpoint"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "consecutive_slow_calls": self._consecutive_slow,
+            "times_opened": self.times_opened,
+            "rejected_calls": self.rejected,
+            "latency_slo_seconds": self.latency_slo,
+            "reset_timeout_seconds": self.reset_timeout
+        }
+
+    def _trip(self, reason: str) -> None:
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._consecutive_failures = 0
+        self._consecutive_slow = 0
+        self.times_opened += 1
+        print(f"🔴 Circuit '{self.name}' opened: {reason}")
+
+
+async def hedged_call(
+    call: Callable[[], Awaitable[Any]],
+    hedge_delay: Optional[float],
+    on_hedge: Optional[Callable[[], None]] = None
+) -> Any:
+    """
+    Await call(); if it hasn't answered after hedge_delay seconds, fire a
+    second identical call and return whichever succeeds first
+
+    The loser is cancelled. If both fail, the last error is raised.
+    """
+    tasks = {asyncio.ensure_future(call())}
+    try:
+        if hedge_delay is not None:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if not done:
+                if on_hedge is not None:
+                    on_hedge()
+                tasks.add(asyncio.ensure_future(call()))
+
+        error = None
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
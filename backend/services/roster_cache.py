@@ -0,0 +1,119 @@
+"""
+Developer Roster Cache for HackForce AI API
+Keeps the Active developer dicts used for assignment in memory under a
+version stamp. Developer writes in crud.py bump the version; workload-only
+changes are applied to the cached entries instead of dropping them. A short
+TTL bounds staleness from writes made by other workers.
+"""
+
+import os
+import time
+import threading
+from typing import Callable, Dict, List, Optional
+
+ROSTER_CACHE_TTL = float(os.getenv("ROSTER_CACHE_TTL", "30"))
+
+
+class RosterCache:
+    """
+    Versioned single-entry cache of the Active roster
+
+    The cached list is shared between requests and must be treated as read-only.
+    """
+
+    def __init__(self, ttl: float = ROSTER_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._version = 0
+        self._roster: Optional[List[Dict]] = None
+        self._roster_version = -1
+        self._loaded_at = 0.0
+        self._stats = {"hits": 0, "loads": 0, "invalidations": 0, "updates": 0}
+
+    @property
+    def version(self) -> int:
+        """Stamp that changes whenever the roster is invalidated or updated"""
+        return self._version
+
+    def get(self, loader: Callable[[], List[Dict]]) -> List[Dict]:
+        """Return the cached roster, calling loader() if it is missing, invalidated or expired"""
+        roster = self.cached()
+        if roster is not None:
+            return roster
+        version = self._version
+        return self.store(loader(), version)
+
+    def cached(self) -> Optional[List[Dict]]:
+        """The cached roster if it is current (counted as a hit), otherwise None"""
+        with self._lock:
+            if (
+                self._roster is not None
+                and self._roster_version == self._version
+                and time.monotonic() - self._loaded_at < self.ttl
+            ):
+                self._stats["hits"] += 1
+                return self._roster
+            return None
+
+    def store(self, roster: List[Dict], version: int) -> List[Dict]:
+        """
+        Cache a roster whose load started when the version was version, and
+        return it. A write that landed while loading makes the result stale:
+        it is served to this caller but not cached.
+        """
+        with self._lock:
+            self._stats["loads"] += 1
+            if self._version == version:
+                self._roster = roster
+                self._roster_version = version
+                self._loaded_at = time.monotonic()
+        return roster
+
+    def invalidate(self) -> None:
+        """Drop the cached roster (called after every developer write)"""
+        with self._lock:
+            self._version += 1
+            self._roster = None
+            self._stats["invalidations"] += 1
+
+    def update(self, developers: List[Dict]) -> None:
+        """
+        Replace the cached entries of the given developers (e.g. after their
+        workload changed) without reloading the roster. Only fields that don't
+        affect membership may have changed; developers not in the roster are
+        ignored. The list is rebuilt rather than mutated, as callers may hold it.
+        """
+        by_id = {developer["id"]: developer for developer in developers}
+        with self._lock:
+            current = self._roster is not None and self._roster_version == self._version
+            self._version += 1
+            self._stats["updates"] += 1
+            if not current:
+                # A load in flight started before this change; bumping the
+                # version keeps it out of the cache
+                self._roster = None
+                return
+            self._roster = [by_id.get(developer["id"], developer) for developer in self._roster]
+            self._roster_version = self._version
+
+    def stats(self) -> Dict[str, any]:
+        """Hit/load counters for the metrics endpoint"""
+        requests = self._stats["hits"] + self._stats["loads"]
+        return {
+            **self._stats,
+            "version": self._version,
+            "size": len(self._roster) if self._roster is not None else 0,
+            "hit_rate": round(self._stats["hits"] / requests, 4) if requests else 0.0,
+            "ttl_seconds": self.ttl
+        }
+
+
+# Singleton instance - created on first use
+roster_cache = None
+
+def get_roster_cache() -> RosterCache:
+    """Get or create the developer roster cache singleton (lazy initialization)"""
+    global roster_cache
+    if roster_cache is None:
+        roster_cache = RosterCache()
+    return roster_cache
@@ -0,0 +1,120 @@
+"""
+Single-flight request coalescing for HackForce AI API
+Concurrent callers asking for the same key share one upstream call
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict
+
+
+class _Call:
+    """In-flight synchronous call shared by every waiter"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _LeaderCancelled(Exception):
+    """Set on a shared call whose leader was cancelled; followers retry"""
+
+
+class SingleFlight:
+    """
+    Deduplicate identical in-flight work
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive while it is running wait for, and receive, the leader's result or
+    exception. If the leader is cancelled, a waiting follower takes over and
+    runs the function itself. Works for both coroutines (do) and blocking
+    calls (do_sync).
+    """
+
+    def __init__(self):
+        self._async_calls = {}
+        self._sync_calls = {}
+        self._lock = threading.Lock()
+
+        self.upstream_calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn() once per key, sharing the result with concurrent callers"""
+        while True:
+            future = self._async_calls.get(key)
+            if future is None:
+                return await self._lead(key, fn)
+
+            self.coalesced += 1
+            try:
+                # Shield so a cancelled follower doesn't cancel the shared call
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                # Only the leader was cancelled, not the work: the first
+                # follower to wake runs fn() and the rest wait on it
+                self.coalesced -= 1
+
+    async def _lead(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._async_calls[key] = future
+        self.upstream_calls += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self._fail(future, _LeaderCancelled())
+            raise
+        except BaseException as e:
+            self._fail(future, e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._async_calls.pop(key, None)
+
+    @staticmethod
+    def _fail(future: asyncio.Future, error: BaseException) -> None:
+        future.set_exception(error)
+        # Mark as retrieved so an unshared failure isn't logged as unhandled
+        future.exception()
+
+    def do_sync(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn() once per key across threads, sharing the result"""
+        with self._lock:
+            call = self._sync_calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._sync_calls[key] = call
+                self.upstream_calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._sync_calls.pop(key, None)
+            call.event.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Coalescing counters for the metrics endpoint"""
+        requests = self.upstream_calls + self.coalesced
+        return {
+            "upstream_calls": self.upstream_calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._async_calls) + len(self._sync_calls),
+            "coalesce_rate": round(self.coalesced / requests, 4) if requests else 0.0
+        }
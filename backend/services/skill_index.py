@@ -0,0 +1,192 @@
+"""
+Developer Skill Index for HackForce AI API
+In-memory inverted index from normalized skill keys to developer IDs, kept in
+sync by the developer writes in crud.py and rebuilt from the developers table
+when it goes stale (other workers may have written in the meantime)
+"""
+
+import os
+import time
+import string
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+# Rebuild from the database after this many seconds (writes in this process
+# are applied immediately; the TTL bounds staleness from other workers)
+SKILL_INDEX_TTL = float(os.getenv("SKILL_INDEX_TTL", "300"))
+
+# Longest skill name, in words, looked for in bug text ("machine learning")
+MAX_SKILL_WORDS = 3
+
+# Alternate spellings -> canonical skill key (keys are lowercase, with the
+# words of the skill name joined: "Node.js" -> "nodejs", "Spring Boot" -> "springboot")
+SKILL_ALIASES = {
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "python3": "python",
+    "node": "nodejs",
+    "reactjs": "react",
+    "vue": "vuejs",
+    "golang": "go",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "pg": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "db": "database",
+    "sql": "database",
+    "cpp": "c++",
+    "csharp": "c#",
+    "dotnet": "net",
+    "ml": "machinelearning",
+    "ui": "uiux",
+    "ux": "uiux",
+    "infosec": "security",
+    "appsec": "security"
+}
+
+# Punctuation separates words, except the characters that carry meaning in
+# skill names such as "C++" and "C#"
+_SKILL_SEPARATORS = str.maketrans({char: " " for char in string.punctuation if char not in "+#"})
+
+
+def skill_tokens(text: str) -> List[str]:
+    """Lowercase text and split it into words, keeping '+' and '#'"""
+    return text.lower().translate(_SKILL_SEPARATORS).split()
+
+
+def skill_key(skill: str) -> str:
+    """Canonical key for a skill name or alias ("JS" -> "javascript", "Node.js" -> "nodejs")"""
+    key = "".join(skill_tokens(skill))
+    return SKILL_ALIASES.get(key, key)
+
+
+def text_skill_keys(text: str) -> Set[str]:
+    """Canonical keys of every skill name (up to MAX_SKILL_WORDS words) that could occur in text"""
+    tokens = skill_tokens(text)
+    keys = set()
+    for n in range(1, MAX_SKILL_WORDS + 1):
+        for i in range(len(tokens) - n + 1):
+            key = "".join(tokens[i:i + n])
+            keys.add(SKILL_ALIASES.get(key, key))
+    return keys
+
+
+class SkillIndex:
+    """
+    Inverted index: skill key -> IDs of developers with that skill
+
+    Holds the developer dicts (as returned by Developer.to_dict()) so queries
+    are answered from memory: "who knows X and Y" intersects the posting sets
+    of the requested skills, smallest first.
+    """
+
+    def __init__(self, ttl: float = SKILL_INDEX_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._postings: Dict[str, Set[int]] = {}
+        self._developers: Dict[int, Dict] = {}
+        self._skills: Dict[int, Dict[str, str]] = {}  # developer ID -> {key: skill as entered}
+        self.built_at: Optional[float] = None
+
+    @property
+    def is_built(self) -> bool:
+        return self.built_at is not None
+
+    def is_stale(self) -> bool:
+        return self.built_at is None or time.monotonic() - self.built_at > self.ttl
+
+    def build(self, developers: Iterable[Dict]) -> None:
+        """Replace the index contents with the given developers"""
+        with self._lock:
+            self._postings = {}
+            self._developers = {}
+            self._skills = {}
+            for developer in developers:
+                self._add(developer)
+            self.built_at = time.monotonic()
+
+    def upsert(self, developer: Dict) -> None:
+        """Add a developer or apply changes to one already indexed"""
+        with self._lock:
+            self._remove(developer["id"])
+            self._add(developer)
+
+    def remove(self, developer_id: int) -> None:
+        """Drop a developer from the index"""
+        with self._lock:
+            self._remove(developer_id)
+
+    def _add(self, developer: Dict) -> None:
+        developer_id = developer["id"]
+        skills = {}
+        for skill in developer.get("skills") or []:
+            key = skill_key(skill)
+            if key:
+                skills.setdefault(key, skill)
+                self._postings.setdefault(key, set()).add(developer_id)
+        self._developers[developer_id] = developer
+        self._skills[developer_id] = skills
+
+    def _remove(self, developer_id: int) -> None:
+        self._developers.pop(developer_id, None)
+        for key in self._skills.pop(developer_id, {}):
+            posting = self._postings.get(key)
+            if posting is not None:
+                posting.discard(developer_id)
+                if not posting:
+                    del self._postings[key]
+
+    def query(self, skills: Iterable[str], status: Optional[str] = "Active") -> List[Dict]:
+        """
+        Developers having every one of the given skills (names or aliases),
+        least loaded first
+
+        Args:
+            skills: Skill names or aliases, e.g. ["js", "PostgreSQL"]
+            status: Only developers with this status (None for any)
+        """
+        keys = {skill_key(skill) for skill in skills} - {""}
+        if not keys:
+            return []
+
+        with self._lock:
+            postings = sorted((self._postings.get(key, set()) for key in keys), key=len)
+            ids = postings[0].intersection(*postings[1:])
+            developers = [self._developers[developer_id] for developer_id in ids]
+
+        if status is not None:
+            developers = [dev for dev in developers if dev.get("status") == status]
+        developers.sort(key=lambda dev: (dev.get("workload") or 0, dev["id"]))
+        return developers
+
+    def match_text(self, text: str) -> Dict[int, List[str]]:
+        """Developer ID -> their skills (as entered) that occur in the bug text"""
+        matches: Dict[int, List[str]] = {}
+        with self._lock:
+            for key in text_skill_keys(text):
+                for developer_id in self._postings.get(key, ()):
+                    matches.setdefault(developer_id, []).append(self._skills[developer_id][key])
+        return matches
+
+    def stats(self) -> Dict[str, any]:
+        """Index size and age for the metrics endpoint"""
+        return {
+            "developers": len(self._developers),
+            "skills": len(self._postings),
+            "age_seconds": round(time.monotonic() - self.built_at, 1) if self.built_at is not None else None,
+            "ttl_seconds": self.ttl
+        }
+
+
+# Singleton instance - filled by crud.refresh_skill_index()
+skill_index = None
+
+def get_skill_index() -> SkillIndex:
+    """Get or create the developer skill index singleton (lazy initialization)"""
+    global skill_index
+    if skill_index is None:
+        skill_index = SkillIndex()
+    return skill_index
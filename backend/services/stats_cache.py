@@ -0,0 +1,146 @@
+"""
+Dashboard Statistics Cache for HackForce AI API
+Keeps the /api/stats counters in memory. Bug and developer writes in crud.py
+adjust them incrementally; a full recount (one aggregate query) reconciles
+them periodically, which also picks up writes made by other workers.
+"""
+
+import os
+import time
+import threading
+from collections import Counter
+from typing import Dict, Optional
+
+# Seconds between full recounts
+STATS_RECONCILE_INTERVAL = float(os.getenv("STATS_RECONCILE_INTERVAL", "60"))
+
+# Always reported, even at zero (Pending appears only while bugs await triage)
+SEVERITIES = ["Critical", "High", "Medium", "Low"]
+STATUSES = ["Open", "In Progress", "Resolved", "Closed"]
+
+
+def format_counters(counters: Dict) -> Dict[str, any]:
+    """Dashboard statistics (the /api/stats payload) from raw counters"""
+    confidence_count = counters["confidence_count"]
+    return {
+        "total_bugs": counters["total_bugs"],
+        "severity": {
+            severity: count for severity, count in counters["severity"].items()
+            if count or severity in SEVERITIES
+        },
+        "status": {status: count for status, count in counters["status"].items() if count},
+        "average_confidence": round(counters["confidence_sum"] / confidence_count, 2) if confidence_count else 0.0,
+        "total_developers": counters["total_developers"]
+    }
+
+
+class StatsCache:
+    """
+    Incrementally maintained bug/developer counters
+
+    Bug fields tracked: severity, status and confidence_score (as a sum and
+    count, so the average ignores NULLs like AVG does).
+    """
+
+    def __init__(self, reconcile_interval: float = STATS_RECONCILE_INTERVAL):
+        self.reconcile_interval = reconcile_interval
+        self._lock = threading.Lock()
+        self._counters: Optional[Dict] = None
+        self._loaded_at = 0.0
+        self._generation = 0  # bumped by every incremental change
+        self._stats = {"hits": 0, "recounts": 0, "recounts_discarded": 0, "changes": 0}
+
+    def generation(self) -> int:
+        """Stamp to pass to load() so a recount racing with writes is detected"""
+        return self._generation
+
+    def load(self, counters: Dict, generation: int) -> bool:
+        """
+        Replace the counters with a full recount taken after generation()
+        returned generation. If writes were applied meanwhile the recount may
+        or may not include them, so it is discarded (the incremental counters
+        already do) and the next read recounts again. Returns True if stored.
+
+        The first recount is always stored so there is something to serve,
+        but if it raced with a write it is marked as due for a recount.
+        """
+        with self._lock:
+            self._stats["recounts"] += 1
+            if self._counters is not None and generation != self._generation:
+                self._stats["recounts_discarded"] += 1
+                return False
+            self._counters = {
+                "total_bugs": counters["total_bugs"],
+                "severity": Counter(counters["severity"]),
+                "status": Counter(counters["status"]),
+                "confidence_sum": counters["confidence_sum"],
+                "confidence_count": counters["confidence_count"],
+                "total_developers": counters["total_developers"]
+            }
+            self._loaded_at = time.monotonic() if generation == self._generation else 0.0
+            return True
+
+    def needs_recount(self) -> bool:
+        return self._counters is None or time.monotonic() - self._loaded_at > self.reconcile_interval
+
+    def get(self, stale_ok: bool = False) -> Optional[Dict[str, any]]:
+        """Dashboard statistics, or None if a recount is due (or nothing is loaded yet)"""
+        with self._lock:
+            if self._counters is None or (not stale_ok and self.needs_recount()):
+                return None
+            self._stats["hits"] += 1
+            return format_counters(self._counters)
+
+    def bug_added(self, bug: Dict) -> None:
+        self._apply(None, bug, 1)
+
+    def bug_removed(self, bug: Dict) -> None:
+        self._apply(bug, None, -1)
+
+    def bug_changed(self, old: Dict, new: Dict) -> None:
+        """Apply a change of the fields present in old/new (absent fields are unchanged)"""
+        self._apply(old, new, 0)
+
+    def developers_changed(self, delta: int) -> None:
+        with self._lock:
+            self._generation += 1
+            if self._counters is not None:
+                self._counters["total_developers"] += delta
+
+    def _apply(self, old: Optional[Dict], new: Optional[Dict], total_delta: int) -> None:
+        with self._lock:
+            self._generation += 1
+            self._stats["changes"] += 1
+            counters = self._counters
+            if counters is None:
+                return
+            counters["total_bugs"] += total_delta
+            for fields, sign in ((old, -1), (new, 1)):
+                if not fields:
+                    continue
+                if "severity" in fields:
+                    counters["severity"][fields["severity"]] += sign
+                if "status" in fields:
+                    counters["status"][fields["status"]] += sign
+                if fields.get("confidence_score") is not None:
+                    counters["confidence_sum"] += sign * fields["confidence_score"]
+                    counters["confidence_count"] += sign
+
+    def stats(self) -> Dict[str, any]:
+        """Hit/recount counters for the metrics endpoint"""
+        return {
+            **self._stats,
+            "age_seconds": round(time.monotonic() - self._loaded_at, 1) if self._counters is not None else None,
+            "reconcile_interval_seconds": self.reconcile_interval
+        }
+
+
+# Singleton instance - created on first use
+stats_cache = None
+
+def get_stats_cache() -> StatsCache:
+    """Get or create the dashboard statistics cache singleton (lazy initialization)"""
+    global stats_cache
+    if stats_cache is None:
+        stats_cache = StatsCache()
+    return stats_cache
@@ -0,0 +1,160 @@
+"""
+Background Triage Queue for HackForce AI API
+asyncio worker pool behind the asynchronous ingestion mode: bugs are stored
+with a pending severity, their IDs queued here, and workers run
+classification and assignment off the request path
+"""
+
+import os
+import time
+import asyncio
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Set
+
+from services.resilience import LatencyTracker
+
+TRIAGE_WORKERS = int(os.getenv("TRIAGE_WORKERS", "4"))
+TRIAGE_QUEUE_SIZE = int(os.getenv("TRIAGE_QUEUE_SIZE", "1000"))
+
+# How often pending bugs left behind (queue overflow, restarts, other
+# workers' crashes) are swept from the database and re-queued
+TRIAGE_SWEEP_INTERVAL = float(os.getenv("TRIAGE_SWEEP_INTERVAL", "30"))
+
+
+class TriageQueue:
+    """
+    Bounded queue of bug IDs drained by a fixed pool of asyncio workers
+
+    handler(bug_id) does the work and returns when the bug is triaged.
+    sweep() returns IDs of bugs still pending in the database; it runs on
+    start-up and every sweep_interval seconds so nothing stays pending.
+    Completion is signalled per bug for long-polling clients.
+    """
+
+    def __init__(
+        self,
+        workers: int = TRIAGE_WORKERS,
+        maxsize: int = TRIAGE_QUEUE_SIZE,
+        sweep_interval: float = TRIAGE_SWEEP_INTERVAL
+    ):
+        self.workers = max(1, workers)
+        self.maxsize = maxsize
+        self.sweep_interval = sweep_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks = []
+        self._queued: Set[int] = set()
+        self._events: Dict[int, asyncio.Event] = {}
+        self._handler: Optional[Callable[[int], Awaitable[None]]] = None
+        self._sweep: Optional[Callable[[], Iterable[int]]] = None
+        self._enqueued_at: Dict[int, float] = {}
+        self.wait_time = LatencyTracker()
+        self.process_time = LatencyTracker()
+        self._stats = {"submitted": 0, "rejected": 0, "completed": 0, "failed": 0, "swept": 0}
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self, handler: Callable[[int], Awaitable[None]], sweep: Optional[Callable[[], Iterable[int]]] = None) -> None:
+        """Start the workers (and the pending-bug sweeper) on the running event loop"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._handler = handler
+        self._sweep = sweep
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        if sweep is not None:
+            self._tasks.append(asyncio.create_task(self._sweeper()))
+        print(f"✅ Triage queue started ({self.workers} workers)")
+
+    async def stop(self) -> None:
+        """Cancel the workers; bugs still queued stay pending and are swept on next start"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, bug_id: int) -> bool:
+        """Queue a bug for triage; False if the queue is not running or full"""
+        if not self.running:
+            self._stats["rejected"] += 1
+            return False
+        if bug_id in self._queued:
+            return True
+        try:
+            self._queue.put_nowait(bug_id)
+        except asyncio.QueueFull:
+            self._stats["rejected"] += 1
+            return False
+        self._queued.add(bug_id)
+        self._enqueued_at[bug_id] = time.perf_counter()
+        self._stats["submitted"] += 1
+        return True
+
+    async def wait(self, bug_id: int, timeout: float) -> bool:
+        """Wait up to timeout seconds for a bug handled by this process; True if it completed"""
+        event = self._events.setdefault(bug_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if not event.is_set() and bug_id not in self._queued:
+                self._events.pop(bug_id, None)
+
+    async def _worker(self) -> None:
+        while True:
+            bug_id = await self._queue.get()
+            started = time.perf_counter()
+            self.wait_time.record(started - self._enqueued_at.pop(bug_id, started))
+            try:
+                await self._handler(bug_id)
+                self._stats["completed"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._stats["failed"] += 1
+                print(f"❌ Background triage failed for bug {bug_id}: {e}")
+            finally:
+                self.process_time.record(time.perf_counter() - started)
+                self._queued.discard(bug_id)
+                event = self._events.pop(bug_id, None)
+                if event is not None:
+                    event.set()
+                self._queue.task_done()
+
+    async def _sweeper(self) -> None:
+        while True:
+            try:
+                bug_ids = await asyncio.get_running_loop().run_in_executor(None, lambda: list(self._sweep()))
+                for bug_id in bug_ids:
+                    if bug_id not in self._queued and self.submit(bug_id):
+                        self._stats["swept"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️  Pending bug sweep failed: {e}")
+            await asyncio.sleep(self.sweep_interval)
+
+    def stats(self) -> Dict[str, any]:
+        """Queue depth, throughput counters and wait/processing percentiles"""
+        return {
+            "running": self.running,
+            "workers": self.workers,
+            "depth": self._queue.qsize() if self._queue is not None else 0,
+            "in_flight": len(self._queued) - (self._queue.qsize() if self._queue is not None else 0),
+            **self._stats,
+            "wait_seconds": {"p50": self.wait_time.percentile(50), "p95": self.wait_time.percentile(95)},
+            "process_seconds": {"p50": self.process_time.percentile(50), "p95": self.process_time.percentile(95)}
+        }
+
+
+# Singleton instance - started by the app's startup event
+triage_queue = None
+
+def get_triage_queue() -> TriageQueue:
+    """Get or create the background triage queue singleton (lazy initialization)"""
+    global triage_queue
+    if triage_queue is None:
+        triage_queue = TriageQueue()
+    return triage_queue
@@ -0,0 +1,47 @@
+"""
+Tests for skill/workload candidate selection
+Run with: pytest test_candidate_selector.py
+"""
+
+import pytest
+
+from services.candidate_selector import CandidateSelector
+from services.skill_index import SkillIndex
+
+# Two developers share a name; only their IDs tell them apart
+DEVELOPERS = [
+    {"id": 3, "name": "Sam", "skills": ["Python", "PostgreSQL"], "workload": 2, "status": "Active"},
+    {"id": 7, "name": "Sam", "skills": ["React"], "workload": 0, "status": "Active"},
+    {"id": 9, "name": "Alex", "skills": ["Go"], "workload": 1, "status": "Active"}
+]
+
+
+def skill_index():
+    index = SkillIndex()
+    index.build(DEVELOPERS)
+    return index
+
+
+@pytest.mark.parametrize("index", [None, skill_index()], ids=["scan", "skill-index"])
+def test_same_named_developers_keep_their_own_matches(index):
+    selection = CandidateSelector(top_k=3, dominance_margin=5).select(
+        "Python worker and React form both fail", DEVELOPERS, index
+    )
+    assert selection.matched_skills == {3: ["Python"], 7: ["React"], 9: []}
+    assert sorted(dev["id"] for dev in selection.candidates) == [3, 7, 9]
+    assert selection.decisive is None
+
+
+@pytest.mark.parametrize("index", [None, skill_index()], ids=["scan", "skill-index"])
+def test_dominant_candidate_is_identified_by_id(index):
+    selection = CandidateSelector(dominance_margin=1.0).select(
+        "Python query on PostgreSQL times out", DEVELOPERS, index
+    )
+    assert selection.decisive["developer_id"] == 3
+    assert selection.decisive["developer_name"] == "Sam"
+    assert "Python" in selection.decisive["reasoning"]
+
+
+def test_top_k_limits_candidates():
+    selection = CandidateSelector(top_k=2, dominance_margin=5).select("React page is blank", DEVELOPERS)
+    assert [dev["id"] for dev in selection.candidates] == [7, 9]
@@ -0,0 +1,66 @@
+"""
+Tests for the two-tier classification cache
+Run with: pytest test_classification_cache.py
+"""
+
+import asyncio
+import threading
+
+from services.classification_cache import ClassificationCache, LocalSharedBackend
+
+CLASSIFICATION = {"severity": "High", "confidence": 0.9, "reasoning": "r", "impact_areas": []}
+
+
+class BlockingBackend(LocalSharedBackend):
+    """Shared tier that records which threads it was called on, like Redis"""
+
+    blocking = True
+
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def get_many(self, keys):
+        self.threads.add(threading.get_ident())
+        return super().get_many(keys)
+
+    def set_many(self, values, ttl):
+        self.threads.add(threading.get_ident())
+        super().set_many(values, ttl)
+
+
+class BrokenBackend(LocalSharedBackend):
+    def get_many(self, keys):
+        raise ConnectionError("redis down")
+
+
+def test_blocking_backend_is_called_off_the_event_loop():
+    backend = BlockingBackend()
+    cache = ClassificationCache(backend=backend)
+
+    async def scenario():
+        await cache.aset("a", CLASSIFICATION)
+        cache._entries.clear()
+        return await cache.aget_many(["a", "b"]), threading.get_ident()
+
+    results, loop_thread = asyncio.run(scenario())
+    assert results == [CLASSIFICATION, None]
+    assert backend.threads and loop_thread not in backend.threads
+    assert (cache.shared_hits, cache.misses) == (1, 1)
+
+
+def test_local_hits_skip_the_shared_tier():
+    backend = BlockingBackend()
+    cache = ClassificationCache(backend=backend)
+    cache.set("a", CLASSIFICATION)
+    backend.threads.clear()
+
+    assert asyncio.run(cache.aget("a")) == CLASSIFICATION
+    assert not backend.threads
+    assert cache.local_hits == 1
+
+
+def test_shared_tier_errors_count_as_misses():
+    cache = ClassificationCache(backend=BrokenBackend())
+    assert asyncio.run(cache.aget_many(["a", "b"])) == [None, None]
+    assert (cache.shared_errors, cache.misses) == (1, 2)
@@ -0,0 +1,165 @@
+"""
+Tests for the Groq service fallback paths (no Groq client or API key needed)
+Run with: pytest test_groq_service.py
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from services.groq_service import AsyncGroqService, GroqService
+
+# Two developers share a name; only their IDs tell them apart
+DEVELOPERS = [
+    {"id": 3, "name": "Sam", "skills": ["python"], "workload": 4, "status": "Active"},
+    {"id": 7, "name": "Sam", "skills": ["react"], "workload": 1, "status": "Active"}
+]
+
+CLASSIFICATION = {"severity": "Low", "confidence": 0.5, "reasoning": "", "impact_areas": []}
+
+
+@pytest.fixture
+def service():
+    service = GroqService()
+    service.client = None
+    return service
+
+
+def test_triage_carries_id_of_chosen_developer(service):
+    triage = service.triage_bug("Login form crashes", "The react login form crashes on submit", DEVELOPERS)
+    assert (triage["developer_name"], triage["developer_id"]) == ("Sam", 7)
+
+
+def test_workload_fallback_carries_developer_id(service):
+    triage = service._merge_triage(CLASSIFICATION, DEVELOPERS)
+    assert triage["developer_id"] == 7
+
+
+def test_suggested_id_must_belong_to_named_developer(service):
+    assert service._merge_triage(CLASSIFICATION, DEVELOPERS, {"developer_name": "Sam", "developer_id": 7})["developer_id"] == 7
+    # An ID outside the offered developers falls back to the first one with the name
+    assert service._merge_triage(CLASSIFICATION, DEVELOPERS, {"developer_name": "Sam", "developer_id": 99})["developer_id"] == 3
+    assert service._merge_triage(CLASSIFICATION, DEVELOPERS, {"developer_name": "Nobody"})["developer_id"] is None
+
+
+def test_no_developers_is_unassigned(service):
+    triage = service._merge_triage(CLASSIFICATION, [])
+    assert (triage["developer_name"], triage["developer_id"]) == ("Unassigned", None)
+
+
+class StubModel:
+    """Local model stand-in returning a fixed prediction"""
+
+    def __init__(self, severity, confidence):
+        self.prediction = {"severity": severity, "confidence": confidence, "reasoning": "stub", "impact_areas": []}
+
+    def predict(self, title, description):
+        return dict(self.prediction)
+
+
+def test_fallback_uses_confident_local_prediction(service):
+    service.local_model = StubModel("Low", 0.95)
+    assert service.classify_bug_severity("App crashes", "Crash on startup")["severity"] == "Low"
+
+
+def test_fallback_ignores_unconfident_local_prediction(service):
+    service.local_model = StubModel("Low", 0.3)
+    classification = service.classify_bug_severity("App crashes", "Crash on startup")
+    assert classification["reasoning"] == "Keyword-based classification (fallback mode)"
+    assert classification["severity"] != "Low"
+
+
+def test_null_developer_confidence_is_invalid(service):
+    result = {"severity": "High", "confidence": 0.9, "developer_name": "Sam", "developer_confidence": None}
+    with pytest.raises(ValueError):
+        service._normalize_triage_result(result, DEVELOPERS)
+    with pytest.raises(ValueError):
+        service._normalize_triage_result({**result, "developer_confidence": "very"}, DEVELOPERS)
+
+
+class FakeRawResponse:
+    """AsyncAPIResponse stand-in: rate-limit headers and an async parse()"""
+
+    def __init__(self, content):
+        self.headers = {"x-ratelimit-remaining-requests": "100", "x-ratelimit-remaining-tokens": "10000"}
+        self.content = content
+
+    async def parse(self):
+        message = SimpleNamespace(content=json.dumps(self.content))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=SimpleNamespace(total_tokens=120))
+
+
+class FakeAsyncGroq:
+    """AsyncGroq stand-in answering every request with the same content after delay seconds"""
+
+    def __init__(self, content, delay=0.0):
+        self.content = content
+        self.delay = delay
+        self.requests = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(with_raw_response=self))
+
+    async def create(self, **request):
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        return FakeRawResponse(self.content)
+
+
+def async_service(content, delay=0.0):
+    service = AsyncGroqService()
+    service.client = FakeAsyncGroq(content, delay)
+    return service
+
+
+def test_async_completion_parses_response():
+    service = async_service({"severity": "High", "confidence": 0.9})
+    request = service._build_classification_request("Checkout fails", "Payment button returns 500")
+
+    assert asyncio.run(service._acomplete(request)) == {"severity": "High", "confidence": 0.9}
+    assert service.breaker.stats()["consecutive_failures"] == 0
+    assert len(service.latency) == 1
+    assert service.scheduler.stats()["headers_seen"] == 1
+
+
+def test_async_triage_uses_llm_answer():
+    content = {
+        "severity": "Critical", "confidence": 0.95, "reasoning": "model", "impact_areas": [],
+        "developer_name": "Sam", "developer_confidence": 0.8, "developer_reasoning": "react"
+    }
+    service = async_service(content)
+    triage = asyncio.run(service.triage("Async triage test bug", "Unique text for the async path", DEVELOPERS))
+
+    assert (triage["severity"], triage["reasoning"], triage["developer_name"]) == ("Critical", "model", "Sam")
+    assert service.client.requests == 1
+    assert service.get_metrics()["llm_calls"] == {"succeeded": 1, "failed": 0}
+    assert service.get_metrics()["fallbacks"] == {"classifications": 0, "developer_suggestions": 0}
+
+
+class FailingAsyncGroq(FakeAsyncGroq):
+    async def create(self, **request):
+        self.requests += 1
+        raise RuntimeError("upstream down")
+
+
+def test_failed_async_calls_are_counted_as_fallbacks():
+    service = AsyncGroqService()
+    service.client = FailingAsyncGroq(None)
+    service.local_model = None
+    classification = asyncio.run(service.classify("Failing upstream bug", "Unique text for the failure path"))
+
+    assert "fallback mode" in classification["reasoning"]
+    assert service.get_metrics()["llm_calls"] == {"succeeded": 0, "failed": 1}
+    assert service.get_metrics()["fallbacks"]["classifications"] == 1
+
+
+@pytest.mark.parametrize("headroom, expected", [(True, {"fired": 1, "denied": 0}), (False, {"fired": 0, "denied": 1})])
+def test_hedges_are_counted_once_launched(monkeypatch, headroom, expected):
+    service = async_service({"severity": "Low", "confidence": 0.6}, delay=0.05)
+    monkeypatch.setattr(service, "_hedge_delay", lambda: 0.01)
+    monkeypatch.setattr(service.scheduler, "try_acquire", lambda priority, tokens: headroom)
+    request = service._build_classification_request("Slow page", "The settings page is slow")
+
+    assert asyncio.run(service._acomplete(request))["severity"] == "Low"
+    assert service.hedge_stats == expected
+    assert service.client.requests == (2 if headroom else 1)
@@ -0,0 +1,33 @@
+"""
+Tests for the compiled fallback keyword matcher
+Run with: pytest test_keyword_matcher.py
+"""
+
+import pytest
+
+from services.keyword_matcher import KeywordMatcher
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return KeywordMatcher()
+
+
+@pytest.mark.parametrize("text, label", [
+    ("App crashes on startup", "Critical"),
+    ("Login failed for SSO users", "High"),
+    ("Typo in the footer", "Low"),
+    ("Build pipeline is slow", None),  # "ui" only as a whole word
+    ("Minor typo, and the export crashed", "Critical"),  # highest tier wins
+    ("Production down after deploy", "Critical"),
+    ("Production is down after deploy", None),  # phrase words must be adjacent
+    ("Checkout doesn't work on Safari", "High"),
+    ("SQL-injection in the search box", "Critical")
+])
+def test_match(matcher, text, label):
+    assert matcher.match(text) == label
+
+
+def test_match_many_is_aligned_with_texts(matcher):
+    texts = ["Typo in the footer", "", "App crashes on startup"]
+    assert matcher.match_many(texts) == [matcher.match(text) for text in texts]
@@ -0,0 +1,84 @@
+"""
+Tests for the LLM call scheduler's token-bucket admission
+Run with: pytest test_llm_scheduler.py
+"""
+
+import asyncio
+import importlib
+
+import pytest
+
+from services import llm_scheduler
+from services.llm_scheduler import (
+    PRIORITY_BATCH, PRIORITY_CRITICAL, PRIORITY_INTERACTIVE, LLMScheduler, SchedulerTimeout, TokenBucket,
+    parse_duration
+)
+
+
+def test_full_bucket_admits_without_reserve():
+    bucket = TokenBucket(6000, 100)
+    assert bucket.wait_time(6000) == 0.0
+
+
+def test_reserve_is_kept_free_for_small_calls():
+    bucket = TokenBucket(6000, 100)
+    bucket.take(5000)  # level 1000
+    # 100 tokens + 1500 reserved > 1000: wait for 600 tokens at 100/s
+    assert bucket.wait_time(100, reserve=0.25) == pytest.approx(6.0, abs=0.05)
+    assert bucket.wait_time(100) == 0.0
+
+
+def test_calls_larger_than_usable_share_are_admissible():
+    # A full batch chunk (the whole capacity) at 25% reserve used to need
+    # 1.25x capacity and could never be admitted
+    bucket = TokenBucket(6000, 100)
+    assert bucket.wait_time(6000, reserve=0.25) == 0.0
+    bucket.take(6000)
+    assert bucket.wait_time(6000, reserve=0.25) == pytest.approx(60.0, abs=0.05)
+
+
+def test_scheduler_admits_full_budget_batch_call():
+    async def run():
+        scheduler = LLMScheduler(requests_per_minute=30, tokens_per_minute=6000, reserved_fraction=0.25,
+                                 max_wait={PRIORITY_BATCH: 0.1})
+        await scheduler.acquire(PRIORITY_BATCH, 6000)
+        return scheduler.stats()
+
+    stats = asyncio.run(run())
+    assert stats["admitted"]["batch"] == 1
+    assert stats["timed_out"]["batch"] == 0
+
+
+def test_scheduler_times_out_and_admits_by_priority():
+    async def run():
+        scheduler = LLMScheduler(requests_per_minute=600, tokens_per_minute=600, reserved_fraction=0.25,
+                                 max_wait={PRIORITY_BATCH: 0.05, PRIORITY_INTERACTIVE: 1.0})
+        await scheduler.acquire(PRIORITY_INTERACTIVE, 590)  # level 10, refilling 10/s
+        with pytest.raises(SchedulerTimeout):
+            await scheduler.acquire(PRIORITY_BATCH, 100)
+        await scheduler.acquire(PRIORITY_INTERACTIVE, 5)
+        return scheduler.stats()
+
+    stats = asyncio.run(run())
+    assert stats["admitted"] == {"critical": 0, "interactive": 2, "background": 0, "batch": 0}
+    assert stats["timed_out"]["batch"] == 1
+
+
+def test_critical_max_wait_has_its_own_setting(monkeypatch):
+    monkeypatch.setenv("LLM_CRITICAL_MAX_WAIT", "7")
+    monkeypatch.setenv("LLM_INTERACTIVE_MAX_WAIT", "3")
+    try:
+        module = importlib.reload(llm_scheduler)
+        assert module.LLM_MAX_WAIT_SECONDS[PRIORITY_CRITICAL] == 7.0
+        assert module.LLM_MAX_WAIT_SECONDS[PRIORITY_INTERACTIVE] == 3.0
+    finally:
+        monkeypatch.undo()
+        importlib.reload(llm_scheduler)
+
+
+def test_parse_duration():
+    assert parse_duration("7.66s") == pytest.approx(7.66)
+    assert parse_duration("2m59.56s") == pytest.approx(179.56)
+    assert parse_duration("120ms") == pytest.approx(0.12)
+    assert parse_duration("30") == 30.0
+    assert parse_duration("") is None
@@ -0,0 +1,49 @@
+"""
+Tests for the keyset pagination cursors
+Run with: pytest test_pagination.py
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from services.pagination import InvalidCursor, decode_cursor, encode_cursor
+
+
+def test_bug_cursor_round_trip():
+    created_at = datetime(2024, 5, 17, 9, 30, 12, 345678, tzinfo=timezone.utc)
+    cursor = encode_cursor(created_at, 42)
+    assert decode_cursor(cursor, datetime, int) == (created_at, 42)
+
+
+def test_developer_cursor_round_trip():
+    assert decode_cursor(encode_cursor(7), int) == (7,)
+
+
+def test_cursor_is_url_safe_without_padding():
+    cursor = encode_cursor(datetime(2024, 1, 1), 1234567)
+    assert "=" not in cursor
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor!", "e30", encode_cursor("x", 1)[:-3]])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, datetime, int)
+
+
+def test_cursor_from_another_listing_is_rejected():
+    with pytest.raises(InvalidCursor):
+        decode_cursor(encode_cursor(7), datetime, int)
+
+
+def test_cursor_with_wrong_types_is_rejected():
+    with pytest.raises(InvalidCursor):
+        decode_cursor(encode_cursor("yesterday", 1), datetime, int)
+    with pytest.raises(InvalidCursor):
+        decode_cursor(encode_cursor("seven"), int)
+
+
+def test_invalid_cursor_is_a_value_error():
+    # app.py maps it to a 400 response; callers catching ValueError still work
+    assert issubclass(InvalidCursor, ValueError)
@@ -0,0 +1,68 @@
+"""
+Tests for the versioned developer roster cache
+Run with: pytest test_roster_cache.py
+"""
+
+from services.roster_cache import RosterCache
+
+
+def roster():
+    return [
+        {"id": 1, "name": "Ada", "workload": 2},
+        {"id": 2, "name": "Linus", "workload": 0}
+    ]
+
+
+def test_get_serves_cached_roster_until_invalidated():
+    cache = RosterCache(ttl=60)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return roster()
+
+    first = cache.get(loader)
+    assert cache.get(loader) is first
+    cache.invalidate()
+    cache.get(loader)
+    assert len(loads) == 2
+
+
+def test_update_applies_workloads_without_reloading():
+    cache = RosterCache(ttl=60)
+    cached = cache.get(roster)
+    version = cache.version
+
+    cache.update([{"id": 2, "name": "Linus", "workload": 1}, {"id": 9, "name": "Inactive", "workload": 4}])
+
+    def loader():
+        raise AssertionError("roster reloaded")
+
+    updated = cache.get(loader)
+    assert cache.version == version + 1
+    assert [dev["workload"] for dev in updated] == [2, 1]
+    assert [dev["id"] for dev in updated] == [1, 2]
+    # The list handed out earlier is left untouched
+    assert cached[1]["workload"] == 0
+    assert cache.stats()["updates"] == 1
+
+
+def test_update_during_load_keeps_stale_result_out_of_cache():
+    cache = RosterCache(ttl=60)
+    loads = []
+
+    def racing_loader():
+        loads.append(1)
+        if len(loads) == 1:
+            cache.update([{"id": 1, "name": "Ada", "workload": 3}])
+        return roster()
+
+    cache.get(racing_loader)
+    assert cache.get(racing_loader)[0]["workload"] == 2
+    assert len(loads) == 2
+
+
+def test_update_before_first_load_is_harmless():
+    cache = RosterCache(ttl=60)
+    cache.update([{"id": 1, "name": "Ada", "workload": 3}])
+    assert cache.get(roster) == roster()
@@ -0,0 +1,130 @@
+"""
+Tests for single-flight request coalescing
+Run with: pytest test_single_flight.py
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from services.single_flight import SingleFlight
+
+
+class Upstream:
+    """Counts calls and blocks each one until released"""
+
+    def __init__(self, result="done", error=None):
+        self.calls = 0
+        self.result = result
+        self.error = error
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def test_followers_share_the_leaders_result():
+    async def run():
+        flights, upstream = SingleFlight(), Upstream()
+        tasks = [asyncio.create_task(flights.do("key", upstream)) for _ in range(3)]
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return flights, upstream, await asyncio.gather(*tasks)
+
+    flights, upstream, results = asyncio.run(run())
+    assert results == ["done"] * 3
+    assert upstream.calls == 1
+    assert flights.stats()["coalesced"] == 2
+    assert flights.stats()["in_flight"] == 0
+
+
+def test_followers_receive_the_leaders_exception():
+    async def run():
+        flights, upstream = SingleFlight(), Upstream(error=ValueError("upstream failed"))
+        tasks = [asyncio.create_task(flights.do("key", upstream)) for _ in range(3)]
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return upstream, await asyncio.gather(*tasks, return_exceptions=True)
+
+    upstream, results = asyncio.run(run())
+    assert upstream.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_cancelled_leader_hands_the_call_to_a_follower():
+    async def run():
+        flights, upstream = SingleFlight(), Upstream()
+        leader = asyncio.create_task(flights.do("key", upstream))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flights.do("key", upstream)) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        # Let the followers regroup behind a new leader
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return flights, upstream, await asyncio.gather(*followers)
+
+    flights, upstream, results = asyncio.run(run())
+    assert results == ["done", "done"]
+    # The leader's call and one retry by the followers
+    assert upstream.calls == 2
+    assert flights.stats()["upstream_calls"] == 2
+    assert flights.stats()["coalesced"] == 1
+
+
+def test_cancelled_follower_leaves_the_call_running():
+    async def run():
+        flights, upstream = SingleFlight(), Upstream()
+        leader = asyncio.create_task(flights.do("key", upstream))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flights.do("key", upstream))
+        await asyncio.sleep(0)
+        follower.cancel()
+        upstream.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        return await leader
+
+    assert asyncio.run(run()) == "done"
+
+
+def test_do_sync_shares_result_and_exception_across_threads():
+    flights = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def upstream():
+        calls.append(1)
+        started.set()
+        release.wait()
+        raise ValueError("upstream failed")
+
+    errors = []
+
+    def call():
+        try:
+            flights.do_sync("key", upstream)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=call) for _ in range(2)]
+    for thread in followers:
+        thread.start()
+    while flights.coalesced < 2:
+        pass
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(errors) == 3
@@ -0,0 +1,11 @@
+-- Asynchronous Triage Migration
+-- Run this in your Supabase SQL Editor on databases created before the
+-- asynchronous ingestion mode (POST /api/bugs/async)
+
+-- Bugs accepted for background triage are stored with a 'Pending' severity
+ALTER TABLE bugs DROP CONSTRAINT IF EXISTS bugs_severity_check;
+ALTER TABLE bugs ADD CONSTRAINT bugs_severity_check
+    CHECK (severity IN ('Low', 'Medium', 'High', 'Critical', 'Pending'));
+
+-- Lets the pending-bug sweeper find unfinished work without scanning all bugs
+CREATE INDEX IF NOT EXISTS idx_bugs_pending ON bugs(created_at) WHERE severity = 'Pending';
@@ -0,0 +1,19 @@
+-- Developer Workload Migration
+-- Run this in your Supabase SQL Editor on databases created before bugs
+-- stored their assignee's ID and developers.workload was maintained
+
+-- Link existing bugs to their assignee by name (the lowest id when a name is shared)
+UPDATE bugs b
+SET assigned_developer_id = d.id
+FROM (SELECT name, MIN(id) AS id FROM developers GROUP BY name) d
+WHERE b.assigned_developer_id IS NULL
+  AND b.assigned_developer = d.name;
+
+-- Workload = assigned bugs still Open or In Progress
+UPDATE developers d
+SET workload = (
+    SELECT COUNT(*)
+    FROM bugs b
+    WHERE b.assigned_developer_id = d.id
+      AND b.status IN ('Open', 'In Progress')
+);
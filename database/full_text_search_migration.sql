@@ -0,0 +1,18 @@
+-- Full-Text Search Migration
+-- Run this in your Supabase SQL Editor on databases created before ranked
+-- search (GET /api/bugs/search/{term}). Adding the generated column rewrites
+-- the bugs table; run it outside peak hours on large tables.
+
+-- Full-text search document (title weighted above description)
+ALTER TABLE bugs ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_bugs_search_vector ON bugs USING GIN (search_vector);
+
+-- Optional: trigram matching of partial or misspelled title words. Needs the
+-- privilege to create extensions; if these two statements fail, search runs on
+-- full-text matching alone (BUG_SEARCH_TRIGRAM=auto).
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_bugs_title_trgm ON bugs USING GIN (title gin_trgm_ops);
@@ -0,0 +1,8 @@
+-- Keyset Pagination Migration
+-- Run this in your Supabase SQL Editor on databases created before cursor
+-- pagination of GET /api/bugs
+
+-- Bugs are listed newest first with id as tie-breaker; the cursor is the
+-- (created_at, id) of the last bug on a page, so the index needs both columns
+DROP INDEX IF EXISTS idx_bugs_created_at;
+CREATE INDEX idx_bugs_created_at ON bugs(created_at DESC, id DESC);
@@ -1,6 +1,11 @@
 -- AI Bug Classification API - Database Schema
 -- PostgreSQL Database Schema
 
+-- Trigram matching for fuzzy title search. Optional: without the privilege to
+-- create extensions, drop this line and idx_bugs_title_trgm below; search then
+-- uses full-text matching only (BUG_SEARCH_TRIGRAM=auto)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Drop tables if they exist (for clean setup)
 DROP TABLE IF EXISTS predictions_log CASCADE;
 DROP TABLE IF EXISTS bugs CASCADE;
@@ -27,7 +32,7 @@ CREATE TABLE bugs (
     id SERIAL PRIMARY KEY,
     title VARCHAR(255) NOT NULL,
     description TEXT NOT NULL,
-    severity VARCHAR(20) NOT NULL CHECK (severity IN ('Low', 'Medium', 'High', 'Critical')),
+    severity VARCHAR(20) NOT NULL CHECK (severity IN ('Low', 'Medium', 'High', 'Critical', 'Pending')),
     predicted_severity VARCHAR(20) CHECK (predicted_severity IN ('Low', 'Medium', 'High', 'Critical')),
     confidence_score FLOAT CHECK (confidence_score >= 0 AND confidence_score <= 1),
     status VARCHAR(20) DEFAULT 'Open' CHECK (status IN ('Open', 'In Progress', 'Resolved', 'Closed')),
@@ -37,7 +42,12 @@ CREATE TABLE bugs (
     notion_page_id VARCHAR(100),
     jira_issue_key VARCHAR(50),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Full-text search document (title weighted above description)
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
 );
 
 -- ============================================================================
@@ -59,10 +69,13 @@ CREATE TABLE predictions_log (
 CREATE INDEX idx_bugs_severity ON bugs(severity);
 CREATE INDEX idx_bugs_status ON bugs(status);
 CREATE INDEX idx_bugs_source ON bugs(source);
-CREATE INDEX idx_bugs_created_at ON bugs(created_at DESC);
+CREATE INDEX idx_bugs_created_at ON bugs(created_at DESC, id DESC);
 CREATE INDEX idx_bugs_assigned_developer ON bugs(assigned_developer_id);
 CREATE INDEX idx_developers_email ON developers(email);
 CREATE INDEX idx_predictions_bug_id ON predictions_log(bug_id);
+CREATE INDEX idx_bugs_pending ON bugs(created_at) WHERE severity = 'Pending';
+CREATE INDEX idx_bugs_search_vector ON bugs USING GIN (search_vector);
+CREATE INDEX idx_bugs_title_trgm ON bugs USING GIN (title gin_trgm_ops);
 
 -- ============================================================================
 -- Triggers for Updated At
@@ -87,10 +100,10 @@ CREATE TRIGGER update_developers_updated_at BEFORE UPDATE ON developers
 
 -- Insert sample developers
 INSERT INTO developers (name, email, skills, workload) VALUES
-    ('John Doe', 'john.doe@example.com', ARRAY['Python', 'FastAPI', 'PostgreSQL'], 3),
+    ('John Doe', 'john.doe@example.com', ARRAY['Python', 'FastAPI', 'PostgreSQL'], 2),
     ('Jane Smith', 'jane.smith@example.com', ARRAY['React', 'JavaScript', 'CSS'], 2),
     ('Bob Johnson', 'bob.johnson@example.com', ARRAY['Python', 'Machine Learning', 'NLP'], 1),
-    ('Alice Williams', 'alice.williams@example.com', ARRAY['DevOps', 'Docker', 'Kubernetes'], 2);
+    ('Alice Williams', 'alice.williams@example.com', ARRAY['DevOps', 'Docker', 'Kubernetes'], 0);
 
 -- Insert sample bugs
 INSERT INTO bugs (title, description, severity, predicted_severity, confidence_score, status, source, assigned_developer) VALUES
@@ -100,6 +113,11 @@ INSERT INTO bugs (title, description, severity, predicted_severity, confidence_s
     ('Slow API response time', 'API endpoints are taking 5+ seconds to respond during peak hours.', 'Medium', 'Medium', 0.73, 'Open', 'Groq', 'John Doe'),
     ('Security vulnerability in authentication', 'JWT tokens are not being validated properly, allowing unauthorized access.', 'Critical', 'Critical', 0.95, 'In Progress', 'Security Audit', 'Bob Johnson');
 
+-- Link sample bugs to their assignees (workload above = their Open/In Progress bugs)
+UPDATE bugs b SET assigned_developer_id = d.id
+FROM developers d
+WHERE b.assigned_developer = d.name;
+
 -- ============================================================================
 -- Views for Analytics
 -- ============================================================================